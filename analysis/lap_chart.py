@@ -0,0 +1,81 @@
+"""
+Lap chart computation for Race Manager Pro
+
+Builds the entries x laps position matrix of a session (position of every
+entry as it completed every lap, 1 = leader) in one vectorized pass over the
+lap-time matrix, and extends it incrementally as new laps arrive.
+
+Entries are ranked on each lap by the race time at which they completed it,
+so lapped cars fall behind everyone who completed that lap before them.
+Entries that have not (or never) completed a lap have position 0 on it.
+"""
+import numpy as np
+
+
+def position_columns(cumulative):
+    """Positions for each column of an entries x laps cumulative-time matrix (NaN = lap not completed)."""
+    keys = np.where(np.isnan(cumulative), np.inf, cumulative)
+    order = np.argsort(keys, axis=0, kind="stable")
+    positions = np.empty(order.shape, dtype=np.int64)
+    np.put_along_axis(positions, order, np.arange(1, order.shape[0] + 1)[:, None], axis=0)
+    positions[np.isnan(cumulative)] = 0
+    return positions
+
+
+def position_matrix(lap_times):
+    """Entries x laps position matrix from an entries x laps lap-time matrix."""
+    return position_columns(np.cumsum(lap_times, axis=1))
+
+
+class LapChart:
+    """
+    Cumulative times and positions of every entry on every lap, kept up to
+    date incrementally: `update` only recomputes the lap columns that changed.
+    """
+    def __init__(self, lap_times=None):
+        self.num_laps = 0
+        self._cumulative = np.empty((0, 0))
+        self._positions = np.empty((0, 0), dtype=np.int64)
+        if lap_times is not None:
+            self.update(lap_times)
+
+    @property
+    def cumulative(self):
+        return self._cumulative[:, :self.num_laps]
+
+    @property
+    def positions(self):
+        return self._positions[:, :self.num_laps]
+
+    def update(self, lap_times, from_lap=None):
+        """
+        Bring the chart up to date with an entries x laps lap-time matrix.
+
+        Columns before `from_lap` (0-based) are assumed unchanged; by default
+        only laps beyond the ones already charted are computed. Returns the
+        first recomputed column.
+        """
+        entries, laps = lap_times.shape
+        start = self.num_laps if from_lap is None else min(from_lap, self.num_laps)
+        if entries != self._positions.shape[0]:
+            start = 0
+            self._cumulative = np.empty((entries, 0))
+            self._positions = np.empty((entries, 0), dtype=np.int64)
+        self._ensure_capacity(laps)
+        previous = self._cumulative[:, start - 1:start] if start else 0.0
+        self._cumulative[:, start:laps] = previous + np.cumsum(lap_times[:, start:laps], axis=1)
+        self._positions[:, start:laps] = position_columns(self._cumulative[:, start:laps])
+        self.num_laps = laps
+        return start
+
+    def _ensure_capacity(self, laps):
+        capacity = self._positions.shape[1]
+        if laps <= capacity:
+            return
+        capacity = max(laps, capacity * 2)
+        cumulative = np.empty((self._cumulative.shape[0], capacity))
+        cumulative[:, :self.num_laps] = self.cumulative
+        positions = np.empty((self._positions.shape[0], capacity), dtype=np.int64)
+        positions[:, :self.num_laps] = self.positions
+        self._cumulative = cumulative
+        self._positions = positions
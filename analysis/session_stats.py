@@ -0,0 +1,140 @@
+"""
+Derived session statistics for Race Manager Pro
+
+Computes, from an entries x laps lap-time matrix (NaN-padded):
+- per entry: laps completed, total time, best lap, average pace, lap-time
+  standard deviation and a rolling average pace over the last few laps
+- race order: running position, laps down, gap to the leader and interval to
+  the car ahead, both measured at the line on the entry's last completed lap
+  (NaN for entries that stopped while ahead on the road)
+
+Per-entry statistics are cached and only recomputed for entries whose laps
+changed; the order-dependent ones are cheap and recomputed on every update.
+"""
+import numpy as np
+
+ROLLING_WINDOW = 5
+
+
+def rolling_mean(lap_times, window):
+    """Mean of the last `window` laps at every lap (NaN until `window` laps are completed)."""
+    rows, laps = lap_times.shape
+    rolling = np.full((rows, laps), np.nan)
+    if laps < window:
+        return rolling
+    sums = np.cumsum(np.concatenate((np.zeros((rows, 1)), lap_times), axis=1), axis=1)
+    rolling[:, window - 1:] = (sums[:, window:] - sums[:, :-window]) / window
+    return rolling
+
+
+class SessionStats:
+    """
+    Cached statistics of one session. Call `update` with the current lap-time
+    matrix and the rows that changed since the previous call.
+    """
+    def __init__(self, lap_times=None, rolling_window=ROLLING_WINDOW):
+        self.rolling_window = rolling_window
+        self.lap_counts = np.zeros(0, dtype=np.int64)
+        self.total_times = np.zeros(0)
+        self.best_lap = np.zeros(0)
+        self.average_pace = np.zeros(0)
+        self.std_dev = np.zeros(0)
+        self.rolling_pace = np.zeros((0, 0))
+        self.cumulative = np.zeros((0, 0))
+        self.positions = np.zeros(0, dtype=np.int64)
+        self.laps_down = np.zeros(0, dtype=np.int64)
+        self.gap_to_leader = np.zeros(0)
+        self.interval = np.zeros(0)
+        if lap_times is not None:
+            self.update(lap_times)
+
+    def update(self, lap_times, changed_rows=None):
+        """
+        Refresh statistics for an entries x laps lap-time matrix. Only
+        `changed_rows` (all rows when None, or when the shape changed) have
+        their per-entry statistics recomputed.
+        """
+        entries, laps = lap_times.shape
+        if changed_rows is None or entries != len(self.lap_counts):
+            changed_rows = np.arange(entries)
+            self._resize(entries, laps)
+        else:
+            changed_rows = np.asarray(sorted(set(changed_rows)), dtype=np.int64)
+            if laps != self.cumulative.shape[1]:
+                self._resize_laps(laps)
+        if len(changed_rows):
+            self._update_entries(lap_times, changed_rows)
+        self._update_order()
+        return self
+
+    def _resize(self, entries, laps):
+        self.lap_counts = np.zeros(entries, dtype=np.int64)
+        self.total_times = np.zeros(entries)
+        self.best_lap = np.full(entries, np.nan)
+        self.average_pace = np.full(entries, np.nan)
+        self.std_dev = np.full(entries, np.nan)
+        self.rolling_pace = np.full((entries, laps), np.nan)
+        self.cumulative = np.full((entries, laps), np.nan)
+
+    def _resize_laps(self, laps):
+        def resized(matrix):
+            grown = np.full((matrix.shape[0], laps), np.nan)
+            keep = min(laps, matrix.shape[1])
+            grown[:, :keep] = matrix[:, :keep]
+            return grown
+        self.rolling_pace = resized(self.rolling_pace)
+        self.cumulative = resized(self.cumulative)
+
+    def _update_entries(self, lap_times, rows):
+        block = lap_times[rows]
+        completed = ~np.isnan(block)
+        counts = completed.sum(axis=1)
+        has_laps = counts > 0
+        safe = np.where(completed, block, 0.0)
+        self.lap_counts[rows] = counts
+        self.total_times[rows] = safe.sum(axis=1)
+        mean = np.divide(safe.sum(axis=1), counts, out=np.full(len(rows), np.nan), where=has_laps)
+        variance = np.divide(np.where(completed, (block - mean[:, None]) ** 2, 0.0).sum(axis=1), counts,
+                             out=np.full(len(rows), np.nan), where=has_laps)
+        self.best_lap[rows] = np.where(has_laps, np.where(completed, block, np.inf).min(axis=1, initial=np.inf), np.nan)
+        self.average_pace[rows] = mean
+        self.std_dev[rows] = np.sqrt(variance)
+        self.cumulative[rows] = np.cumsum(block, axis=1)
+        self.rolling_pace[rows] = rolling_mean(block, self.rolling_window)
+
+    def _update_order(self):
+        entries = len(self.lap_counts)
+        order = np.lexsort((self.total_times, -self.lap_counts))
+        self.positions = np.empty(entries, dtype=np.int64)
+        self.positions[order] = np.arange(1, entries + 1)
+        self.gap_to_leader = np.full(entries, np.nan)
+        self.interval = np.full(entries, np.nan)
+        self.laps_down = np.zeros(entries, dtype=np.int64)
+        if not entries or not self.lap_counts[order[0]]:
+            return
+        # Compare each entry with the leader / car ahead at the line on the entry's last lap
+        last_lap = self.lap_counts[order] - 1
+        valid = last_lap >= 0
+        own = np.where(valid, self.cumulative[order, np.maximum(last_lap, 0)], np.nan)
+        leader = self.cumulative[order[0], np.maximum(last_lap, 0)]
+        ahead = np.concatenate(([np.nan], self.cumulative[order[:-1], np.maximum(last_lap[1:], 0)]))
+        gap = own - leader
+        interval = own - ahead
+        # Negative only for entries that stopped (e.g. retired) while ahead on the road
+        self.gap_to_leader[order] = np.where(valid & (gap >= 0), gap, np.nan)
+        self.interval[order] = np.where(valid & (interval >= 0), interval, np.nan)
+        self.laps_down[order] = self.lap_counts[order[0]] - self.lap_counts[order]
+
+    def entry(self, row):
+        """Statistics of one entry as a plain dict."""
+        return {
+            "position": int(self.positions[row]),
+            "laps": int(self.lap_counts[row]),
+            "total_time": float(self.total_times[row]),
+            "best_lap": float(self.best_lap[row]),
+            "average_pace": float(self.average_pace[row]),
+            "std_dev": float(self.std_dev[row]),
+            "laps_down": int(self.laps_down[row]),
+            "gap_to_leader": float(self.gap_to_leader[row]),
+            "interval": float(self.interval[row]),
+        }
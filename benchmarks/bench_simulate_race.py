@@ -0,0 +1,60 @@
+"""
+Benchmark: loop engine vs NumPy engine for a single race simulation.
+
+Run from the project root:
+    python -m benchmarks.bench_simulate_race --cars 40 --laps 500
+"""
+import argparse
+import random
+import timeit
+
+from sim.simple_race_sim import simulate_race, simulate_race_arrays, simulate_race_vectorized
+
+
+def make_session(num_cars, laps):
+    """Build a synthetic session definition with `num_cars` entries."""
+    rnd = random.Random(num_cars * 100003 + laps)
+    return {
+        "track": {"name": "Benchmark Oval", "length_km": 2.0, "laps": laps},
+        "cars": [
+            {"car_id": f"car{i}", "model": "Spec Racer", "power": 300, "weight": 1200}
+            for i in range(1, num_cars + 1)
+        ],
+        "drivers": [
+            {"driver_id": f"drv{i}", "name": f"Driver {i}", "skill": round(rnd.uniform(0.80, 0.99), 3)}
+            for i in range(1, num_cars + 1)
+        ],
+        "entries": [
+            {"entry_id": f"e{i}", "car_id": f"car{i}", "driver_id": f"drv{i}"}
+            for i in range(1, num_cars + 1)
+        ],
+    }
+
+
+def best_time(func, repeat, number):
+    """Best per-call time in seconds over `repeat` rounds of `number` calls."""
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare race simulation engines.")
+    parser.add_argument("--cars", type=int, default=40)
+    parser.add_argument("--laps", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    session = make_session(args.cars, args.laps)
+    loop = best_time(lambda: simulate_race(session), args.repeat, args.number)
+    vectorized = best_time(lambda: simulate_race_vectorized(session, 0), args.repeat, args.number)
+    arrays = best_time(lambda: simulate_race_arrays(session, 0), args.repeat, args.number)
+
+    print(f"{args.cars} cars x {args.laps} laps")
+    print(f"  loop engine:  {loop * 1000:9.2f} ms")
+    print(f"  numpy engine: {vectorized * 1000:9.2f} ms")
+    print(f"  numpy arrays: {arrays * 1000:9.2f} ms  (no results JSON)")
+    print(f"  speedup:      {loop / vectorized:9.1f}x  ({loop / arrays:.1f}x without results JSON)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""
+Headless benchmark suite for Race Manager Pro
+
+Times the simulation engines, session loading and UI hot paths over a grid
+of field sizes and layout depths, writes the results as JSON and compares
+them with a stored baseline:
+
+- sim.simple_race_sim: simulate_race (loop engine) and simulate_race_vectorized
+- session loading: json.load of a results file and a cold SessionStore.get
+- SessionSummaryPanel.update_summary (stats computed from scratch)
+- DividerContainer._split of the leaf of a nested layout
+- sim.telemetry: 100 Hz telemetry synthesis streamed to disk (10 laps)
+
+Qt runs on the `offscreen` platform unless QT_QPA_PLATFORM is already set.
+A case is a regression when its best time exceeds the baseline's by more than
+the threshold (default 25%); the exit status is 1 if any case regressed.
+
+Run from the project root:
+    python -m benchmarks.suite --save-baseline
+    python -m benchmarks.suite --compare
+    python -m benchmarks.suite --quick --filter simulate --threshold 0.5
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.bench_simulate_race import make_session
+
+BENCHMARKS_DIR = Path(__file__).parent
+RESULTS_FILE = BENCHMARKS_DIR / "results" / "latest.json"
+BASELINE_FILE = BENCHMARKS_DIR / "baseline.json"
+DEFAULT_THRESHOLD = 0.25
+
+FIELD_SIZES = [4, 20, 100]
+LAP_COUNTS = [10, 100, 1000]
+LAYOUT_DEPTHS = [1, 4, 16]
+TELEMETRY_LAPS = 10  # 100 Hz telemetry grows with race time; keep the files small
+# --quick: corners of the grid only
+QUICK_FIELD_SIZES = [4, 100]
+QUICK_LAP_COUNTS = [10, 1000]
+QUICK_LAYOUT_DEPTHS = [1, 16]
+
+
+def case_key(name, params):
+    return f"{name}[{','.join(f'{key}={value}' for key, value in params.items())}]"
+
+
+def time_case(setup, func, repeat, budget):
+    """
+    Per-call times (seconds) of func(setup()) with setup excluded. Runs at
+    least `repeat` times, and keeps going while under `budget` seconds (up to
+    10 x repeat) so that fast cases get a stable minimum.
+    """
+    times = []
+    started = time.perf_counter()
+    while len(times) < repeat or (time.perf_counter() - started < budget and len(times) < 10 * repeat):
+        state = setup()
+        start = time.perf_counter()
+        func(state)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+# --- Cases ---
+#
+# Each case builder takes its parameters and returns (setup, func); setup()
+# runs untimed before every call of func(state).
+
+def simulate_loop_case(cars, laps):
+    from sim.simple_race_sim import simulate_race
+    session = make_session(cars, laps)
+    return (lambda: session), simulate_race
+
+
+def simulate_vectorized_case(cars, laps):
+    from sim.simple_race_sim import simulate_race_vectorized
+    session = make_session(cars, laps)
+    return (lambda: session), (lambda state: simulate_race_vectorized(state, 0))
+
+
+def _results_file(cars, laps, workdir):
+    from sim.simple_race_sim import simulate_race_vectorized
+    path = Path(workdir) / f"results_{cars}x{laps}.json"
+    if not path.exists():
+        with open(path, "w") as f:
+            json.dump(simulate_race_vectorized(make_session(cars, laps), 0), f)
+    return path
+
+
+def json_load_case(cars, laps, workdir):
+    from storage.session_cache import parse_session
+    path = _results_file(cars, laps, workdir)
+    return (lambda: path), parse_session
+
+
+def session_store_case(cars, laps, workdir):
+    from storage.session_cache import SessionStore
+    path = _results_file(cars, laps, workdir)
+    return (lambda: SessionStore()), (lambda store: store.get(path))
+
+
+def update_summary_case(cars, laps, workdir):
+    from ui.widgets.session_summary_panel import SessionSummaryPanel
+    from storage.session_cache import parse_session
+    data = parse_session(_results_file(cars, laps, workdir))
+    panel = SessionSummaryPanel()
+    return (lambda: data), panel.update_summary
+
+
+def divider_split_case(depth):
+    from PySide6.QtWidgets import QSplitter
+    from PySide6.QtCore import Qt
+    from ui.widgets.divider_container import DividerContainer
+    from ui.widgets.test_panel import TestPanel
+
+    def setup():
+        # root -> splitter -> divider, `depth` times, with a panel in the leaf
+        root = DividerContainer()
+        divider = root
+        for level in range(depth):
+            splitter = QSplitter(Qt.Horizontal if level % 2 else Qt.Vertical)
+            child = DividerContainer()
+            splitter.addWidget(child)
+            splitter.addWidget(DividerContainer())
+            divider.splitter.addWidget(splitter)
+            divider.children_widgets.append(splitter)
+            divider = child
+        divider.add_panel(TestPanel())
+        divider._root = root  # keep the tree alive while timed
+        return divider
+
+    return setup, (lambda leaf: leaf._split('horizontal'))
+
+
+def telemetry_case(cars, workdir):
+    from sim.simple_race_sim import simulate_race_arrays
+    from sim.telemetry import write_race_telemetry
+    session = make_session(cars, TELEMETRY_LAPS)
+    arrays = simulate_race_arrays(session, 0)
+    path = Path(workdir) / f"telemetry_{cars}"
+    return (lambda: arrays), (lambda state: write_race_telemetry(state, session["track"], path, 0))
+
+
+def build_cases(quick=False, workdir=None):
+    """(name, params, builder) for every case in the grid."""
+    fields = QUICK_FIELD_SIZES if quick else FIELD_SIZES
+    lap_counts = QUICK_LAP_COUNTS if quick else LAP_COUNTS
+    depths = QUICK_LAYOUT_DEPTHS if quick else LAYOUT_DEPTHS
+    cases = []
+    for cars in fields:
+        for laps in lap_counts:
+            params = {"cars": cars, "laps": laps}
+            cases.append(("simulate_race", params, lambda c=cars, l=laps: simulate_loop_case(c, l)))
+            cases.append(("simulate_race_vectorized", params,
+                          lambda c=cars, l=laps: simulate_vectorized_case(c, l)))
+            cases.append(("session_json_load", params, lambda c=cars, l=laps: json_load_case(c, l, workdir)))
+            cases.append(("session_store_get", params, lambda c=cars, l=laps: session_store_case(c, l, workdir)))
+            cases.append(("update_summary", params, lambda c=cars, l=laps: update_summary_case(c, l, workdir)))
+    for cars in fields:
+        cases.append(("synthesize_telemetry", {"cars": cars, "laps": TELEMETRY_LAPS},
+                      lambda c=cars: telemetry_case(c, workdir)))
+    for depth in depths:
+        cases.append(("divider_split", {"depth": depth}, lambda d=depth: divider_split_case(d)))
+    return cases
+
+
+def run_suite(cases, repeat=5, budget=0.5, log=print):
+    results = []
+    for name, params, builder in cases:
+        setup, func = builder()
+        times = time_case(setup, func, repeat, budget)
+        result = {
+            "key": case_key(name, params),
+            "name": name,
+            "params": params,
+            "runs": len(times),
+            "best_s": min(times),
+            "median_s": statistics.median(times),
+        }
+        results.append(result)
+        log(f"{result['key']:<55} best {result['best_s'] * 1000:10.3f} ms  "
+            f"median {result['median_s'] * 1000:10.3f} ms  ({result['runs']} runs)")
+    return results
+
+
+def environment():
+    import numpy
+    import PySide6
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "pyside6": PySide6.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "qpa": os.environ.get("QT_QPA_PLATFORM"),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Rows of (key, baseline_best, best, ratio, status) for cases in both runs;
+    status is "REGRESSION", "improved" or "ok".
+    """
+    previous = {result["key"]: result for result in baseline["results"]}
+    rows = []
+    for result in results:
+        old = previous.get(result["key"])
+        if old is None:
+            continue
+        ratio = result["best_s"] / old["best_s"] if old["best_s"] else float("inf")
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+        elif ratio < 1 / (1 + threshold):
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append((result["key"], old["best_s"], result["best_s"], ratio, status))
+    return rows
+
+
+def write_json(path, document):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the headless benchmark suite.")
+    parser.add_argument("--quick", action="store_true", help="Only the corners of the parameter grid")
+    parser.add_argument("--filter", default=None, help="Only cases whose key contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="Minimum timed runs per case")
+    parser.add_argument("--budget", type=float, default=0.5,
+                        help="Seconds per case to keep sampling fast cases")
+    parser.add_argument("--output", type=Path, default=RESULTS_FILE, help="Where to write the results JSON")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline results JSON")
+    parser.add_argument("--compare", action="store_true", help="Compare with the baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="Also write the results as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown before a case counts as a regression (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    with tempfile.TemporaryDirectory(prefix="rmp-bench-") as workdir:
+        cases = [case for case in build_cases(args.quick, workdir)
+                 if args.filter is None or args.filter in case_key(case[0], case[1])]
+        results = run_suite(cases, args.repeat, args.budget)
+
+    document = {"environment": environment(), "results": results}
+    write_json(args.output, document)
+    print(f"Results written to {args.output}")
+    if args.save_baseline:
+        write_json(args.baseline, document)
+        print(f"Baseline written to {args.baseline}")
+
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"No baseline at {args.baseline}; run with --save-baseline first")
+            return 2
+        with open(args.baseline) as f:
+            rows = compare(results, json.load(f), args.threshold)
+        print(f"\n{'case':<55} {'baseline ms':>12} {'now ms':>10} {'ratio':>7}")
+        for key, old, new, ratio, status in rows:
+            print(f"{key:<55} {old * 1000:12.3f} {new * 1000:10.3f} {ratio:7.2f}  {status}")
+        regressions = [row for row in rows if row[4] == "REGRESSION"]
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%} in {len(rows)} compared case(s)")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
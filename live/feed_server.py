@@ -0,0 +1,112 @@
+"""
+Local stand-in live timing feed for Race Manager Pro
+
+Replays a saved session from `data/sessions/` as live timing messages (see
+`live/protocol.py`) so the ingestion pipeline can be exercised offline:
+- TCP: serves every client that connects, newline-delimited JSON
+- UDP: sends datagrams to one target address
+
+Pacing follows the race clock scaled by `--speed`, optionally capped at
+`--rate` messages per second; `--speed 0` sends as fast as possible.
+
+Run from the project root:
+    python -m live.feed_server --tcp 127.0.0.1:9100 --speed 20
+    python -m live.feed_server --udp 127.0.0.1:9101 --rate 500
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+
+from live.protocol import encode, session_messages
+
+logger = logging.getLogger("FeedServer")
+
+DEFAULT_SESSION = Path(__file__).parent.parent / "data" / "sessions" / "20250702_181847_simple_oval_results.json"
+
+
+def load_messages(path):
+    with open(path, "r") as f:
+        return list(session_messages(json.load(f)))
+
+
+async def pace(messages, speed=1.0, rate=None):
+    """Yield messages at race-clock pace scaled by `speed`, at most `rate` per second."""
+    start = time.monotonic()
+    min_interval = 1.0 / rate if rate else 0.0
+    for index, message in enumerate(messages):
+        # Absolute schedule: messages that fell behind are sent without sleeping
+        due = start + max(message["race_time"] / speed if speed else 0.0, index * min_interval)
+        delay = due - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        elif index % 256 == 0:
+            await asyncio.sleep(0)
+        yield message
+
+
+async def serve_tcp(messages, host, port, speed=1.0, rate=None, ready=None):
+    """Replay the feed to each TCP client that connects, until cancelled."""
+    async def handle(reader, writer):
+        peer = writer.get_extra_info("peername")
+        logger.info(f"Feed client connected: {peer}")
+        try:
+            async for message in pace(messages, speed, rate):
+                writer.write(encode(message))
+                await writer.drain()
+        except ConnectionError:
+            logger.info(f"Feed client disconnected: {peer}")
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    if ready is not None:
+        ready(server.sockets[0].getsockname())
+    async with server:
+        await server.serve_forever()
+
+
+async def send_udp(messages, host, port, speed=1.0, rate=None):
+    """Replay the feed once as UDP datagrams to (host, port)."""
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(asyncio.DatagramProtocol, remote_addr=(host, port))
+    try:
+        async for message in pace(messages, speed, rate):
+            transport.sendto(encode(message))
+    finally:
+        transport.close()
+
+
+def parse_address(text):
+    host, _, port = text.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a saved session as a live timing feed.")
+    parser.add_argument("--session", type=Path, default=DEFAULT_SESSION, help="Results JSON to replay")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--tcp", metavar="HOST:PORT", help="Serve TCP clients on this address")
+    target.add_argument("--udp", metavar="HOST:PORT", help="Send UDP datagrams to this address")
+    parser.add_argument("--speed", type=float, default=1.0, help="Race clock multiplier (0 = unpaced)")
+    parser.add_argument("--rate", type=float, default=None, help="Maximum messages per second")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+    messages = load_messages(args.session)
+    try:
+        if args.tcp:
+            host, port = parse_address(args.tcp)
+            asyncio.run(serve_tcp(messages, host, port, args.speed, args.rate,
+                                  ready=lambda addr: logger.info(f"Serving feed on {addr[0]}:{addr[1]}")))
+        else:
+            host, port = parse_address(args.udp)
+            asyncio.run(send_udp(messages, host, port, args.speed, args.rate))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Live timing ingestion for Race Manager Pro
+
+`LiveIngest` runs an asyncio event loop on a background thread. It reads
+timing and telemetry messages from TCP streams or UDP sockets, decodes them
+off the GUI thread and hands them on in coalesced batches: at most one batch
+per `batch_interval` seconds (or sooner once `max_batch` messages are
+waiting), so downstream consumers see a bounded update rate whatever the
+message rate of the feed.
+
+`on_batch` is called on the ingestion thread; GUI code should forward it
+through a Qt signal (see `ui/core/live_feed.py`).
+"""
+import asyncio
+import logging
+import threading
+
+from live.protocol import decode
+
+logger = logging.getLogger("LiveIngest")
+
+BATCH_INTERVAL = 0.05  # seconds
+MAX_BATCH = 2000
+
+
+class _DatagramReceiver(asyncio.DatagramProtocol):
+    def __init__(self, ingest):
+        self.ingest = ingest
+
+    def datagram_received(self, data, addr):
+        self.ingest._receive(data)
+
+
+class LiveIngest:
+    def __init__(self, on_batch, batch_interval=BATCH_INTERVAL, max_batch=MAX_BATCH):
+        self.on_batch = on_batch
+        self.batch_interval = batch_interval
+        self.max_batch = max_batch
+        self.received = 0
+        self.dropped = 0
+        self._pending = []
+        self._loop = None
+        self._thread = None
+        self._wakeup = None
+        self._sources = []
+        self._readers = set()  # running _read_tcp tasks
+
+    # --- Lifecycle (called from any thread) ---
+
+    def start(self):
+        if self._thread is not None:
+            return
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ready,), name="LiveIngest", daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def stop(self):
+        """Close every source, deliver what is pending and stop the loop thread."""
+        if self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+
+    def connect_tcp(self, host, port):
+        """Read newline-delimited messages from a TCP feed. Returns a concurrent future."""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(self._read_tcp(host, port), self._loop)
+
+    def listen_udp(self, host, port):
+        """Receive datagram messages on (host, port). The future resolves to the bound address."""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(self._listen_udp(host, port), self._loop)
+
+    # --- Loop thread ---
+
+    def _run(self, ready):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._wakeup = asyncio.Event()
+        self._flusher = self._loop.create_task(self._flush_periodically())
+        ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    async def _read_tcp(self, host, port):
+        task = asyncio.current_task()
+        self._readers.add(task)
+        task.add_done_callback(self._readers.discard)
+        reader, writer = await asyncio.open_connection(host, port)
+        self._sources.append(writer)
+        logger.info(f"Connected to live feed {host}:{port}")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self._receive(line)
+        finally:
+            writer.close()
+            if writer in self._sources:
+                self._sources.remove(writer)
+            logger.info(f"Live feed {host}:{port} closed")
+            self._flush()
+
+    async def _listen_udp(self, host, port):
+        transport, _ = await self._loop.create_datagram_endpoint(
+            lambda: _DatagramReceiver(self), local_addr=(host, port)
+        )
+        self._sources.append(transport)
+        address = transport.get_extra_info("sockname")
+        logger.info(f"Listening for live feed datagrams on {address[0]}:{address[1]}")
+        return address
+
+    def _receive(self, data):
+        self.received += 1
+        try:
+            self._pending.append(decode(data))
+        except ValueError as exc:
+            self.dropped += 1
+            logger.debug(f"Dropped live message: {exc}")
+            return
+        if len(self._pending) >= self.max_batch:
+            self._wakeup.set()
+
+    async def _flush_periodically(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.batch_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        try:
+            self.on_batch(batch)
+        except Exception:
+            logger.exception("Live batch consumer failed")
+
+    async def _shutdown(self):
+        for source in self._sources:
+            source.close()
+        self._sources.clear()
+        tasks = [self._flusher, *self._readers]
+        for task in tasks:
+            task.cancel()
+        # Let the cancellations finish (readers flush what they read on the
+        # way out) so the loop closes with no pending task
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._flush()
@@ -0,0 +1,55 @@
+"""
+Live timing message protocol for Race Manager Pro
+
+Messages are JSON objects, newline-delimited over TCP and one per datagram
+over UDP. Every message has a `type`:
+- `session`: {"track": {...}, "entries": [{"entry_id", "driver", "car"}, ...]}
+- `lap`: {"entry_id", "lap", "lap_time", "race_time"}
+- `status`: {"entry_id", "status"} (active, finished, retired, dnf)
+- `telemetry`: {"entry_id", "samples": [{"timestamp", "speed", ...}, ...]}
+- `end`: no fields; the feed has finished
+"""
+import json
+
+MESSAGE_TYPES = ("session", "lap", "status", "telemetry", "end")
+
+
+def encode(message):
+    """One message as newline-terminated UTF-8 JSON."""
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def decode(data):
+    """Parse one encoded message; raises ValueError for malformed or unknown messages."""
+    message = json.loads(data)
+    if not isinstance(message, dict) or message.get("type") not in MESSAGE_TYPES:
+        raise ValueError(f"unknown live timing message: {data[:80]!r}")
+    return message
+
+
+def session_messages(results):
+    """
+    Messages replaying a results JSON structure: the session header, every
+    lap in the order the laps were completed, statuses and an end marker.
+    Each message carries `race_time`, the race clock when it happens.
+    """
+    rows = results["results"]
+    entries = [
+        {"entry_id": row.get("entry_id", row["car"]["car_id"]), "driver": row["driver"], "car": row["car"]}
+        for row in rows
+    ]
+    yield {"type": "session", "track": results["track"], "entries": entries, "race_time": 0.0}
+    laps = []
+    for entry, row in zip(entries, rows):
+        race_time = 0.0
+        for lap in row["laps"]:
+            race_time += lap["lap_time"]
+            laps.append((race_time, entry["entry_id"], lap["lap"], lap["lap_time"]))
+    laps.sort()
+    finished = {}
+    for race_time, entry_id, lap_num, lap_time in laps:
+        yield {"type": "lap", "entry_id": entry_id, "lap": lap_num, "lap_time": lap_time, "race_time": race_time}
+        finished[entry_id] = race_time
+    for entry_id, race_time in sorted(finished.items(), key=lambda item: item[1]):
+        yield {"type": "status", "entry_id": entry_id, "status": "finished", "race_time": race_time}
+    yield {"type": "end", "race_time": laps[-1][0] if laps else 0.0}
@@ -0,0 +1,140 @@
+"""
+Session replay for Race Manager Pro
+
+`ReplayIndex` builds a cumulative-time index over every entry's laps so the
+state of a finished session at any race time is a binary search away:
+- `laps_completed_at(t)`: laps each entry had completed at race time t,
+  one `searchsorted` per entry over its cumulative times
+- `events_between(t0, t1)`: laps completed in (t0, t1], sliced from one
+  time-sorted event array
+
+`ReplayClock` turns wall-clock time into race time at a chosen speed, so a
+driver (see `ui/core/replay_controller.py`) can play a session at 1x-100x and
+seek anywhere without replaying from the start. Telemetry, when the session
+has a `telemetry/` store, is sliced by time window from the same clock.
+"""
+import time
+from pathlib import Path
+
+import numpy as np
+
+from storage.columnar_session import entry_id_for, lap_time_matrix, load_columnar
+from storage.session_cache import SESSION_STORE
+from storage.telemetry_store import TelemetryStore, telemetry_dir
+
+MIN_SPEED = 1.0
+MAX_SPEED = 100.0
+
+
+def open_replay_session(path):
+    """
+    Results and telemetry (a TelemetryStore, or None) of a results JSON file
+    or columnar session directory, ready for a ReplayIndex.
+    """
+    path = Path(path)
+    if path.is_dir():
+        results = load_columnar(path).to_results()
+    else:
+        results = SESSION_STORE.get(path)
+    telemetry = TelemetryStore(path) if telemetry_dir(path).is_dir() else None
+    return results, telemetry
+
+
+class ReplayIndex:
+    def __init__(self, results, telemetry=None):
+        rows = results["results"]
+        self.track = results["track"]
+        self.entries = [
+            {"entry_id": entry_id_for(row), "driver": row["driver"], "car": row["car"]}
+            for row in rows
+        ]
+        self.lap_times = lap_time_matrix(results)
+        self.lap_counts = np.array([len(row["laps"]) for row in rows], dtype=np.int64)
+        self.cumulative = np.cumsum(self.lap_times, axis=1)
+        # Flattened, time-sorted lap events for range queries
+        completed = ~np.isnan(self.cumulative)
+        rows_idx, laps_idx = np.nonzero(completed)
+        times = self.cumulative[completed]
+        order = np.argsort(times, kind="stable")
+        self.event_times = times[order]
+        self.event_rows = rows_idx[order]
+        self.event_laps = laps_idx[order] + 1
+        self.duration = float(self.event_times[-1]) if len(self.event_times) else 0.0
+        self.telemetry = telemetry
+
+    def laps_completed_at(self, race_time):
+        """Laps completed by each entry at `race_time`."""
+        return np.array([
+            np.searchsorted(self.cumulative[row, :count], race_time, side="right")
+            for row, count in enumerate(self.lap_counts.tolist())
+        ], dtype=np.int64)
+
+    def events_between(self, start_time, end_time):
+        """(rows, laps, lap_times, race_times) of laps completed in (start_time, end_time]."""
+        lo = np.searchsorted(self.event_times, start_time, side="right")
+        hi = np.searchsorted(self.event_times, end_time, side="right")
+        rows = self.event_rows[lo:hi]
+        laps = self.event_laps[lo:hi]
+        return rows, laps, self.lap_times[rows, laps - 1], self.event_times[lo:hi]
+
+    def telemetry_between(self, start_time, end_time):
+        """{entry_id: records} telemetry slices for [start_time, end_time), if the session has telemetry."""
+        if self.telemetry is None:
+            return {}
+        slices = {}
+        for entry in self.entries:
+            try:
+                records = self.telemetry.window(entry["entry_id"], start_time, end_time)
+            except KeyError:
+                continue
+            if len(records):
+                slices[entry["entry_id"]] = records
+        return slices
+
+
+class ReplayClock:
+    """Race clock that runs at `speed` x wall-clock time while playing."""
+    def __init__(self, duration, speed=1.0, now=time.monotonic):
+        self.duration = duration
+        self._now = now
+        self._speed = self._clamp(speed)
+        self._race_time = 0.0
+        self._started_at = None
+
+    @staticmethod
+    def _clamp(speed):
+        return min(max(float(speed), MIN_SPEED), MAX_SPEED)
+
+    @property
+    def playing(self):
+        return self._started_at is not None
+
+    @property
+    def speed(self):
+        return self._speed
+
+    @speed.setter
+    def speed(self, speed):
+        self._race_time = self.race_time()
+        if self.playing:
+            self._started_at = self._now()
+        self._speed = self._clamp(speed)
+
+    def race_time(self):
+        if not self.playing:
+            return self._race_time
+        elapsed = (self._now() - self._started_at) * self._speed
+        return min(self._race_time + elapsed, self.duration)
+
+    def play(self):
+        if not self.playing:
+            self._started_at = self._now()
+
+    def pause(self):
+        self._race_time = self.race_time()
+        self._started_at = None
+
+    def seek(self, race_time):
+        self._race_time = min(max(float(race_time), 0.0), self.duration)
+        if self.playing:
+            self._started_at = self._now()
@@ -2,51 +2,114 @@ import sys
 import logging
 import os
 import faulthandler
-# Set Qt debug environment variables for more verbose output BEFORE any PySide6 import
-os.environ["QT_DEBUG_PLUGINS"] = "1"
-os.environ["QT_LOGGING_RULES"] = "qt.*=true"
-os.environ["QT_LOGGING_FILE"] = os.path.join(os.path.dirname(__file__), 'race_manager.log')
-from PySide6.QtWidgets import QApplication
-from ui.core.base_window import BaseWindow
-from ui.views.blank_dashboard import BlankDashboard
-
-# Configure logging
+import argparse
+from ui.core.profiling import PROFILER
+
 logfile = os.path.join(os.path.dirname(__file__), 'race_manager.log')
-logging.basicConfig(
-    level=logging.INFO,  # Default to INFO for less noise; change to DEBUG for deep troubleshooting
-    format='%(asctime)s %(levelname)s %(name)s: %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(logfile, mode='w', encoding='utf-8')
-    ]
-)
-# Direct Qt logging to the same logfile (redundant but safe)
-os.environ["QT_LOGGING_FILE"] = logfile
-# Silence noisy third-party loggers
-logging.getLogger('matplotlib').setLevel(logging.WARNING)
-# Set Qt and PySide6 loggers to INFO for more visibility
-logging.getLogger('qt').setLevel(logging.INFO)
-logging.getLogger('PySide6').setLevel(logging.INFO)
-# Set your own modules to DEBUG if needed
-logging.getLogger('main').setLevel(logging.INFO)
-logging.getLogger('DividerContainer').setLevel(logging.INFO)
+
+# Launch profiles: "debug" turns on verbose Qt plugin/category logging and INFO
+# application logging; "production" leaves Qt logging at its defaults and only
+# logs warnings, skipping the per-plugin and per-category debug output.
+LAUNCH_PROFILES = ("debug", "production")
+DEFAULT_LAUNCH_PROFILE = "debug"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Race Manager Pro")
+    parser.add_argument("--profile", choices=LAUNCH_PROFILES,
+                        default=os.environ.get("RACE_MANAGER_PROFILE", DEFAULT_LAUNCH_PROFILE),
+                        help="Launch profile (default: $RACE_MANAGER_PROFILE or debug)")
+    parser.add_argument("--startup-report", metavar="PATH", default=None,
+                        help="Time imports, QApplication/BaseWindow creation and panel constructors "
+                             "and write the report to PATH (.json for JSON, otherwise text)")
+    parser.add_argument("--replay", metavar="SESSION", default=None,
+                        help="Replay a saved session (results JSON or .session directory) into the panels")
+    parser.add_argument("--replay-speed", type=float, default=1.0, help="Replay speed, 1-100 (default: 1)")
+    parser.add_argument("--hibernate-after", type=float, metavar="SECONDS", default=None,
+                        help="Release the panels of tabs not viewed for this long (default: 600; 0 disables)")
+    # Qt handles its own command line options (-style, -platform, ...)
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
+def configure_qt_environment(profile):
+    # Must run BEFORE any PySide6 import
+    if profile == "debug":
+        os.environ["QT_DEBUG_PLUGINS"] = "1"
+        os.environ["QT_LOGGING_RULES"] = "qt.*=true"
+    # Direct Qt logging to the same logfile (redundant but safe)
+    os.environ["QT_LOGGING_FILE"] = logfile
+
+
+def configure_logging(profile=DEFAULT_LAUNCH_PROFILE):
+    # Configured from main() rather than at import: simulation worker processes
+    # re-import this module and must not truncate the log file
+    level = logging.INFO if profile == "debug" else logging.WARNING
+    logging.basicConfig(
+        level=level,  # INFO in the debug profile; set DEBUG here for deep troubleshooting
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler(logfile, mode='w', encoding='utf-8')
+        ]
+    )
+    # Silence noisy third-party loggers
+    logging.getLogger('matplotlib').setLevel(logging.WARNING)
+    # Set Qt and PySide6 loggers to INFO for more visibility
+    logging.getLogger('qt').setLevel(level)
+    logging.getLogger('PySide6').setLevel(level)
+    # Set your own modules to DEBUG if needed
+    logging.getLogger('main').setLevel(level)
+    logging.getLogger('DividerContainer').setLevel(level)
+
 
 logger = logging.getLogger("main")
 
 
 def main():
+    args = parse_args()
+    if args.startup_report:
+        PROFILER.enable()
     # Enable faulthandler for segfault tracebacks
     faulthandler.enable()
+    configure_qt_environment(args.profile)
+    configure_logging(args.profile)
+
+    with PROFILER.section("import PySide6.QtWidgets"):
+        from PySide6.QtWidgets import QApplication
+        from PySide6.QtCore import QTimer
+    with PROFILER.section("import ui"):
+        from ui.core.base_window import BaseWindow
+        from ui.views.blank_dashboard import BlankDashboard
+
     logger.info("Starting QApplication...")
-    app = QApplication(sys.argv)
+    with PROFILER.section("create QApplication"):
+        app = QApplication(sys.argv)
+    PROFILER.mark("QApplication created")
 
-    window = BaseWindow()
-    window.add_tab(BlankDashboard(), "Blank Dashboard")
-    window.show()
+    with PROFILER.section("construct BaseWindow"):
+        if args.hibernate_after is None:
+            window = BaseWindow()
+        else:
+            window = BaseWindow(hibernate_after=args.hibernate_after)
+    with PROFILER.section("add initial dashboard"):
+        window.add_tab(BlankDashboard(), "Blank Dashboard")
+    with PROFILER.section("show window"):
+        window.show()
+    PROFILER.mark("window shown")
+    if args.replay is not None:
+        window.start_replay(args.replay, args.replay_speed)
     logger.info("Window shown, entering event loop...")
 
+    if args.startup_report:
+        def write_startup_report():
+            PROFILER.mark("event loop running")
+            PROFILER.dump(args.startup_report)
+            print(f"Startup report written to {args.startup_report}")
+        QTimer.singleShot(0, write_startup_report)
+
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,210 @@
+"""
+Championship simulation for Race Manager Pro
+
+- A championship is an ordered list of event session definitions (same
+  format as `SAMPLE_4_CAR_RACE.json`); drivers are matched across events by
+  `driver_id`
+- `run_season` simulates every event across a process pool and updates the
+  standings incrementally as each event's results arrive
+- `simulate_title_odds` runs thousands of seasons to estimate title odds,
+  vectorized across the seasons in each chunk
+
+Run from the project root:
+    python -m sim.championship --rounds 10 --seasons 5000 --seed 1
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from sim.monte_carlo import chunk_bounds, map_chunks
+from sim.simple_race_sim import (
+    INPUT_FILE, build_entry_list, lap_positions, load_race_data, simulate_race_totals,
+    simulate_race_vectorized,
+)
+
+# Points for P1, P2, ...; positions beyond the list score nothing
+POINTS_SYSTEM = (25, 18, 15, 12, 10, 8, 6, 4, 2, 1)
+
+
+def points_for_positions(positions, points_system=POINTS_SYSTEM):
+    """Points scored for each finishing position (1-based) in `positions`."""
+    lookup = np.zeros(max(int(np.max(positions)), len(points_system)) + 1)
+    lookup[1:len(points_system) + 1] = points_system
+    return lookup[positions]
+
+
+class Standings:
+    """
+    Championship points table, updated one event at a time.
+
+    Applying an event only touches the drivers in its results, so the table
+    never has to be rebuilt from stored results.
+    """
+    def __init__(self, points_system=POINTS_SYSTEM):
+        self.points_system = tuple(points_system)
+        self.drivers = {}
+        self.points = {}
+        self.wins = {}
+        self.events = 0
+
+    def apply_event(self, results):
+        """Add one event's results (the `simulate_race` results structure)."""
+        for row in results["results"]:
+            driver = row["driver"]
+            driver_id = driver["driver_id"]
+            self.drivers.setdefault(driver_id, driver)
+            position = row["position"]
+            scored = self.points_system[position - 1] if position <= len(self.points_system) else 0
+            self.points[driver_id] = self.points.get(driver_id, 0) + scored
+            self.wins[driver_id] = self.wins.get(driver_id, 0) + (position == 1)
+        self.events += 1
+
+    def table(self):
+        """Standings rows ordered by points, then wins."""
+        order = sorted(self.drivers, key=lambda d: (-self.points[d], -self.wins[d]))
+        return [
+            {
+                "position": pos,
+                "driver": self.drivers[driver_id],
+                "points": self.points[driver_id],
+                "wins": self.wins[driver_id],
+            }
+            for pos, driver_id in enumerate(order, 1)
+        ]
+
+
+def _simulate_event(args):
+    session_data, seed = args
+    return simulate_race_vectorized(session_data, seed)
+
+
+def iter_season(events, seed=None, workers=None, points_system=POINTS_SYSTEM):
+    """
+    Simulate a season, yielding `(round_number, results, standings)` after each
+    event. Events run in parallel but are applied to the standings in round order.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(len(events))
+    tasks = list(zip(events, seeds))
+    standings = Standings(points_system)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        outcomes = map(_simulate_event, tasks)
+        for round_number, results in enumerate(outcomes, 1):
+            standings.apply_event(results)
+            yield round_number, results, standings
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for round_number, results in enumerate(executor.map(_simulate_event, tasks), 1):
+            standings.apply_event(results)
+            yield round_number, results, standings
+
+
+def run_season(events, seed=None, workers=None, points_system=POINTS_SYSTEM):
+    """Simulate a season and return every event's results plus the final standings."""
+    event_results = []
+    standings = Standings(points_system)
+    for _, results, standings in iter_season(events, seed, workers, points_system):
+        event_results.append(results)
+    return {"events": event_results, "standings": standings.table()}
+
+
+def championship_drivers(events):
+    """Every driver in the championship, in order of first appearance."""
+    drivers = {}
+    for session_data in events:
+        for entry in build_entry_list(session_data):
+            drivers.setdefault(entry["driver"]["driver_id"], entry["driver"])
+    return list(drivers.values())
+
+
+def simulate_season_points(events, driver_ids, points_system, entropy, chunk_index, seasons):
+    """
+    Points and wins per driver for `seasons` simulated seasons, as two
+    (seasons x drivers) matrices.
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(chunk_index,)))
+    column = {driver_id: idx for idx, driver_id in enumerate(driver_ids)}
+    points = np.zeros((seasons, len(driver_ids)))
+    wins = np.zeros((seasons, len(driver_ids)), dtype=np.int64)
+    for session_data in events:
+        columns = [column[entry["driver"]["driver_id"]] for entry in build_entry_list(session_data)]
+        positions = lap_positions(simulate_race_totals(session_data, seasons, rng))
+        points[:, columns] += points_for_positions(positions, points_system)
+        wins[:, columns] += positions == 1
+    return points, wins
+
+
+def _simulate_season_chunk(args):
+    return simulate_season_points(*args)
+
+
+def simulate_title_odds(events, seasons, seed=None, workers=None, points_system=POINTS_SYSTEM):
+    """
+    Estimate each driver's title probability over `seasons` simulated seasons.
+
+    Results are reproducible from `seed` for any number of workers. Ties on
+    points are broken by wins.
+    """
+    if seasons < 1:
+        raise ValueError("seasons must be at least 1")
+    entropy = np.random.SeedSequence(seed).entropy
+    drivers = championship_drivers(events)
+    driver_ids = [driver["driver_id"] for driver in drivers]
+    tasks = [
+        (events, driver_ids, tuple(points_system), entropy, chunk_index, stop - start)
+        for chunk_index, (start, stop) in enumerate(chunk_bounds(seasons))
+    ]
+    chunks = map_chunks(_simulate_season_chunk, tasks, workers or os.cpu_count() or 1)
+    points = np.concatenate([chunk[0] for chunk in chunks])
+    wins = np.concatenate([chunk[1] for chunk in chunks])
+    champions = np.argmax(points * (len(events) + 1) + wins, axis=1)
+    titles = np.bincount(champions, minlength=len(drivers))
+    return {
+        "seasons": seasons,
+        "seed": entropy,
+        "drivers": [
+            {
+                "driver": driver,
+                "title_probability": float(titles[idx] / seasons),
+                "expected_points": float(points[:, idx].mean()),
+                "expected_wins": float(wins[:, idx].mean()),
+            }
+            for idx, driver in enumerate(drivers)
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate a championship season and estimate title odds.")
+    parser.add_argument("--input", nargs="+", default=[str(INPUT_FILE)],
+                        help="Event session definition JSON files, in round order")
+    parser.add_argument("--rounds", type=int, default=None,
+                        help="Repeat the input events to make a season of this many rounds")
+    parser.add_argument("--seasons", type=int, default=1000, help="Seasons for title odds (0 to skip)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    events = [load_race_data(path) for path in args.input]
+    if args.rounds:
+        events = [events[i % len(events)] for i in range(args.rounds)]
+
+    season = run_season(events, args.seed, args.workers)
+    print(f"Season of {len(events)} rounds")
+    print(f"{'Pos':>3} {'Driver':<20} {'Points':>6} {'Wins':>4}")
+    for row in season["standings"]:
+        print(f"{row['position']:>3} {row['driver']['name']:<20} {row['points']:>6} {row['wins']:>4}")
+
+    if args.seasons:
+        odds = simulate_title_odds(events, args.seasons, args.seed, args.workers)
+        print(f"\nTitle odds over {odds['seasons']} seasons (seed {odds['seed']})")
+        print(f"{'Driver':<20} {'Title %':>7} {'Avg Pts':>8} {'Avg Wins':>8}")
+        for row in sorted(odds["drivers"], key=lambda r: -r["title_probability"]):
+            print(f"{row['driver']['name']:<20} {row['title_probability'] * 100:7.2f} "
+                  f"{row['expected_points']:8.1f} {row['expected_wins']:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Monte Carlo race outcomes for Race Manager Pro
+
+- Runs many independently seeded race simulations across a process pool
+- Aggregates finishing-position histograms, win/podium probabilities and
+  expected gap to the winner per entry
+- Every run draws from its own child of one master `SeedSequence`, so results
+  are identical for a given seed whatever the number of workers
+
+Run from the project root:
+    python -m sim.monte_carlo --runs 10000 --seed 42 --workers 4
+"""
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from sim.simple_race_sim import INPUT_FILE, build_entry_list, load_race_data, simulate_race_arrays
+
+# Runs handed to a worker per task; only affects scheduling, never results
+CHUNK_SIZE = 250
+
+
+def run_seed(entropy, run_index):
+    """Seed of a single run: child `run_index` of the master seed sequence."""
+    return np.random.SeedSequence(entropy, spawn_key=(run_index,))
+
+
+def simulate_runs(session_data, entropy, start, stop):
+    """
+    Simulate runs `start`..`stop - 1` and return their final positions and
+    total times as (runs x entries) arrays.
+    """
+    positions = []
+    totals = []
+    for run_index in range(start, stop):
+        arrays = simulate_race_arrays(session_data, run_seed(entropy, run_index))
+        positions.append(arrays.positions[-1])
+        totals.append(arrays.cumulative[-1])
+    return np.array(positions), np.array(totals)
+
+
+def _simulate_chunk(args):
+    return simulate_runs(*args)
+
+
+def chunk_bounds(runs, chunk_size=CHUNK_SIZE):
+    return [(start, min(start + chunk_size, runs)) for start in range(0, runs, chunk_size)]
+
+
+def map_chunks(func, tasks, workers, on_chunk=None, mp_context=None):
+    """
+    Apply `func` to every task, in a process pool when `workers` > 1, keeping
+    task order. `on_chunk(index, result)` is called as each result arrives; if
+    it raises (e.g. to cancel), tasks not yet started are cancelled.
+    """
+    results = []
+    if workers <= 1 or len(tasks) <= 1:
+        for index, task in enumerate(tasks):
+            results.append(func(task))
+            if on_chunk is not None:
+                on_chunk(index, results[-1])
+        return results
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=mp_context)
+    try:
+        for index, result in enumerate(executor.map(func, tasks)):
+            results.append(result)
+            if on_chunk is not None:
+                on_chunk(index, result)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return results
+
+
+def summarize_outcomes(entry_list, positions, totals):
+    """Aggregate per-run positions and total times into per-entry distributions."""
+    runs, num_entries = positions.shape
+    histogram = np.zeros((num_entries, num_entries), dtype=np.int64)
+    np.add.at(histogram, (np.broadcast_to(np.arange(num_entries), positions.shape), positions - 1), 1)
+    gaps = totals - totals.min(axis=1, keepdims=True)
+    probabilities = histogram / runs
+    expected_position = probabilities @ np.arange(1, num_entries + 1)
+    return [
+        {
+            "entry_id": entry["entry_id"],
+            "driver": entry["driver"],
+            "car": entry["car"],
+            "position_histogram": histogram[idx].tolist(),
+            "win_probability": float(probabilities[idx, 0]),
+            "podium_probability": float(probabilities[idx, :3].sum()),
+            "expected_position": float(expected_position[idx]),
+            "expected_gap": float(gaps[:, idx].mean()),
+        }
+        for idx, entry in enumerate(entry_list)
+    ]
+
+
+def run_monte_carlo(session_data, runs, seed=None, workers=None, progress=None, mp_context=None):
+    """
+    Simulate `runs` races and return aggregated outcome distributions.
+
+    `seed` is the master seed; when None a fresh one is drawn and reported in
+    the result so the batch can be reproduced. `workers` defaults to the CPU count.
+    `progress(runs_done, runs)` is called after each chunk; raising from it
+    cancels the remaining chunks.
+    """
+    if runs < 1:
+        raise ValueError("runs must be at least 1")
+    entropy = np.random.SeedSequence(seed).entropy
+    workers = workers or os.cpu_count() or 1
+    bounds = chunk_bounds(runs)
+    tasks = [(session_data, entropy, start, stop) for start, stop in bounds]
+    on_chunk = None
+    if progress is not None:
+        def on_chunk(index, result):
+            progress(bounds[index][1], runs)
+    chunks = map_chunks(_simulate_chunk, tasks, workers, on_chunk, mp_context)
+    positions = np.concatenate([chunk[0] for chunk in chunks])
+    totals = np.concatenate([chunk[1] for chunk in chunks])
+    return {
+        "track": session_data["track"],
+        "runs": runs,
+        "seed": entropy,
+        "entries": summarize_outcomes(build_entry_list(session_data), positions, totals),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate race outcome probabilities by Monte Carlo simulation.")
+    parser.add_argument("--input", type=Path, default=INPUT_FILE, help="Session definition JSON")
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None, help="Master seed (default: random, printed)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--output", type=Path, default=None, help="Write the full distributions as JSON")
+    args = parser.parse_args()
+
+    summary = run_monte_carlo(load_race_data(args.input), args.runs, args.seed, args.workers)
+    print(f"{summary['track']['name']}: {summary['runs']} runs, seed {summary['seed']}")
+    print(f"{'Driver':<20} {'Win %':>7} {'Podium %':>9} {'Avg Pos':>8} {'Avg Gap':>8}")
+    for entry in sorted(summary["entries"], key=lambda e: e["expected_position"]):
+        print(f"{entry['driver']['name']:<20} {entry['win_probability'] * 100:7.2f} "
+              f"{entry['podium_probability'] * 100:9.2f} {entry['expected_position']:8.2f} "
+              f"{entry['expected_gap']:8.2f}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"Distributions written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,30 @@ Simple Race Simulator for Race Manager Pro
 - Loads race session data from a JSON file (track, cars, drivers, entries)
 - Simulates a race session (lap times, positions)
 - Outputs session results as a JSON structure
+
+Two engines produce the same results shape:
+- `simulate_race`: the original per-lap, per-entry Python loop
+- `simulate_race_vectorized`: draws the whole laps x entries lap-time matrix
+  in one NumPy call and derives cumulative times and positions from it
+
+`iter_race_laps` streams the same race one lap at a time for live consumers.
+
+Run from the project root (results are also added to the session index):
+    python -m sim.simple_race_sim --seed 42
+Running the file directly (`python sim/simple_race_sim.py`) still writes the
+results, but skips indexing since the `storage` package is not importable.
 """
+import argparse
 import json
+import logging
 import random
+from collections import namedtuple
 from pathlib import Path
 
+import numpy as np
+
+logger = logging.getLogger("simple_race_sim")
+
 INPUT_FILE = Path(__file__).parent.parent / "docs" / "dev" / "SAMPLE_4_CAR_RACE.json"
 
 # Simulation parameters
@@ -16,31 +35,43 @@ BASE_LAP_TIME = 60.0  # seconds (for a 2km oval)
 LAP_TIME_VARIANCE = 0.5  # seconds, random lap-to-lap variation
 SKILL_FACTOR = 2.0  # seconds, max lap time difference due to skill
 
+# Arrays produced by the vectorized engine. All matrices are laps x entries,
+# with columns in the same order as `entries`.
+RaceArrays = namedtuple("RaceArrays", ["entries", "lap_times", "cumulative", "positions"])
+
+# Race state after one lap, yielded by `iter_race_laps`. Arrays are indexed by
+# entry, in the same order as `entry_ids`.
+LapSnapshot = namedtuple("LapSnapshot", ["lap", "entry_ids", "lap_times", "cumulative", "positions"])
+
 
 def load_race_data(path):
     with open(path, "r") as f:
         return json.load(f)
 
 
-def simulate_race(session_data):
-    track = session_data["track"]
-    laps = track["laps"]
-    entries = session_data["entries"]
+def build_entry_list(session_data):
+    """Resolve each entry's car and driver from the session tables."""
     cars = {c["car_id"]: c for c in session_data["cars"]}
     drivers = {d["driver_id"]: d for d in session_data["drivers"]}
-
-    # Build entry list with driver/car info
     entry_list = []
-    for entry in entries:
-        car = cars[entry["car_id"]]
-        driver = drivers[entry["driver_id"]]
+    for entry in session_data["entries"]:
         entry_list.append({
             "entry_id": entry["entry_id"],
-            "car": car,
-            "driver": driver,
-            "laps": [],
-            "total_time": 0.0
+            "car": cars[entry["car_id"]],
+            "driver": drivers[entry["driver_id"]],
         })
+    return entry_list
+
+
+def simulate_race(session_data):
+    track = session_data["track"]
+    laps = track["laps"]
+
+    # Build entry list with driver/car info
+    entry_list = build_entry_list(session_data)
+    for entry in entry_list:
+        entry["laps"] = []
+        entry["total_time"] = 0.0
 
     # Simulate each lap
     for lap_num in range(1, laps + 1):
@@ -75,9 +106,120 @@ def simulate_race(session_data):
     return results
 
 
+def expected_lap_times(entry_list):
+    """Noise-free lap time of each entry, in entry order."""
+    skill = np.array([entry["driver"]["skill"] for entry in entry_list], dtype=np.float64)
+    return BASE_LAP_TIME + (1.0 - skill) * SKILL_FACTOR
+
+
+def lap_positions(cumulative):
+    """
+    Running position (1 = leader) of every entry on every lap.
+
+    `cumulative` is a laps x entries matrix of cumulative race times; ties keep
+    entry order, matching the stable sort used by `simulate_race`.
+    """
+    order = np.argsort(cumulative, axis=-1, kind="stable")
+    positions = np.empty_like(order)
+    ranks = np.broadcast_to(np.arange(1, order.shape[-1] + 1), order.shape)
+    np.put_along_axis(positions, order, ranks, axis=-1)
+    return positions
+
+
+def simulate_race_arrays(session_data, rng=None):
+    """
+    Simulate a race as arrays: one batched draw for every lap of every entry.
+
+    `rng` may be a `numpy.random.Generator`, a seed, or None for fresh entropy.
+    """
+    rng = np.random.default_rng(rng)
+    entry_list = build_entry_list(session_data)
+    laps = session_data["track"]["laps"]
+    lap_times = expected_lap_times(entry_list) + rng.uniform(
+        -LAP_TIME_VARIANCE, LAP_TIME_VARIANCE, size=(laps, len(entry_list))
+    )
+    cumulative = np.cumsum(lap_times, axis=0)
+    return RaceArrays(entry_list, lap_times, cumulative, lap_positions(cumulative))
+
+
+def iter_race_laps(session_data, rng=None):
+    """
+    Simulate a race lap by lap, yielding a `LapSnapshot` as each lap completes.
+
+    Only the current lap is held in memory. For the same seed the snapshots
+    match the rows of `simulate_race_arrays`.
+    """
+    rng = np.random.default_rng(rng)
+    entry_list = build_entry_list(session_data)
+    entry_ids = tuple(entry["entry_id"] for entry in entry_list)
+    expected = expected_lap_times(entry_list)
+    cumulative = np.zeros(len(entry_list))
+    for lap_num in range(1, session_data["track"]["laps"] + 1):
+        lap_times = expected + rng.uniform(-LAP_TIME_VARIANCE, LAP_TIME_VARIANCE, size=len(entry_list))
+        cumulative = cumulative + lap_times
+        yield LapSnapshot(lap_num, entry_ids, lap_times, cumulative, lap_positions(cumulative))
+
+
+def simulate_race_totals(session_data, runs, rng=None):
+    """
+    Total race time of every entry for `runs` independent races, as a
+    (runs x entries) matrix. Laps are accumulated one at a time so memory
+    stays at one lap of draws for the whole batch.
+    """
+    rng = np.random.default_rng(rng)
+    entry_list = build_entry_list(session_data)
+    laps = session_data["track"]["laps"]
+    totals = np.zeros((runs, len(entry_list)))
+    for _ in range(laps):
+        totals += rng.uniform(-LAP_TIME_VARIANCE, LAP_TIME_VARIANCE, size=totals.shape)
+    totals += laps * expected_lap_times(entry_list)
+    return totals
+
+
+def build_results(track, arrays):
+    """Build the results JSON structure (same shape as `simulate_race`) from race arrays."""
+    entry_list = arrays.entries
+    lap_numbers = range(1, arrays.lap_times.shape[0] + 1)
+    totals = arrays.cumulative[-1].tolist() if len(arrays.lap_times) else [0.0] * len(entry_list)
+    lap_columns = arrays.lap_times.T.tolist()
+    finishing_order = np.argsort(totals, kind="stable")
+    return {
+        "track": track,
+        "results": [
+            {
+                "position": pos,
+                "driver": entry_list[idx]["driver"],
+                "car": entry_list[idx]["car"],
+                "total_time": totals[idx],
+                "laps": [
+                    {"lap": lap_num, "lap_time": lap_time}
+                    for lap_num, lap_time in zip(lap_numbers, lap_columns[idx])
+                ]
+            }
+            for pos, idx in enumerate(finishing_order.tolist(), 1)
+        ]
+    }
+
+
+def simulate_race_vectorized(session_data, rng=None):
+    """NumPy engine for `simulate_race`; returns the same results structure."""
+    return build_results(session_data["track"], simulate_race_arrays(session_data, rng))
+
+
 def main():
-    session_data = load_race_data(INPUT_FILE)
-    results = simulate_race(session_data)
+    parser = argparse.ArgumentParser(description="Simulate a race session and write its results.")
+    parser.add_argument("--input", type=Path, default=INPUT_FILE, help="Session definition JSON")
+    parser.add_argument("--engine", choices=["numpy", "loop"], default="numpy",
+                        help="Simulation engine (default: numpy)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for the numpy engine")
+    parser.add_argument("--no-index", action="store_true", help="Do not add the results to the session index")
+    args = parser.parse_args()
+
+    session_data = load_race_data(args.input)
+    if args.engine == "loop":
+        results = simulate_race(session_data)
+    else:
+        results = simulate_race_vectorized(session_data, args.seed)
     print(json.dumps(results, indent=2))
 
     # Output results to file in data/sessions/
@@ -91,6 +233,13 @@ def main():
     with open(output_file, "w") as f:
         json.dump(results, f, indent=2)
     print(f"Results written to {output_file}")
+    if not args.no_index:
+        try:
+            from storage.session_index import index_session
+        except ImportError:
+            logger.warning("Session index not updated: run as `python -m sim.simple_race_sim` to index results")
+            return
+        index_session(output_file)
 
 
 if __name__ == "__main__":
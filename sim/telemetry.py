@@ -0,0 +1,225 @@
+"""
+Telemetry synthesis for Race Manager Pro
+
+- Simulates a race with `simulate_race_arrays` and synthesizes a
+  `TelemetrySample` trace (speed, rpm, throttle, brake, gear, g_force,
+  steering_angle) at 100 Hz for every entry
+- Traces follow a fixed corner profile around the lap, scaled so that each
+  lap covers the track length in exactly the simulated lap time
+- All entries are computed together, one time chunk (samples x entries) at a
+  time, and each chunk is appended to the entries' telemetry files
+  (`storage/telemetry_store.py`), so memory use is bounded by the chunk size
+  however long the race is
+
+The session is written as a columnar session directory with its telemetry
+under `telemetry/`, ready for `TelemetryStore` and replays.
+
+Run from the project root (results are also added to the session index):
+    python -m sim.telemetry --seed 42
+    python -m sim.telemetry --input my_30_car_race.json --laps 50
+"""
+import argparse
+import json
+import time
+from contextlib import ExitStack
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from sim.simple_race_sim import INPUT_FILE, build_results, load_race_data, simulate_race_arrays
+from storage.columnar_session import SUFFIX as COLUMNAR_SUFFIX, write_columnar
+from storage.telemetry_store import TELEMETRY_DTYPE, TelemetryWriter
+
+SAMPLE_RATE_HZ = 100
+CHUNK_SECONDS = 30.0  # race time synthesized per chunk, for all entries at once
+DEFAULT_TRACK_LENGTH_KM = 2.0
+
+# Corners as (lap fraction of apex, speed drop at apex, width as lap fraction,
+# direction: 1 = right, -1 = left)
+TRACK_CORNERS = np.array([
+    (0.12, 0.45, 0.025, 1),
+    (0.30, 0.25, 0.030, 1),
+    (0.52, 0.55, 0.020, -1),
+    (0.70, 0.30, 0.035, 1),
+    (0.88, 0.40, 0.025, 1),
+])
+
+# Car model
+GEAR_TOP_SPEEDS = np.array([70.0, 105.0, 140.0, 175.0, 210.0, 250.0])  # km/h at REDLINE_RPM
+UPSHIFT_FRACTION = 0.92  # of a gear's top speed
+REDLINE_RPM = 8500.0
+IDLE_RPM = 1200.0
+CRUISE_THROTTLE = 0.35  # throttle holding a constant speed
+FULL_THROTTLE_ACCEL = 6.0  # m/s^2 above cruise that needs full throttle
+FULL_BRAKE_DECEL = 12.0  # m/s^2 at full brake pressure
+CORNER_G = 2.5  # lateral g at the apex of a corner
+MAX_STEERING_ANGLE = 90.0  # degrees at the apex of a corner
+SPEED_NOISE = 0.4  # km/h, sample-to-sample driver/sensor noise
+GRAVITY = 9.81
+
+
+def corner_shape(fraction):
+    """
+    Corner profile at lap `fraction` (any shape): returns (speed_factor,
+    d_speed_factor / d_fraction, corner_weight, steering) where speed_factor
+    is 1 on straights and corner_weight/steering are signed per corner.
+    """
+    apex, depth, width, direction = (TRACK_CORNERS[:, i] for i in range(4))
+    # Distance to each apex, wrapped around the lap
+    offset = (fraction[..., None] - apex + 0.5) % 1.0 - 0.5
+    bump = np.exp(-0.5 * (offset / width) ** 2)
+    speed_factor = 1.0 - (depth * bump).sum(axis=-1)
+    slope = (depth * bump * offset / width ** 2).sum(axis=-1)
+    weight = np.minimum(bump.sum(axis=-1), 1.0)
+    steering = (direction * bump).sum(axis=-1)
+    return speed_factor, slope, weight, steering
+
+
+# The profile tabulated once around the lap; samples look up their nearest
+# point instead of evaluating every corner. At 60 s laps a table point is
+# under half a 100 Hz sample apart.
+PROFILE_POINTS = 16384
+_PROFILE = np.stack(corner_shape(np.arange(PROFILE_POINTS) / PROFILE_POINTS))
+# Mean of the speed factor over a lap, to scale lap speed to the track length
+_MEAN_SPEED_FACTOR = float(_PROFILE[0].mean())
+
+
+def synthesize_chunk(times, arrays, track_length_km, rng):
+    """
+    Telemetry of every entry at race `times` (seconds), as a (entries x
+    samples) TELEMETRY_DTYPE array, and the number of samples of each entry
+    taken before it finished (rows are only valid up to that count).
+    """
+    lap_times = arrays.lap_times  # laps x entries
+    cumulative = arrays.cumulative
+    laps, entries = lap_times.shape
+    finish = cumulative[-1]
+    # Lap of every (sample, entry) in one search: offset each entry's
+    # cumulative times so the flattened matrix is sorted
+    span = float(finish.max()) + 1.0
+    offsets = np.arange(entries) * span
+    keys = (cumulative.T + offsets[:, None]).ravel()
+    lap_idx = np.searchsorted(keys, times[:, None] + offsets, side="right") - np.arange(entries) * laps
+    lap_idx = np.minimum(lap_idx, laps - 1)
+    columns = np.arange(entries)
+    lap_start = cumulative[lap_idx, columns] - lap_times[lap_idx, columns]
+    lap_time = lap_times[lap_idx, columns]
+    fraction = (times[:, None] - lap_start) / lap_time
+
+    point = np.rint(fraction * PROFILE_POINTS).astype(np.intp) % PROFILE_POINTS
+    speed_factor, slope, weight, steering = _PROFILE[:, point]
+    # km/h on straights for this lap, so the lap covers the track length
+    top_speed = track_length_km * 3600.0 / lap_time / _MEAN_SPEED_FACTOR
+    speed = top_speed * speed_factor + rng.normal(0.0, SPEED_NOISE, size=fraction.shape)
+    accel = top_speed * slope / lap_time / 3.6  # m/s^2
+    brake = np.clip(-accel / FULL_BRAKE_DECEL, 0.0, 1.0)
+    throttle = np.where(accel < 0.0, 0.0, np.clip(CRUISE_THROTTLE + accel / FULL_THROTTLE_ACCEL, 0.0, 1.0))
+    gear = np.minimum(np.searchsorted(GEAR_TOP_SPEEDS * UPSHIFT_FRACTION, speed), len(GEAR_TOP_SPEEDS) - 1)
+    rpm = np.maximum(REDLINE_RPM * speed / GEAR_TOP_SPEEDS[gear], IDLE_RPM)
+    g_force = np.hypot(accel / GRAVITY, CORNER_G * weight)
+
+    records = np.empty((entries, len(times)), dtype=TELEMETRY_DTYPE)
+    records["timestamp"] = times
+    records["lap"] = lap_idx.T + 1
+    records["speed"] = speed.T
+    records["rpm"] = rpm.T
+    records["throttle"] = throttle.T
+    records["brake"] = brake.T
+    records["gear"] = gear.T + 1
+    records["g_force"] = g_force.T
+    records["steering_angle"] = MAX_STEERING_ANGLE * steering.T
+    counts = np.searchsorted(times, finish, side="left")
+    return records, counts
+
+
+def write_race_telemetry(arrays, track, session_path, rng=None, sample_rate=SAMPLE_RATE_HZ,
+                         chunk_seconds=CHUNK_SECONDS, progress=None):
+    """
+    Synthesize the telemetry of a simulated race (`RaceArrays`) into
+    `session_path/telemetry/`, one file per entry. Each entry's trace ends
+    when it finishes. `progress(seconds_done, race_seconds)` is called after
+    each chunk; raising from it stops the synthesis. Returns the number of
+    records written.
+    """
+    rng = np.random.default_rng(rng)
+    track_length = track.get("length_km", DEFAULT_TRACK_LENGTH_KM)
+    if not arrays.lap_times.size:
+        return 0
+    duration = float(arrays.cumulative[-1].max())
+    total_samples = int(np.ceil(duration * sample_rate))
+    chunk_samples = max(int(chunk_seconds * sample_rate), 1)
+    written = 0
+    with ExitStack() as stack:
+        writers = [stack.enter_context(TelemetryWriter(session_path, entry["entry_id"]))
+                   for entry in arrays.entries]
+        for start in range(0, total_samples, chunk_samples):
+            stop = min(start + chunk_samples, total_samples)
+            times = np.arange(start, stop) / sample_rate
+            records, counts = synthesize_chunk(times, arrays, track_length, rng)
+            for writer, row, count in zip(writers, records, counts.tolist()):
+                if count:
+                    writer.append(row[:count])
+                    written += count
+            if progress is not None:
+                progress(stop / sample_rate, duration)
+    return written
+
+
+def simulate_race_with_telemetry(session_data, session_path, rng=None, sample_rate=SAMPLE_RATE_HZ,
+                                 progress=None):
+    """
+    Simulate a race and write it as a columnar session directory at
+    `session_path`, with the synthesized telemetry of every entry. Result rows
+    carry the `entry_id` their telemetry is stored under. Returns the results.
+    """
+    rng = np.random.default_rng(rng)
+    arrays = simulate_race_arrays(session_data, rng)
+    results = build_results(session_data["track"], arrays)
+    # Rows are in finishing order, as sorted by build_results
+    finishing_order = np.argsort(arrays.cumulative[-1], kind="stable") if arrays.lap_times.size else []
+    for row, idx in zip(results["results"], finishing_order):
+        row["entry_id"] = arrays.entries[idx]["entry_id"]
+    write_columnar(results, session_path)
+    write_race_telemetry(arrays, session_data["track"], session_path, rng, sample_rate, progress=progress)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate a race with synthesized high-frequency telemetry.")
+    parser.add_argument("--input", type=Path, default=INPUT_FILE, help="Session definition JSON")
+    parser.add_argument("--laps", type=int, default=None, help="Override the track's lap count")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    parser.add_argument("--rate", type=int, default=SAMPLE_RATE_HZ, help="Samples per second (default: 100)")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Session directory (default: data/sessions/<time>_<track>_results.session)")
+    parser.add_argument("--no-index", action="store_true", help="Do not add the results to the session index")
+    args = parser.parse_args()
+
+    session_data = load_race_data(args.input)
+    if args.laps is not None:
+        session_data["track"] = dict(session_data["track"], laps=args.laps)
+    output = args.output
+    if output is None:
+        track_name = session_data["track"]["name"].replace(" ", "_").lower()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = Path(__file__).parent.parent / "data" / "sessions" / f"{timestamp}_{track_name}_results{COLUMNAR_SUFFIX}"
+
+    started = time.perf_counter()
+    simulate_race_with_telemetry(session_data, output, args.seed, args.rate)
+    elapsed = time.perf_counter() - started
+    telemetry_bytes = sum(path.stat().st_size for path in (output / "telemetry").glob("*"))
+    print(json.dumps({
+        "session": str(output),
+        "entries": len(session_data["entries"]),
+        "laps": session_data["track"]["laps"],
+        "telemetry_mb": round(telemetry_bytes / 1e6, 1),
+        "seconds": round(elapsed, 2),
+    }, indent=2))
+    if not args.no_index:
+        from storage.session_index import index_session
+        index_session(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Package marker for storage
@@ -0,0 +1,178 @@
+"""
+Columnar session storage for Race Manager Pro
+
+A columnar session is a directory holding:
+- `session.json`: track, driver and car tables, and one row per entry that
+  references its driver and car by ID (no repeated driver/car dicts)
+- `lap_times.npy`: an entries x laps float64 matrix of lap times, in results
+  order, padded with NaN for entries that completed fewer laps
+
+The matrix is memory-mapped on load, so opening a long race only reads the
+rows that are actually used. Converters to and from the results JSON written
+by `sim/simple_race_sim.py` keep the JSON format available for portability.
+
+Run from the project root:
+    python -m storage.columnar_session to-columnar data/sessions/<file>.json
+    python -m storage.columnar_session to-json data/sessions/<dir>.session out.json
+"""
+import argparse
+import json
+from pathlib import Path
+
+import numpy as np
+
+FORMAT_NAME = "race-manager-columnar"
+FORMAT_VERSION = 1
+META_FILE = "session.json"
+LAP_TIMES_FILE = "lap_times.npy"
+SUFFIX = ".session"
+
+
+def lap_time_matrix(results):
+    """Entries x laps lap-time matrix from results rows, NaN-padded."""
+    rows = results["results"]
+    num_laps = max((len(row["laps"]) for row in rows), default=0)
+    matrix = np.full((len(rows), num_laps), np.nan)
+    for idx, row in enumerate(rows):
+        lap_times = [lap["lap_time"] for lap in row["laps"]]
+        matrix[idx, :len(lap_times)] = lap_times
+    return matrix
+
+
+def entry_id_for(row):
+    """Entry ID of a results row; older result files only identify entries by car."""
+    return row.get("entry_id", row["car"]["car_id"])
+
+
+class ColumnarSession:
+    """
+    A loaded columnar session. `lap_times` is a read-only memory map; the
+    results JSON structure is only built when `to_results` is called.
+    """
+    def __init__(self, meta, lap_times):
+        self.track = meta["track"]
+        self.drivers = {d["driver_id"]: d for d in meta["drivers"]}
+        self.cars = {c["car_id"]: c for c in meta["cars"]}
+        self.entries = meta["entries"]
+        self.lap_times = lap_times
+
+    def entry_laps(self, index):
+        """Lap times completed by entry `index` (a view, without padding)."""
+        return self.lap_times[index, :self.entries[index]["laps"]]
+
+    def iter_results(self):
+        """Yield results rows one at a time, in the `simulate_race` row format."""
+        for idx, entry in enumerate(self.entries):
+            yield {
+                "entry_id": entry["entry_id"],
+                "position": entry["position"],
+                "driver": self.drivers[entry["driver_id"]],
+                "car": self.cars[entry["car_id"]],
+                "total_time": entry["total_time"],
+                "laps": [
+                    {"lap": lap_num, "lap_time": lap_time}
+                    for lap_num, lap_time in enumerate(self.entry_laps(idx).tolist(), 1)
+                ]
+            }
+
+    def to_results(self):
+        """Build the full results JSON structure."""
+        return {"track": self.track, "results": list(self.iter_results())}
+
+    def write_json(self, path):
+        """Export as results JSON, streaming one row at a time."""
+        with open(path, "w") as f:
+            f.write('{"track": ')
+            json.dump(self.track, f)
+            f.write(', "results": [')
+            for idx, row in enumerate(self.iter_results()):
+                if idx:
+                    f.write(", ")
+                json.dump(row, f)
+            f.write("]}")
+
+
+def write_columnar(results, path):
+    """Write a results structure as a columnar session directory at `path`."""
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    drivers = {}
+    cars = {}
+    entries = []
+    for row in results["results"]:
+        driver = row["driver"]
+        car = row["car"]
+        drivers.setdefault(driver["driver_id"], driver)
+        cars.setdefault(car["car_id"], car)
+        entries.append({
+            "entry_id": entry_id_for(row),
+            "driver_id": driver["driver_id"],
+            "car_id": car["car_id"],
+            "position": row["position"],
+            "total_time": row["total_time"],
+            "laps": len(row["laps"]),
+        })
+    meta = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "track": results["track"],
+        "drivers": list(drivers.values()),
+        "cars": list(cars.values()),
+        "entries": entries,
+    }
+    np.save(path / LAP_TIMES_FILE, lap_time_matrix(results))
+    with open(path / META_FILE, "w") as f:
+        json.dump(meta, f, indent=2)
+    return path
+
+
+def load_columnar(path, mmap=True):
+    """Load a columnar session directory; lap times are memory-mapped unless `mmap` is False."""
+    path = Path(path)
+    with open(path / META_FILE, "r") as f:
+        meta = json.load(f)
+    if meta.get("format") != FORMAT_NAME:
+        raise ValueError(f"{path} is not a columnar session")
+    if meta.get("version", 0) > FORMAT_VERSION:
+        raise ValueError(f"{path} uses columnar format version {meta['version']}, "
+                         f"newer than supported version {FORMAT_VERSION}")
+    lap_times = np.load(path / LAP_TIMES_FILE, mmap_mode="r" if mmap else None)
+    return ColumnarSession(meta, lap_times)
+
+
+def json_to_columnar(json_path, out_path=None):
+    """Convert a results JSON file; defaults to `<stem>.session` next to it."""
+    json_path = Path(json_path)
+    if out_path is None:
+        out_path = json_path.with_suffix(SUFFIX)
+    with open(json_path, "r") as f:
+        results = json.load(f)
+    return write_columnar(results, out_path)
+
+
+def columnar_to_json(session_path, json_path):
+    """Convert a columnar session directory back to a results JSON file."""
+    load_columnar(session_path).write_json(json_path)
+    return Path(json_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert session results between JSON and columnar formats.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    to_columnar = subparsers.add_parser("to-columnar", help="Convert results JSON to a columnar session")
+    to_columnar.add_argument("json_path", type=Path)
+    to_columnar.add_argument("out_path", type=Path, nargs="?", default=None)
+    to_json = subparsers.add_parser("to-json", help="Export a columnar session as results JSON")
+    to_json.add_argument("session_path", type=Path)
+    to_json.add_argument("json_path", type=Path)
+    args = parser.parse_args()
+
+    if args.command == "to-columnar":
+        out = json_to_columnar(args.json_path, args.out_path)
+    else:
+        out = columnar_to_json(args.session_path, args.json_path)
+    print(f"Written {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Rendered-markdown cache and full-text doc index for Race Manager Pro
+
+Two on-disk structures under `data/doc_cache/` keep the in-app documentation
+viewer fast:
+- rendered HTML for each markdown file, stored as `<sha256>.html` keyed by
+  the file's content (and the renderer settings), so a doc is rendered with
+  the `markdown` library once per edit rather than once per panel;
+- an inverted index (term -> documents, with term counts) over every `.md`
+  file in `docs/`, kept in SQLite. Updates are incremental: only files whose
+  modification time or size changed are re-read, and a file is re-tokenised
+  only if its content hash changed. Deleted files are dropped.
+
+Search is an index lookup: every query term must occur in a document, and
+documents are ranked by the summed counts of the query terms.
+
+Run from the project root:
+    python -m storage.doc_index update
+    python -m storage.doc_index search "lap chart"
+"""
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DOCS_DIR = PROJECT_ROOT / "docs"
+CACHE_DIR = PROJECT_ROOT / "data" / "doc_cache"
+INDEX_FILE = CACHE_DIR / "doc_index.sqlite"
+
+MARKDOWN_EXTENSIONS = ['extra', 'toc', 'tables']
+# Bump when the rendering changes so cached HTML is not reused
+RENDER_VERSION = 1
+# Seconds a connection waits for another connection's write to finish
+BUSY_TIMEOUT = 5.0
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['_][a-z0-9]+)*")
+HEADING_PATTERN = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$", re.MULTILINE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    title TEXT
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL REFERENCES documents(doc_id) ON DELETE CASCADE,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_by_doc ON postings(doc_id);
+"""
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def tokenize(text):
+    """Lower-cased word tokens of `text`."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def document_title(text, path):
+    """First markdown heading of a document, else its file name."""
+    match = HEADING_PATTERN.search(text)
+    return match.group(1) if match else Path(path).stem
+
+
+def render_markdown(text):
+    """Render markdown to an HTML fragment (imports `markdown` only when something must be rendered)."""
+    import markdown
+    return markdown.markdown(text, extensions=MARKDOWN_EXTENSIONS)
+
+
+class RenderCache:
+    """Rendered HTML of markdown files, cached on disk by content hash."""
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.render_count = 0
+
+    def cache_path(self, data):
+        key = content_hash(data + f"\0{RENDER_VERSION}:{','.join(MARKDOWN_EXTENSIONS)}".encode())
+        return self.cache_dir / f"{key}.html"
+
+    def html_for(self, md_path):
+        """HTML fragment for the markdown file at `md_path`; raises FileNotFoundError if missing."""
+        with open(md_path, "rb") as f:
+            data = f.read()
+        cached = self.cache_path(data)
+        try:
+            return cached.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            pass
+        html = render_markdown(data.decode("utf-8"))
+        self.render_count += 1
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent viewers never read a partial file
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(html)
+        os.replace(tmp, cached)
+        return html
+
+
+class DocIndex:
+    """Inverted full-text index over the markdown files in one docs directory."""
+    def __init__(self, db_path=INDEX_FILE, docs_dir=DOCS_DIR):
+        self.docs_dir = Path(docs_dir).resolve()
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT)
+        self.conn.row_factory = sqlite3.Row
+        # WAL lets the viewer search while the background update writes
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def relative(self, path):
+        return Path(path).resolve().relative_to(self.docs_dir).as_posix()
+
+    def update(self):
+        """Bring the index up to date with `docs_dir`. Returns the number of documents (re)tokenised."""
+        paths = sorted(self.docs_dir.rglob("*.md"))
+        known = {row["path"]: row for row in self.conn.execute(
+            "SELECT doc_id, path, mtime_ns, size, content_hash FROM documents")}
+        updated = 0
+        with self.conn:
+            for path in paths:
+                rel = self.relative(path)
+                stat = path.stat()
+                row = known.pop(rel, None)
+                if row is not None and (row["mtime_ns"], row["size"]) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                data = path.read_bytes()
+                digest = content_hash(data)
+                if row is not None and row["content_hash"] == digest:
+                    # Touched but unchanged: only refresh the signature
+                    self.conn.execute("UPDATE documents SET mtime_ns = ?, size = ? WHERE doc_id = ?",
+                                      (stat.st_mtime_ns, stat.st_size, row["doc_id"]))
+                    continue
+                self._index_document(rel, stat, digest, data.decode("utf-8"), row)
+                updated += 1
+            for rel in known:
+                self.conn.execute("DELETE FROM documents WHERE path = ?", (rel,))
+        return updated
+
+    def _index_document(self, rel, stat, digest, text, row):
+        if row is not None:
+            self.conn.execute("DELETE FROM documents WHERE doc_id = ?", (row["doc_id"],))
+        doc_id = self.conn.execute(
+            "INSERT INTO documents (path, mtime_ns, size, content_hash, title) VALUES (?, ?, ?, ?, ?)",
+            (rel, stat.st_mtime_ns, stat.st_size, digest, document_title(text, rel)),
+        ).lastrowid
+        self.conn.executemany(
+            "INSERT INTO postings (term, doc_id, count) VALUES (?, ?, ?)",
+            ((term, doc_id, count) for term, count in Counter(tokenize(text)).items()),
+        )
+
+    def search(self, query, limit=20):
+        """
+        Documents containing every term of `query`, best first, as dicts with
+        `path` (relative to docs_dir), `title` and `score`.
+        """
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return []
+        placeholders = ", ".join("?" for _ in terms)
+        rows = self.conn.execute(
+            "SELECT d.path, d.title, SUM(p.count) AS score "
+            "FROM postings p JOIN documents d ON d.doc_id = p.doc_id "
+            f"WHERE p.term IN ({placeholders}) "
+            "GROUP BY p.doc_id HAVING COUNT(*) = ? "
+            "ORDER BY score DESC, d.path LIMIT ?",
+            (*terms, len(terms), limit),
+        )
+        return [dict(row) for row in rows]
+
+    def documents(self):
+        """All indexed documents (path, title), in path order."""
+        return [dict(row) for row in self.conn.execute("SELECT path, title FROM documents ORDER BY path")]
+
+
+RENDER_CACHE = RenderCache()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the documentation search index.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("update", help="Index new or changed docs")
+    search = subparsers.add_parser("search", help="Find docs containing all query terms")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    with DocIndex() as index:
+        updated = index.update()
+        if args.command == "update":
+            print(f"Indexed {updated} changed document(s); {len(index.documents())} in index")
+        else:
+            for hit in index.search(args.query, args.limit):
+                print(f"{hit['score']:5d}  {hit['path']:<45} {hit['title']}")
+
+
+if __name__ == "__main__":
+    main()
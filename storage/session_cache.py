@@ -0,0 +1,129 @@
+"""
+Process-wide cache of parsed session results for Race Manager Pro
+
+Panels ask the shared `SESSION_STORE` for a session instead of opening and
+parsing the file themselves, so a dashboard with many panels on one session
+parses it once. Entries are evicted least-recently-used beyond `max_entries`
+and reloaded when the file's modification time or size changes.
+
+Values derived from a session (lap charts, statistics) can be cached alongside
+it with `derived`; they are dropped whenever the session itself is reloaded.
+
+Cached sessions are shared between callers and must be treated as read-only.
+The store is safe to use from background loader threads; concurrent requests
+for the same file wait for a single parse.
+"""
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from storage.columnar_session import META_FILE, load_columnar
+
+DEFAULT_MAX_ENTRIES = 8
+
+
+def file_signature(path):
+    """(mtime_ns, size) of a results file, or of a columnar session's metadata file."""
+    stat = (path / META_FILE if path.is_dir() else path).stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def parse_session(path):
+    if path.is_dir():
+        return load_columnar(path).to_results()
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+class SessionStore:
+    """LRU cache of parsed sessions, keyed by resolved path."""
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks = {}
+        self.parse_count = 0
+
+    def get(self, path):
+        """Parsed results of the session at `path`; raises FileNotFoundError if missing."""
+        return self._entry(path)[1]
+
+    def derived(self, path, name, build):
+        """
+        Value `name` derived from the session at `path`, computed once per
+        load of the session as `build(results)`.
+        """
+        signature, data, derived = self._entry(path)
+        if name not in derived:
+            with self._load_lock(path):
+                if name not in derived:
+                    derived[name] = build(data)
+        return derived[name]
+
+    def is_current(self, path, *names):
+        """
+        True if the session at `path` (and each derived value in `names`) is
+        cached and up to date, i.e. `get`/`derived` would return without parsing.
+        """
+        path = Path(path).resolve()
+        try:
+            signature = file_signature(path)
+        except FileNotFoundError:
+            return False
+        with self._lock:
+            cached = self._entries.get(path)
+        return cached is not None and cached[0] == signature and all(name in cached[2] for name in names)
+
+    def _cached(self, path, signature):
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[0] == signature:
+                self._entries.move_to_end(path)
+                return cached
+        return None
+
+    def _entry(self, path):
+        path = Path(path).resolve()
+        signature = file_signature(path)
+        cached = self._cached(path, signature)
+        if cached is not None:
+            return cached
+        with self._load_lock(path):
+            # Another thread may have parsed the file while this one waited
+            signature = file_signature(path)
+            cached = self._cached(path, signature)
+            if cached is not None:
+                return cached
+            return self._store(path, (signature, parse_session(path), {}))
+
+    def _load_lock(self, path):
+        """Lock serialising parses and derived builds of one session."""
+        with self._lock:
+            return self._load_locks.setdefault(Path(path).resolve(), threading.Lock())
+
+    def _store(self, path, entry):
+        with self._lock:
+            self.parse_count += 1
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, path=None):
+        """Drop one session, or every session when `path` is None."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(path).resolve(), None)
+
+    def __contains__(self, path):
+        return Path(path).resolve() in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+SESSION_STORE = SessionStore()
@@ -0,0 +1,249 @@
+"""
+SQLite session index for Race Manager Pro
+
+Catalogs every session result in `data/sessions/` (results JSON files and
+columnar `.session` directories) into one indexed SQLite database, so history
+queries do not have to open every file:
+- best laps for a driver (optionally at one track)
+- sessions between two dates (optionally at one track)
+
+Ingestion is incremental: a file is only (re)read when it is new or its
+modification time changed, and rows of deleted files are dropped. A results
+JSON that has been converted to a `.session` directory is indexed once, as
+the directory.
+
+Run from the project root:
+    python -m storage.session_index ingest
+    python -m storage.session_index best-laps drv1 --track "Simple Oval"
+    python -m storage.session_index sessions --since 2025-07-01 --until 2025-07-31
+"""
+import argparse
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from storage.columnar_session import SUFFIX as COLUMNAR_SUFFIX, entry_id_for, load_columnar
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SESSIONS_DIR = PROJECT_ROOT / "data" / "sessions"
+INDEX_FILE = PROJECT_ROOT / "data" / "session_index.sqlite"
+FILENAME_TIMESTAMP = "%Y%m%d_%H%M%S"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime REAL NOT NULL,
+    started_at TEXT NOT NULL,
+    track_name TEXT,
+    laps INTEGER
+);
+CREATE TABLE IF NOT EXISTS drivers (
+    driver_id TEXT PRIMARY KEY,
+    name TEXT
+);
+CREATE TABLE IF NOT EXISTS entries (
+    entry_pk INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(session_id) ON DELETE CASCADE,
+    entry_id TEXT NOT NULL,
+    driver_id TEXT NOT NULL REFERENCES drivers(driver_id),
+    car_id TEXT,
+    position INTEGER,
+    total_time REAL
+);
+CREATE TABLE IF NOT EXISTS laps (
+    entry_pk INTEGER NOT NULL REFERENCES entries(entry_pk) ON DELETE CASCADE,
+    lap INTEGER NOT NULL,
+    lap_time REAL NOT NULL,
+    PRIMARY KEY (entry_pk, lap)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sessions_by_date ON sessions(started_at);
+CREATE INDEX IF NOT EXISTS sessions_by_track_date ON sessions(track_name, started_at);
+CREATE INDEX IF NOT EXISTS entries_by_driver ON entries(driver_id, session_id);
+CREATE INDEX IF NOT EXISTS entries_by_session ON entries(session_id);
+"""
+
+
+def session_start(path, mtime):
+    """Session start time from the `YYYYmmdd_HHMMSS_` filename prefix, else the file mtime."""
+    try:
+        started = datetime.strptime(path.name[:15], FILENAME_TIMESTAMP)
+    except ValueError:
+        started = datetime.fromtimestamp(mtime)
+    return started.isoformat(timespec="seconds")
+
+
+def session_mtime(path):
+    """
+    Modification time of a session. Files of a columnar directory can be
+    rewritten in place without touching the directory, so use its newest file.
+    """
+    if path.is_dir():
+        return max([path.stat().st_mtime] + [child.stat().st_mtime for child in path.iterdir() if child.is_file()])
+    return path.stat().st_mtime
+
+
+def session_paths(directory):
+    """
+    Session files in `directory`. A results JSON converted to columnar form
+    (`X.json` next to `X.session`) is listed once, as the columnar directory.
+    """
+    columnar = sorted(directory.glob(f"*{COLUMNAR_SUFFIX}"))
+    converted = {path.stem for path in columnar}
+    return [path for path in sorted(directory.glob("*.json")) if path.stem not in converted] + columnar
+
+
+def read_session(path):
+    """Track and results rows of a results JSON file or columnar session directory."""
+    if path.is_dir():
+        session = load_columnar(path)
+        return session.track, session.iter_results()
+    with open(path, "r") as f:
+        results = json.load(f)
+    return results["track"], results["results"]
+
+
+class SessionIndex:
+    """Indexed catalog of session results, backed by one SQLite file."""
+    def __init__(self, db_path=INDEX_FILE):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def ingest_file(self, path):
+        """Index one session; returns False if it was already indexed and unchanged."""
+        path = Path(path).resolve()
+        mtime = session_mtime(path)
+        row = self.conn.execute("SELECT mtime FROM sessions WHERE path = ?", (str(path),)).fetchone()
+        if row is not None and row["mtime"] == mtime:
+            return False
+        track, rows = read_session(path)
+        with self.conn:
+            self.conn.execute("DELETE FROM sessions WHERE path = ?", (str(path),))
+            session_id = self.conn.execute(
+                "INSERT INTO sessions (path, mtime, started_at, track_name, laps) VALUES (?, ?, ?, ?, ?)",
+                (str(path), mtime, session_start(path, mtime), track.get("name"), track.get("laps")),
+            ).lastrowid
+            for result in rows:
+                driver = result["driver"]
+                self.conn.execute(
+                    "INSERT INTO drivers (driver_id, name) VALUES (?, ?) "
+                    "ON CONFLICT(driver_id) DO UPDATE SET name = excluded.name",
+                    (driver["driver_id"], driver.get("name")),
+                )
+                entry_pk = self.conn.execute(
+                    "INSERT INTO entries (session_id, entry_id, driver_id, car_id, position, total_time) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (session_id, entry_id_for(result), driver["driver_id"], result["car"]["car_id"],
+                     result.get("position"), result.get("total_time")),
+                ).lastrowid
+                self.conn.executemany(
+                    "INSERT INTO laps (entry_pk, lap, lap_time) VALUES (?, ?, ?)",
+                    ((entry_pk, lap["lap"], lap["lap_time"]) for lap in result["laps"]),
+                )
+        return True
+
+    def ingest_directory(self, directory=SESSIONS_DIR):
+        """Index new or changed sessions in `directory` and drop deleted ones. Returns the number (re)indexed."""
+        directory = Path(directory).resolve()
+        paths = session_paths(directory)
+        ingested = sum(self.ingest_file(path) for path in paths)
+        present = {str(path.resolve()) for path in paths}
+        indexed = [row["path"] for row in self.conn.execute("SELECT path FROM sessions")]
+        with self.conn:
+            for path in indexed:
+                if Path(path).parent == directory and path not in present:
+                    self.conn.execute("DELETE FROM sessions WHERE path = ?", (path,))
+        return ingested
+
+    def best_laps(self, driver_id, track_name=None, limit=10):
+        """Fastest laps of a driver, optionally at one track."""
+        query = (
+            "SELECT s.path, s.started_at, s.track_name, e.entry_id, l.lap, l.lap_time "
+            "FROM entries e JOIN sessions s ON s.session_id = e.session_id "
+            "JOIN laps l ON l.entry_pk = e.entry_pk "
+            "WHERE e.driver_id = ?"
+        )
+        params = [driver_id]
+        if track_name is not None:
+            query += " AND s.track_name = ?"
+            params.append(track_name)
+        query += " ORDER BY l.lap_time LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in self.conn.execute(query, params)]
+
+    def sessions_between(self, since=None, until=None, track_name=None):
+        """Sessions started in [since, until] (ISO dates or datetimes), oldest first."""
+        query = "SELECT session_id, path, started_at, track_name, laps FROM sessions WHERE 1 = 1"
+        params = []
+        if track_name is not None:
+            query += " AND track_name = ?"
+            params.append(track_name)
+        if since is not None:
+            query += " AND started_at >= ?"
+            params.append(since)
+        if until is not None:
+            # A bare date includes the whole day
+            query += " AND started_at <= ?"
+            params.append(until if "T" in until else f"{until}T23:59:59")
+        query += " ORDER BY started_at"
+        return [dict(row) for row in self.conn.execute(query, params)]
+
+    def session_results(self, session_id):
+        """Entries of one indexed session in finishing order."""
+        return [dict(row) for row in self.conn.execute(
+            "SELECT e.entry_id, e.driver_id, d.name, e.car_id, e.position, e.total_time "
+            "FROM entries e JOIN drivers d ON d.driver_id = e.driver_id "
+            "WHERE e.session_id = ? ORDER BY e.position",
+            (session_id,),
+        )]
+
+
+def index_session(path, db_path=INDEX_FILE):
+    """Add or refresh one session file in the index."""
+    with SessionIndex(db_path) as index:
+        return index.ingest_file(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the session history index.")
+    parser.add_argument("--db", type=Path, default=INDEX_FILE, help="Index database path")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    ingest = subparsers.add_parser("ingest", help="Index new or changed session files")
+    ingest.add_argument("directory", type=Path, nargs="?", default=SESSIONS_DIR)
+    best = subparsers.add_parser("best-laps", help="Fastest laps of a driver")
+    best.add_argument("driver_id")
+    best.add_argument("--track", default=None)
+    best.add_argument("--limit", type=int, default=10)
+    sessions = subparsers.add_parser("sessions", help="Sessions between two dates")
+    sessions.add_argument("--since", default=None, help="ISO date, e.g. 2025-07-01")
+    sessions.add_argument("--until", default=None, help="ISO date, inclusive")
+    sessions.add_argument("--track", default=None)
+    args = parser.parse_args()
+
+    with SessionIndex(args.db) as index:
+        if args.command == "ingest":
+            print(f"Indexed {index.ingest_directory(args.directory)} new or changed sessions")
+        elif args.command == "best-laps":
+            for row in index.best_laps(args.driver_id, args.track, args.limit):
+                print(f"{row['lap_time']:10.3f}  lap {row['lap']:>3}  {row['track_name']}  {row['started_at']}")
+        else:
+            for row in index.sessions_between(args.since, args.until, args.track):
+                print(f"{row['started_at']}  {row['track_name']}  {row['laps']} laps  {row['path']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Memory-mapped telemetry storage for Race Manager Pro
+
+High-frequency `TelemetrySample` streams (see docs/dev/DATA_MODEL.md) are kept
+out of the session results, one file per entry under a session's
+`telemetry/` directory:
+- `<entry_id>.tel`: fixed-dtype records (`TELEMETRY_DTYPE`), appended in chunks
+- `<entry_id>.idx.npz`: the time index (timestamp of every `INDEX_STRIDE`-th
+  record) and the record range of every lap
+
+Readers memory-map the record file, so slicing one lap or a time window
+returns a view and only the pages touched are read from disk.
+"""
+from pathlib import Path
+
+import numpy as np
+
+TELEMETRY_DIR = "telemetry"
+RECORD_SUFFIX = ".tel"
+INDEX_SUFFIX = ".idx.npz"
+INDEX_STRIDE = 1024  # records between time index entries
+
+TELEMETRY_DTYPE = np.dtype([
+    ("timestamp", "<f8"),  # seconds from session start
+    ("lap", "<u2"),
+    ("speed", "<f4"),  # km/h
+    ("rpm", "<f4"),
+    ("throttle", "<f4"),  # 0..1
+    ("brake", "<f4"),  # 0..1
+    ("gear", "i1"),
+    ("g_force", "<f4"),
+    ("steering_angle", "<f4"),  # degrees
+])
+
+
+def telemetry_dir(session_path):
+    return Path(session_path) / TELEMETRY_DIR
+
+
+class TelemetryWriter:
+    """
+    Appends telemetry records for one entry in chunks.
+
+    Records must arrive in timestamp order. The index file is written on
+    `close()`; use the writer as a context manager.
+    """
+    def __init__(self, session_path, entry_id):
+        directory = telemetry_dir(session_path)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.record_path = directory / f"{entry_id}{RECORD_SUFFIX}"
+        self.index_path = directory / f"{entry_id}{INDEX_SUFFIX}"
+        self._file = open(self.record_path, "wb")
+        self._count = 0
+        self._last_timestamp = -np.inf
+        self._index_times = []
+        self._lap_numbers = []
+        self._lap_starts = []
+
+    def append(self, records):
+        records = np.asarray(records)
+        if records.dtype != TELEMETRY_DTYPE:
+            raise TypeError(f"telemetry records must use TELEMETRY_DTYPE, got {records.dtype}")
+        if not len(records):
+            return
+        timestamps = records["timestamp"]
+        if timestamps[0] < self._last_timestamp or np.any(np.diff(timestamps) < 0):
+            raise ValueError("telemetry records must be appended in timestamp order")
+        # Time index: every INDEX_STRIDE-th record across the whole stream
+        first_indexed = -self._count % INDEX_STRIDE
+        self._index_times.extend(timestamps[first_indexed::INDEX_STRIDE].tolist())
+        # Lap index: record offsets where the lap number changes
+        laps = records["lap"]
+        changes = np.flatnonzero(np.diff(laps)) + 1
+        if not self._lap_numbers or self._lap_numbers[-1] != laps[0]:
+            changes = np.concatenate(([0], changes))
+        self._lap_numbers.extend(laps[changes].tolist())
+        self._lap_starts.extend((changes + self._count).tolist())
+
+        records.tofile(self._file)
+        self._count += len(records)
+        self._last_timestamp = timestamps[-1]
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.close()
+        np.savez(
+            self.index_path,
+            times=np.array(self._index_times, dtype=np.float64),
+            lap_numbers=np.array(self._lap_numbers, dtype=np.int64),
+            lap_bounds=np.array(self._lap_starts + [self._count], dtype=np.int64),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class EntryTelemetry:
+    """
+    Read-only, memory-mapped telemetry of one entry. Slices are views into the
+    mapped file; copy them if they must outlive the store.
+    """
+    def __init__(self, record_path, index_path):
+        size = record_path.stat().st_size // TELEMETRY_DTYPE.itemsize
+        if size:
+            self.records = np.memmap(record_path, dtype=TELEMETRY_DTYPE, mode="r", shape=(size,))
+        else:
+            self.records = np.empty(0, dtype=TELEMETRY_DTYPE)
+        with np.load(index_path) as index:
+            self._index_times = index["times"]
+            self._lap_numbers = index["lap_numbers"]
+            self._lap_bounds = index["lap_bounds"]
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def laps(self):
+        return self._lap_numbers.tolist()
+
+    def lap(self, lap_number):
+        """Records of one lap."""
+        matches = np.flatnonzero(self._lap_numbers == lap_number)
+        if not len(matches):
+            raise KeyError(f"no telemetry for lap {lap_number}")
+        idx = matches[0]
+        return self.records[self._lap_bounds[idx]:self._lap_bounds[idx + 1]]
+
+    def _search(self, timestamp, side):
+        # Narrow to one index stride, then search only that block of records
+        block = max(np.searchsorted(self._index_times, timestamp, side=side) - 1, 0)
+        start = block * INDEX_STRIDE
+        stop = min(start + 2 * INDEX_STRIDE, len(self.records))
+        return start + np.searchsorted(self.records["timestamp"][start:stop], timestamp, side=side)
+
+    def window(self, start_time, end_time):
+        """Records with `start_time <= timestamp < end_time`."""
+        return self.records[self._search(start_time, "left"):self._search(end_time, "left")]
+
+
+class TelemetryStore:
+    """Telemetry for every entry of one session directory."""
+    def __init__(self, session_path):
+        self.path = telemetry_dir(session_path)
+        self._open = {}
+
+    def entry_ids(self):
+        if not self.path.exists():
+            return []
+        return sorted(p.name[:-len(RECORD_SUFFIX)] for p in self.path.glob(f"*{RECORD_SUFFIX}"))
+
+    def writer(self, entry_id):
+        self._open.pop(entry_id, None)
+        return TelemetryWriter(self.path.parent, entry_id)
+
+    def entry(self, entry_id):
+        if entry_id not in self._open:
+            record_path = self.path / f"{entry_id}{RECORD_SUFFIX}"
+            if not record_path.exists():
+                raise KeyError(f"no telemetry for entry {entry_id}")
+            self._open[entry_id] = EntryTelemetry(record_path, self.path / f"{entry_id}{INDEX_SUFFIX}")
+        return self._open[entry_id]
+
+    def lap(self, entry_id, lap_number):
+        return self.entry(entry_id).lap(lap_number)
+
+    def window(self, entry_id, start_time, end_time):
+        return self.entry(entry_id).window(start_time, end_time)
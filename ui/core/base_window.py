@@ -1,18 +1,49 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QTabWidget, QTabBar,
-    QMenu, QToolButton, QInputDialog
+    QMenu, QToolButton, QInputDialog, QMessageBox, QProgressBar
 )
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QAction
+import logging
+from pathlib import Path
 
+from storage.session_cache import SESSION_STORE
+from ui.core.session_model import SessionModel
+from ui.core.tab_hibernation import DEFAULT_IDLE_SECONDS, TabHibernator, discard_widget
+from ui.core.tasks import task_runner
+from ui.core.view_layout import load_layout, restore_view, save_view, saved_views, view_path
 from ui.views.default_dashboard import DefaultDashboard
+from ui.widgets.base_panel import SAMPLE_SESSION_PATH
 from ui.widgets.registry import PANEL_REGISTRY
 
+logger = logging.getLogger("BaseWindow")
+
+# Size of the batch started from the Simulation menu
+MONTE_CARLO_RUNS = 1000
+# Speeds offered by the Replay menu
+REPLAY_SPEEDS = (1, 5, 10, 50, 100)
+DEFAULT_FEED_ADDRESS = "127.0.0.1:9100"
+# How long closing the window waits for cancelled background tasks
+SHUTDOWN_WAIT_MS = 3000
+
+
+def monte_carlo_task(context, input_path, runs):
+    """Background task: run a Monte Carlo batch, reporting progress per chunk."""
+    # Imported here so the simulation engine does not load with the window
+    import multiprocessing
+    from sim.monte_carlo import run_monte_carlo
+    from sim.simple_race_sim import INPUT_FILE, load_race_data
+    if input_path is None:
+        input_path = INPUT_FILE
+    # Worker processes are spawned, not forked, so they never inherit Qt state
+    return run_monte_carlo(load_race_data(input_path), runs, progress=context.report,
+                           mp_context=multiprocessing.get_context("spawn"))
+
 
 class BaseWindow(QMainWindow):
     edit_mode_changed = Signal(bool)
 
-    def __init__(self):
+    def __init__(self, hibernate_after=DEFAULT_IDLE_SECONDS):
         super().__init__()
 
         self.setMinimumSize(800, 600)
@@ -37,6 +68,55 @@ class BaseWindow(QMainWindow):
 
         self.edit_mode = False
 
+        # The session every session-following panel shows (see PanelSpec.follows_session)
+        self.session_model = SessionModel(self)
+        # Bumped whenever a new source takes over the model, so a load still
+        # running for an older source is dropped when it finishes
+        self._session_generation = 0
+        self.session_load_task = None
+        self.load_session_file(SAMPLE_SESSION_PATH)
+        # Sources that play into the shared model: at most one at a time
+        self.replay_controller = None
+        self.live_feed = None
+
+        # Tabs left unviewed for `hibernate_after` seconds release their panels
+        self.hibernator = TabHibernator(self.tab_widget, hibernate_after, self)
+
+        # Background simulation status
+        self.simulation_task = None
+        self.simulation_progress = QProgressBar()
+        self.simulation_progress.setMaximumWidth(200)
+        self.simulation_progress.setVisible(False)
+        self.statusBar().addPermanentWidget(self.simulation_progress)
+
+    def load_session_file(self, path):
+        """Load a results file into the shared SessionModel, parsing it on a pool thread."""
+        path = Path(path)
+        generation = self._take_session_model()
+        if not path.exists():
+            logger.warning(f"Session file not found: {path}")
+            return None
+        self.session_load_task = task_runner().submit(
+            lambda context: (generation, SESSION_STORE.get(path)),
+            on_finished=self._on_session_file_loaded, on_failed=self._on_session_load_failed,
+            name=f"load {path.name}")
+        return self.session_load_task
+
+    def _take_session_model(self):
+        """Hand the shared SessionModel to a new source; returns its generation."""
+        if self.session_load_task is not None:
+            self.session_load_task.cancel()
+            self.session_load_task = None
+        self._session_generation += 1
+        return self._session_generation
+
+    def _on_session_file_loaded(self, loaded):
+        generation, results = loaded
+        if generation != self._session_generation:
+            return
+        self.session_load_task = None
+        self.session_model.load_results(results)
+
     def add_tab(self, widget: QWidget, title: str, start_in_edit_mode=False):
         index = self.tab_widget.addTab(widget, title)
         self.tab_widget.setCurrentIndex(index)
@@ -72,11 +152,13 @@ class BaseWindow(QMainWindow):
             add_panel_h_action.triggered.connect(lambda: self._add_panel_to_current_view("horizontal"))
             menu.addAction(add_panel_h_action)
 
-            # Add Panel submenu for all registered panels
+            # Add Panel submenu for all registered panels (built from metadata; nothing is imported here)
             add_panel_menu = QMenu("Add Panel", button)
-            for panel_name, panel_cls in PANEL_REGISTRY.items():
+            add_panel_menu.setToolTipsVisible(True)
+            for panel_name, panel_spec in PANEL_REGISTRY.items():
                 action = QAction(panel_name, button)
-                action.triggered.connect(lambda checked, cls=panel_cls: self._add_panel_to_current_dashboard(cls))
+                action.setToolTip(panel_spec.description)
+                action.triggered.connect(lambda checked, spec=panel_spec: self._add_panel_to_current_dashboard(spec))
                 add_panel_menu.addAction(action)
             menu.addMenu(add_panel_menu)
 
@@ -102,11 +184,33 @@ class BaseWindow(QMainWindow):
         default_view_action = QAction("Default View", button)
         default_view_action.triggered.connect(self.switch_current_tab_to_default_dashboard)
         switch_view_menu.addAction(default_view_action)
-        # Placeholder: populate with saved views in future
-        switch_view_menu.addAction(QAction("No saved views", button))
+        views = saved_views()
+        for view_name, path in views:
+            view_action = QAction(view_name, button)
+            view_action.triggered.connect(lambda checked, p=path: self.switch_current_tab_to_view(p))
+            switch_view_menu.addAction(view_action)
+        if not views:
+            no_views_action = QAction("No saved views", button)
+            no_views_action.setEnabled(False)
+            switch_view_menu.addAction(no_views_action)
         views_menu.addMenu(switch_view_menu)
         menu.addMenu(views_menu)
 
+        # Simulation submenu: runs in the background, the window stays usable
+        simulation_menu = QMenu("Simulation", button)
+        run_action = QAction(f"Run Monte Carlo ({MONTE_CARLO_RUNS} runs)", button)
+        run_action.setEnabled(self.simulation_task is None)
+        run_action.triggered.connect(self.run_monte_carlo)
+        simulation_menu.addAction(run_action)
+        cancel_action = QAction("Cancel Simulation", button)
+        cancel_action.setEnabled(self.simulation_task is not None)
+        cancel_action.triggered.connect(self.cancel_simulation)
+        simulation_menu.addAction(cancel_action)
+        menu.addMenu(simulation_menu)
+
+        # Replay submenu: plays a saved session, or a live feed, into the shared SessionModel
+        menu.addMenu(self._build_replay_menu(button))
+
         edit_toggle_action = QAction("Toggle Edit Mode", button)
         edit_toggle_action.triggered.connect(self.toggle_edit_mode)
         menu.addAction(edit_toggle_action)
@@ -114,6 +218,44 @@ class BaseWindow(QMainWindow):
         button.setMenu(menu)
         tab_bar.setTabButton(index, QTabBar.RightSide, button)
 
+    def _build_replay_menu(self, parent):
+        replay_menu = QMenu("Replay", parent)
+        replay_session_action = QAction("Replay Session...", parent)
+        replay_session_action.triggered.connect(self.choose_replay_session)
+        replay_menu.addAction(replay_session_action)
+        controller = self.replay_controller
+        playing = controller is not None and controller.clock.playing
+        pause_action = QAction("Pause Replay" if playing else "Resume Replay", parent)
+        pause_action.setEnabled(controller is not None)
+        pause_action.triggered.connect(self.toggle_replay)
+        replay_menu.addAction(pause_action)
+        speed_menu = QMenu("Speed", parent)
+        speed_menu.setEnabled(controller is not None)
+        for speed in REPLAY_SPEEDS:
+            speed_action = QAction(f"{speed}x", parent)
+            speed_action.setCheckable(True)
+            speed_action.setChecked(controller is not None and controller.speed == speed)
+            speed_action.triggered.connect(lambda checked, s=speed: self.set_replay_speed(s))
+            speed_menu.addAction(speed_action)
+        replay_menu.addMenu(speed_menu)
+        seek_action = QAction("Seek...", parent)
+        seek_action.setEnabled(controller is not None)
+        seek_action.triggered.connect(self.choose_replay_time)
+        replay_menu.addAction(seek_action)
+        stop_action = QAction("Stop Replay", parent)
+        stop_action.setEnabled(controller is not None)
+        stop_action.triggered.connect(self.stop_replay)
+        replay_menu.addAction(stop_action)
+        replay_menu.addSeparator()
+        connect_action = QAction("Connect Live Feed...", parent)
+        connect_action.triggered.connect(self.choose_live_feed)
+        replay_menu.addAction(connect_action)
+        disconnect_action = QAction("Disconnect Live Feed", parent)
+        disconnect_action.setEnabled(self.live_feed is not None)
+        disconnect_action.triggered.connect(self.disconnect_live_feed)
+        replay_menu.addAction(disconnect_action)
+        return replay_menu
+
     def toggle_edit_mode(self):
         self.edit_mode = not self.edit_mode
         self.edit_mode_changed.emit(self.edit_mode)
@@ -128,10 +270,54 @@ class BaseWindow(QMainWindow):
         self.add_tab(BlankDashboard(), "Blank Dashboard", start_in_edit_mode=True)
 
     def save_current_view(self):
-        print("Save view (not yet implemented)")
+        current_index = self.tab_widget.currentIndex()
+        current_widget = self.tab_widget.currentWidget()
+        if current_index < 0 or not hasattr(current_widget, "root_divider"):
+            return
+        name = self.tab_widget.tabText(current_index)
+        if view_path(name).exists():
+            answer = QMessageBox.question(self, "Save View",
+                                          f"A view is already saved as '{view_path(name).stem}'. Replace it?")
+            if answer != QMessageBox.Yes:
+                return
+        path = save_view(current_widget, name, overwrite=True)
+        self.statusBar().showMessage(f"View '{name}' saved to {path.name}")
+        self._refresh_dropdown()
 
     def load_view(self):
-        print("Load view (not yet implemented)")
+        views = saved_views()
+        if not views:
+            self.statusBar().showMessage("No saved views.")
+            return
+        names = [view_name for view_name, _ in views]
+        name, ok = QInputDialog.getItem(self, "Load View", "Saved view:", names, 0, False)
+        if ok:
+            path = views[names.index(name)][1]
+            restored = self._restore_saved_view(path)
+            if restored is not None:
+                self.add_tab(restored[0], name, start_in_edit_mode=self.edit_mode)
+
+    def switch_current_tab_to_view(self, path):
+        current_index = self.tab_widget.currentIndex()
+        if current_index < 0:
+            return
+        restored = self._restore_saved_view(path)
+        if restored is None:
+            return
+        new_widget, name = restored
+        self.edit_mode_changed.connect(new_widget.set_edit_mode)
+        self._replace_tab(current_index, new_widget, name)
+
+    def _restore_saved_view(self, path):
+        """(dashboard, name) restored from a saved view file, or None after reporting why it cannot be."""
+        try:
+            layout = load_layout(path)
+            new_widget = restore_view(layout, self.edit_mode)
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Cannot load view {path}: {exc}")
+            self.statusBar().showMessage(f"Could not load view {Path(path).name}: {exc}")
+            return None
+        return new_widget, layout.get("name", Path(path).stem)
 
     def rename_current_view(self):
         current_index = self.tab_widget.currentIndex()
@@ -151,10 +337,15 @@ class BaseWindow(QMainWindow):
         if hasattr(new_widget, "set_edit_mode"):
             self.edit_mode_changed.connect(new_widget.set_edit_mode)
             new_widget.set_edit_mode(self.edit_mode)
-        # Replace widget in current tab
-        self.tab_widget.removeTab(current_index)
-        self.tab_widget.insertTab(current_index, new_widget, "Default View")
-        self.tab_widget.setCurrentIndex(current_index)
+        self._replace_tab(current_index, new_widget, "Default View")
+
+    def _replace_tab(self, index, new_widget, title):
+        """Put `new_widget` in tab `index`, disposing of the page it replaces and its panels."""
+        old_widget = self.tab_widget.widget(index)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, new_widget, title)
+        self.tab_widget.setCurrentIndex(index)
+        discard_widget(old_widget)
 
     def _add_panel_to_current_view(self, orientation):
         current_widget = self.tab_widget.currentWidget()
@@ -168,4 +359,193 @@ class BaseWindow(QMainWindow):
             from ui.widgets.doc_viewer_widget import DocViewerWidget
             panel_cls = DocViewerWidget
         if hasattr(current_widget, "add_widget"):
-            current_widget.add_widget(panel_cls)
\ No newline at end of file
+            current_widget.add_widget(panel_cls)
+
+    def run_monte_carlo(self, input_path=None, runs=MONTE_CARLO_RUNS):
+        if self.simulation_task is not None:
+            return self.simulation_task
+        self.simulation_progress.setRange(0, runs)
+        self.simulation_progress.setValue(0)
+        self.simulation_progress.setVisible(True)
+        self.statusBar().showMessage(f"Running {runs} simulations...")
+        self.simulation_task = task_runner().submit(
+            monte_carlo_task, input_path, runs, name="monte carlo",
+            on_progress=self._on_simulation_progress,
+            on_finished=self._on_simulation_finished,
+            on_failed=self._on_simulation_failed,
+            on_cancelled=self._on_simulation_cancelled,
+        )
+        self._refresh_dropdown()
+        return self.simulation_task
+
+    def cancel_simulation(self):
+        if self.simulation_task is not None:
+            self.simulation_task.cancel()
+            self.statusBar().showMessage("Cancelling simulation...")
+
+    def _on_simulation_progress(self, done, total):
+        self.simulation_progress.setValue(done)
+
+    def _on_simulation_finished(self, summary):
+        favourite = max(summary["entries"], key=lambda entry: entry["win_probability"])
+        message = (f"{summary['track']['name']}: {summary['runs']} runs, favourite "
+                   f"{favourite['driver']['name']} ({favourite['win_probability']:.1%} wins)")
+        logger.info(message)
+        self._end_simulation(message)
+
+    def _on_simulation_failed(self, error):
+        self._end_simulation("Simulation failed; see the log for details.")
+
+    def _on_simulation_cancelled(self):
+        self._end_simulation("Simulation cancelled.")
+
+    def _end_simulation(self, message):
+        self.simulation_task = None
+        self.simulation_progress.setVisible(False)
+        self.statusBar().showMessage(message)
+        self._refresh_dropdown()
+
+    def _refresh_dropdown(self):
+        if self.tab_widget.currentIndex() >= 0:
+            self.add_dropdown_to_active_tab(self.tab_widget.currentIndex())
+
+    # --- Replay and live feed ---
+
+    def choose_replay_session(self):
+        from storage.session_index import SESSIONS_DIR, session_paths
+        paths = session_paths(SESSIONS_DIR) if SESSIONS_DIR.exists() else []
+        if not paths:
+            self.statusBar().showMessage("No saved sessions to replay.")
+            return
+        names = [path.name for path in paths]
+        name, ok = QInputDialog.getItem(self, "Replay Session", "Session:", names, len(names) - 1, False)
+        if ok:
+            self.start_replay(paths[names.index(name)])
+
+    def start_replay(self, path, speed=1.0):
+        """
+        Play the session at `path` into the shared SessionModel from the start.
+        The session is opened on a pool thread and plays once it is loaded.
+        """
+        from live.replay import open_replay_session
+        self.stop_replay()
+        self.disconnect_live_feed()
+        generation = self._take_session_model()
+        path = Path(path)
+        self.statusBar().showMessage(f"Loading {path.name}...")
+        self.session_load_task = task_runner().submit(
+            lambda context: (generation, path, speed, open_replay_session(path)),
+            on_finished=self._on_replay_loaded, on_failed=self._on_session_load_failed,
+            name=f"replay {path.name}")
+        return self.session_load_task
+
+    def _on_replay_loaded(self, loaded):
+        from ui.core.replay_controller import ReplayController
+        generation, path, speed, (results, telemetry) = loaded
+        if generation != self._session_generation:
+            return
+        self.session_load_task = None
+        try:
+            controller = ReplayController(self.session_model, results, telemetry, self)
+        except (KeyError, TypeError, ValueError):
+            logger.exception(f"Cannot replay {path}")
+            self.statusBar().showMessage(f"{path.name} is not a replayable session.")
+            return
+        self.replay_controller = controller
+        controller.finished.connect(lambda: self.statusBar().showMessage(f"Replay of {path.name} finished."))
+        controller.set_speed(speed)
+        controller.play()
+        logger.info(f"Replaying {path.name} at {controller.speed:g}x")
+        self.statusBar().showMessage(f"Replaying {path.name}")
+        self._refresh_dropdown()
+
+    def _on_session_load_failed(self, error):
+        # Only report the load still wanted; an older one failing is moot
+        if self.sender() is not self.session_load_task:
+            return
+        name = self.session_load_task.name
+        self.session_load_task = None
+        self.statusBar().showMessage(f"Could not {name}; see the log for details.")
+
+    def toggle_replay(self):
+        controller = self.replay_controller
+        if controller is None:
+            return
+        if controller.clock.playing:
+            controller.pause()
+        else:
+            controller.play()
+        self._refresh_dropdown()
+
+    def set_replay_speed(self, speed):
+        if self.replay_controller is not None:
+            self.replay_controller.set_speed(speed)
+            self._refresh_dropdown()
+
+    def choose_replay_time(self):
+        controller = self.replay_controller
+        if controller is None:
+            return
+        race_time, ok = QInputDialog.getDouble(self, "Seek", "Race time (s):", controller.clock.race_time(),
+                                               0.0, controller.index.duration, 1)
+        if ok:
+            controller.seek(race_time)
+
+    def stop_replay(self):
+        if self.replay_controller is None:
+            return
+        self.replay_controller.pause()
+        self.replay_controller.deleteLater()
+        self.replay_controller = None
+        self._refresh_dropdown()
+
+    def choose_live_feed(self):
+        address, ok = QInputDialog.getText(self, "Connect Live Feed", "TCP feed (host:port):",
+                                           text=DEFAULT_FEED_ADDRESS)
+        if ok and address.strip():
+            try:
+                self.connect_live_feed(address.strip())
+            except ValueError:
+                self.statusBar().showMessage(f"Invalid feed address: {address}")
+
+    def connect_live_feed(self, address):
+        """Follow the TCP live timing feed at `address` (host:port) in the shared SessionModel."""
+        from live.feed_server import parse_address
+        from ui.core.live_feed import LiveFeed
+        host, port = parse_address(address)
+        self.stop_replay()
+        self.disconnect_live_feed()
+        self._take_session_model()
+        self.live_feed = LiveFeed(self.session_model, self)
+        self.live_feed.feed_ended.connect(lambda: self.statusBar().showMessage("Live feed ended."))
+        self.live_feed.feed_failed.connect(self._on_live_feed_failed)
+        self.live_feed.connect_tcp(host, port)
+        logger.info(f"Connecting to live feed {host}:{port}")
+        self.statusBar().showMessage(f"Connecting to live feed {host}:{port}...")
+        self._refresh_dropdown()
+        return self.live_feed
+
+    def _on_live_feed_failed(self, message):
+        if self.sender() is not self.live_feed:
+            return
+        self.disconnect_live_feed()
+        self.statusBar().showMessage(f"Live feed failed: {message}")
+
+    def disconnect_live_feed(self):
+        if self.live_feed is None:
+            return
+        self.live_feed.stop()
+        self.live_feed.deleteLater()
+        self.live_feed = None
+        self._refresh_dropdown()
+
+    def closeEvent(self, event):
+        self.stop_replay()
+        self.disconnect_live_feed()
+        # Let background work stop at its next progress point before Qt tears down
+        runner = task_runner()
+        runner.cancel_all()
+        if not runner.wait(SHUTDOWN_WAIT_MS):
+            names = ", ".join(task.name for task in runner.active_tasks())
+            logger.warning(f"Closing with background tasks still running after {SHUTDOWN_WAIT_MS} ms: {names}")
+        super().closeEvent(event)
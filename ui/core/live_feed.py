@@ -0,0 +1,84 @@
+from PySide6.QtCore import QObject, Signal
+from collections import Counter
+import logging
+
+from live.ingest import LiveIngest
+
+logger = logging.getLogger("LiveFeed")
+
+
+class LiveFeed(QObject):
+    """
+    LiveFeed connects the background LiveIngest pipeline to a SessionModel.
+    Batches decoded on the ingestion thread cross to the GUI thread through a
+    queued signal and are applied to the model with one append_laps call per
+    run of lap messages, so the model re-ranks once per batch, not per lap.
+    """
+    batch_received = Signal(list)
+    telemetry_received = Signal(str, list)  # entry_id, samples
+    feed_ended = Signal()
+    feed_failed = Signal(str)  # error message
+    connection_error = Signal(str)  # emitted on the ingestion thread
+
+
+    def __init__(self, session_model, parent=None):
+        super().__init__(parent)
+        self.session_model = session_model
+        self.ingest = LiveIngest(self.batch_received.emit)
+        self.batch_received.connect(self.apply_batch)
+        self.connection_error.connect(self._on_connection_error)
+
+    def connect_tcp(self, host, port):
+        future = self.ingest.connect_tcp(host, port)
+        future.add_done_callback(lambda done: self._check_connection(done, f"{host}:{port}"))
+        return future
+
+    def listen_udp(self, host, port):
+        return self.ingest.listen_udp(host, port)
+
+    def stop(self):
+        self.ingest.stop()
+
+    def _check_connection(self, future, address):
+        # Called on the ingestion thread when a TCP reader ends
+        if future.cancelled() or future.exception() is None:
+            return
+        self.connection_error.emit(f"{address}: {future.exception()}")
+
+    def _on_connection_error(self, message):
+        logger.warning(f"Live feed failed: {message}")
+        self.feed_failed.emit(message)
+
+    def apply_batch(self, batch):
+        model = self.session_model
+        laps = []
+        pending = Counter()  # laps of each row queued in `laps`
+        for message in batch:
+            kind = message["type"]
+            if kind == "lap":
+                try:
+                    row = model.row_of(message["entry_id"])
+                except KeyError:
+                    continue
+                # Datagram feeds can duplicate laps; only the next lap is accepted
+                if message["lap"] == model.lap_counts[row] + 1 + pending[row]:
+                    laps.append((row, message["lap_time"]))
+                    pending[row] += 1
+                continue
+            # Keep message order: apply the laps seen so far before anything else
+            model.append_laps(laps)
+            laps = []
+            pending.clear()
+            if kind == "session":
+                model.start_session(message["track"], message["entries"])
+            elif kind == "status":
+                try:
+                    model.set_status(model.row_of(message["entry_id"]), message["status"])
+                except KeyError:
+                    continue
+            elif kind == "telemetry":
+                self.telemetry_received.emit(message["entry_id"], message["samples"])
+            elif kind == "end":
+                logger.info("Live feed ended")
+                self.feed_ended.emit()
+        model.append_laps(laps)
@@ -0,0 +1,199 @@
+"""
+Startup and hot-path timing instrumentation for Race Manager Pro
+
+The shared `PROFILER` records named timings: module imports (through an
+import hook), explicit `section`s such as QApplication creation, and panel or
+dashboard constructors wrapped with `profile_init`. It is disabled unless
+`enable()` is called (main.py does so for --startup-report), and costs one
+attribute check per call site while disabled.
+
+This module only uses the standard library so it can be imported, and the
+import hook installed, before PySide6 or any other heavy dependency.
+"""
+import functools
+import importlib.abc
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Timing:
+    """Aggregated durations (seconds) recorded under one name."""
+    __slots__ = ("name", "category", "count", "total", "max", "first_start")
+
+    def __init__(self, name, category, first_start):
+        self.name = name
+        self.category = category
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.first_start = first_start
+
+    def add(self, duration):
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "category": self.category,
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "start_ms": round(self.first_start * 1000, 3),
+        }
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a module loader so executing the module is timed."""
+    def __init__(self, loader, profiler):
+        self.loader = loader
+        self.profiler = profiler
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        with self.profiler.section(module.__name__, "import"):
+            self.loader.exec_module(module)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta path hook timing every module executed after it is installed (inclusive of nested imports)."""
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self._finding = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._finding, "active", False):
+            return None
+        self._finding.active = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._finding.active = False
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self.profiler)
+        return spec
+
+
+class Profiler:
+    """Collects Timings; see the module docstring."""
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.timings = {}
+        self.marks = []
+        self._lock = threading.Lock()
+        self._import_timer = None
+
+    def enable(self, imports=True):
+        """Start recording; with `imports`, time every module imported from now on."""
+        self.enabled = True
+        if imports and self._import_timer is None:
+            self._import_timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._import_timer)
+
+    def disable(self):
+        self.enabled = False
+        if self._import_timer is not None:
+            sys.meta_path.remove(self._import_timer)
+            self._import_timer = None
+
+    def record(self, name, category, start, duration):
+        with self._lock:
+            timing = self.timings.get((category, name))
+            if timing is None:
+                timing = self.timings[(category, name)] = Timing(name, category, start - self.origin)
+            timing.add(duration)
+
+    @contextmanager
+    def section(self, name, category="section"):
+        """Time the enclosed block under `name` (a no-op while disabled)."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, time.perf_counter() - start)
+
+    def mark(self, name):
+        """Record a point in time since the profiler was created (e.g. "window shown")."""
+        if self.enabled:
+            self.marks.append((name, time.perf_counter() - self.origin))
+
+    def report(self, category=None):
+        """Timings as dicts, slowest first, optionally for one category."""
+        timings = [t for t in self.timings.values() if category is None or t.category == category]
+        return [t.to_dict() for t in sorted(timings, key=lambda t: t.total, reverse=True)]
+
+    def format_report(self, limit=25):
+        lines = ["Marks (ms since the profiler was created):"]
+        lines += [f"  {elapsed * 1000:9.1f}  {name}" for name, elapsed in self.marks]
+        categories = sorted({t.category for t in self.timings.values()})
+        for category in categories:
+            rows = self.report(category)
+            lines.append(f"{category} ({len(rows)} recorded, slowest {min(limit, len(rows))}):")
+            lines.append(f"  {'total ms':>9} {'max ms':>9} {'count':>6}  name")
+            for row in rows[:limit]:
+                lines.append(f"  {row['total_ms']:9.1f} {row['max_ms']:9.1f} {row['count']:6d}  {row['name']}")
+        return "\n".join(lines)
+
+    def dump(self, path):
+        """Write the report to `path`: JSON for a .json file, a text table otherwise."""
+        path = str(path)
+        with open(path, "w", encoding="utf-8") as f:
+            if path.endswith(".json"):
+                json.dump({
+                    "marks": [{"name": name, "ms": round(elapsed * 1000, 3)} for name, elapsed in self.marks],
+                    "timings": self.report(),
+                }, f, indent=2)
+            else:
+                f.write(self.format_report() + "\n")
+
+
+PROFILER = Profiler()
+
+_constructing = threading.local()
+
+
+def profile_init(cls):
+    """
+    Class decorator timing the constructor of `cls` under its class name. Only
+    the outermost profiled constructor is recorded, so a subclass whose
+    __init__ calls super().__init__() is counted once.
+    """
+    init = cls.__init__
+
+    @functools.wraps(init)
+    def __init__(self, *args, **kwargs):
+        if not PROFILER.enabled:
+            return init(self, *args, **kwargs)
+        constructing = _constructing.__dict__.setdefault("objects", set())
+        if id(self) in constructing:
+            return init(self, *args, **kwargs)
+        constructing.add(id(self))
+        start = time.perf_counter()
+        try:
+            return init(self, *args, **kwargs)
+        finally:
+            constructing.discard(id(self))
+            PROFILER.record(type(self).__name__, "construct", start, time.perf_counter() - start)
+
+    cls.__init__ = __init__
+    return cls
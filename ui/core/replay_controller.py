@@ -0,0 +1,72 @@
+from PySide6.QtCore import QObject, QTimer, Signal
+import logging
+
+from live.replay import ReplayClock, ReplayIndex
+
+logger = logging.getLogger("ReplayController")
+
+TICK_INTERVAL_MS = 33  # ~30 updates per second
+
+
+class ReplayController(QObject):
+    """
+    ReplayController plays a finished session into a SessionModel as if it
+    were live. Each timer tick appends the laps completed since the last tick
+    (one append_laps batch); seeking rebuilds the model state at the target
+    time from the replay index in one step instead of replaying from the start.
+    """
+    race_time_changed = Signal(float)
+    telemetry_received = Signal(str, object)  # entry_id, telemetry records
+    finished = Signal()
+
+    def __init__(self, session_model, results, telemetry=None, parent=None):
+        super().__init__(parent)
+        self.session_model = session_model
+        self.index = ReplayIndex(results, telemetry)
+        self.clock = ReplayClock(self.index.duration)
+        self._shown_time = 0.0
+        self._timer = QTimer(self)
+        self._timer.setInterval(TICK_INTERVAL_MS)
+        self._timer.timeout.connect(self._tick)
+        self.seek(0.0)
+
+    @property
+    def speed(self):
+        return self.clock.speed
+
+    def set_speed(self, speed):
+        self.clock.speed = speed
+
+    def play(self):
+        self.clock.play()
+        self._timer.start()
+
+    def pause(self):
+        self.clock.pause()
+        self._timer.stop()
+
+    def seek(self, race_time):
+        """Jump to `race_time` (seconds) without replaying the laps before it."""
+        self.clock.seek(race_time)
+        race_time = self.clock.race_time()
+        lap_counts = self.index.laps_completed_at(race_time)
+        statuses = ["finished" if done else "active" for done in (lap_counts == self.index.lap_counts).tolist()]
+        self.session_model.load_laps(self.index.track, self.index.entries, self.index.lap_times, lap_counts, statuses)
+        self._shown_time = race_time
+        self.race_time_changed.emit(race_time)
+
+    def _tick(self):
+        race_time = self.clock.race_time()
+        rows, laps, lap_times, _ = self.index.events_between(self._shown_time, race_time)
+        self.session_model.append_laps(zip(rows.tolist(), lap_times.tolist()))
+        for row in rows.tolist():
+            if self.session_model.lap_counts[row] == self.index.lap_counts[row]:
+                self.session_model.set_status(row, "finished")
+        for entry_id, records in self.index.telemetry_between(self._shown_time, race_time).items():
+            self.telemetry_received.emit(entry_id, records)
+        self._shown_time = race_time
+        self.race_time_changed.emit(race_time)
+        if race_time >= self.index.duration:
+            self.pause()
+            logger.info("Replay finished")
+            self.finished.emit()
@@ -0,0 +1,219 @@
+from PySide6.QtCore import QObject, Signal
+import logging
+import numpy as np
+
+from analysis.lap_chart import LapChart
+from analysis.session_stats import SessionStats
+from storage.columnar_session import entry_id_for, lap_time_matrix
+
+logger = logging.getLogger("SessionModel")
+
+INITIAL_LAP_CAPACITY = 64
+
+
+class SessionModel(QObject):
+    """
+    SessionModel is the central, observable state of one session. Lap times are
+    held in an entries x laps matrix; every change is announced through
+    fine-grained signals so panels can patch their views instead of rebuilding
+    them from a whole session dict.
+
+    Rows are entry indexes in the order the session was loaded or started.
+    """
+    session_reset = Signal()
+    lap_appended = Signal(int, int, float)  # row, lap number, lap time
+    position_changed = Signal(int, int, int)  # row, old position, new position
+    entry_status_changed = Signal(int, str)  # row, status
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.track = {}
+        self.entries = []
+        self._row_by_id = {}
+        self._lap_times = np.empty((0, 0))
+        self.lap_counts = np.zeros(0, dtype=np.int64)
+        self.total_times = np.zeros(0)
+        self.positions = np.zeros(0, dtype=np.int64)
+        self._lap_chart = None
+        self._chart_dirty_from = 0
+        self._stats = None
+        self._stats_dirty_rows = set()
+
+    # --- Loading ---
+
+    def start_session(self, track, entries):
+        """
+        Start an empty (live) session. `entries` are dicts with at least
+        `entry_id`, `driver` and `car`.
+        """
+        self.track = dict(track)
+        self.entries = [dict(entry, status=entry.get("status", "active")) for entry in entries]
+        self._row_by_id = {entry["entry_id"]: row for row, entry in enumerate(self.entries)}
+        count = len(self.entries)
+        self._lap_times = np.full((count, INITIAL_LAP_CAPACITY), np.nan)
+        self.lap_counts = np.zeros(count, dtype=np.int64)
+        self.total_times = np.zeros(count)
+        self.positions = np.arange(1, count + 1)
+        self._lap_chart = None
+        self._stats = None
+        logger.info(f"Session started: {self.track.get('name', 'N/A')} with {count} entries")
+        self.session_reset.emit()
+
+    def load_results(self, results):
+        """Load a finished session from the results JSON structure."""
+        rows = results.get("results", [])
+        self.track = dict(results.get("track", {}))
+        self.entries = [
+            {"entry_id": entry_id_for(row), "driver": row["driver"], "car": row["car"], "status": "finished"}
+            for row in rows
+        ]
+        self._row_by_id = {entry["entry_id"]: row for row, entry in enumerate(self.entries)}
+        self._lap_times = lap_time_matrix(results)
+        self.lap_counts = np.array([len(row["laps"]) for row in rows], dtype=np.int64)
+        self.total_times = np.nansum(self._lap_times, axis=1)
+        self.positions = self._rank()
+        self._lap_chart = None
+        self._stats = None
+        self.session_reset.emit()
+
+    def load_laps(self, track, entries, lap_times, lap_counts, statuses=None):
+        """
+        Load a partially completed session in one step (e.g. a replay seek):
+        entry `row` has completed the first `lap_counts[row]` laps of
+        `lap_times` (entries x laps). Emits a single session_reset.
+        """
+        lap_counts = np.asarray(lap_counts, dtype=np.int64)
+        laps = int(lap_counts.max()) if len(lap_counts) else 0
+        statuses = statuses or ["active"] * len(entries)
+        self.track = dict(track)
+        self.entries = [dict(entry, status=status) for entry, status in zip(entries, statuses)]
+        self._row_by_id = {entry["entry_id"]: row for row, entry in enumerate(self.entries)}
+        self._lap_times = np.full((len(entries), max(laps, INITIAL_LAP_CAPACITY)), np.nan)
+        completed = np.arange(laps) < lap_counts[:, None]
+        self._lap_times[:, :laps] = np.where(completed, lap_times[:, :laps], np.nan)
+        self.lap_counts = lap_counts.copy()
+        self.total_times = np.where(completed, lap_times[:, :laps], 0.0).sum(axis=1)
+        self.positions = self._rank()
+        self._lap_chart = None
+        self._stats = None
+        self.session_reset.emit()
+
+    # --- Live updates ---
+
+    def append_lap(self, row, lap_time):
+        """Append one completed lap for entry `row`."""
+        self.append_laps([(row, lap_time)])
+
+    def append_laps(self, laps):
+        """
+        Append a batch of `(row, lap_time)` laps. Positions are re-ranked once
+        for the whole batch; only rows whose position moved are signalled.
+        """
+        laps = list(laps)
+        if not laps:
+            return
+        for row, lap_time in laps:
+            lap_index = self.lap_counts[row]
+            self._ensure_capacity(lap_index + 1)
+            self._lap_times[row, lap_index] = lap_time
+            self._chart_dirty_from = min(self._chart_dirty_from, lap_index)
+            self._stats_dirty_rows.add(row)
+            self.lap_counts[row] = lap_index + 1
+            self.total_times[row] += lap_time
+            self.lap_appended.emit(row, int(lap_index + 1), float(lap_time))
+        self._update_positions()
+
+    def apply_snapshot(self, snapshot):
+        """Append one lap for every entry from a `sim.simple_race_sim.LapSnapshot`."""
+        self.append_laps(
+            (self._row_by_id[entry_id], lap_time)
+            for entry_id, lap_time in zip(snapshot.entry_ids, snapshot.lap_times.tolist())
+        )
+
+    def set_status(self, row, status):
+        if self.entries[row]["status"] == status:
+            return
+        self.entries[row]["status"] = status
+        self.entry_status_changed.emit(row, status)
+
+    # --- Accessors ---
+
+    def row_of(self, entry_id):
+        return self._row_by_id[entry_id]
+
+    def entry_count(self):
+        return len(self.entries)
+
+    def lap_count(self):
+        """Laps completed by the entry with the most laps."""
+        return int(self.lap_counts.max()) if len(self.lap_counts) else 0
+
+    def lap_matrix(self):
+        """Entries x laps view of lap times (NaN where a lap is not completed). Read-only by convention."""
+        return self._lap_times[:, :self.lap_count()]
+
+    def entry_laps(self, row):
+        return self._lap_times[row, :self.lap_counts[row]]
+
+    def lap_chart(self):
+        """
+        Position-per-lap chart of the session, shared by every view of this
+        model and extended only from the earliest lap changed since last asked.
+        """
+        if self._lap_chart is None:
+            self._lap_chart = LapChart(self.lap_matrix())
+        elif self._chart_dirty_from < self.lap_count():
+            self._lap_chart.update(self.lap_matrix(), self._chart_dirty_from)
+        self._chart_dirty_from = self.lap_count()
+        return self._lap_chart
+
+    def stats(self):
+        """Derived statistics (best lap, pace, gaps...), recomputed only for entries with new laps."""
+        if self._stats is None:
+            self._stats = SessionStats(self.lap_matrix())
+        elif self._stats_dirty_rows:
+            self._stats.update(self.lap_matrix(), self._stats_dirty_rows)
+        self._stats_dirty_rows = set()
+        return self._stats
+
+    def to_results(self):
+        """The session as the results JSON structure, in current position order."""
+        return {
+            "track": self.track,
+            "results": [
+                {
+                    "position": int(self.positions[row]),
+                    "driver": self.entries[row]["driver"],
+                    "car": self.entries[row]["car"],
+                    "total_time": float(self.total_times[row]),
+                    "laps": [
+                        {"lap": lap_num, "lap_time": lap_time}
+                        for lap_num, lap_time in enumerate(self.entry_laps(row).tolist(), 1)
+                    ],
+                }
+                for row in np.argsort(self.positions).tolist()
+            ],
+        }
+
+    # --- Internals ---
+
+    def _ensure_capacity(self, laps):
+        capacity = self._lap_times.shape[1]
+        if laps <= capacity:
+            return
+        grown = np.full((self._lap_times.shape[0], max(laps, capacity * 2, INITIAL_LAP_CAPACITY)), np.nan)
+        grown[:, :capacity] = self._lap_times
+        self._lap_times = grown
+
+    def _rank(self):
+        # More laps first, then lower total time; ties keep row order
+        order = np.lexsort((self.total_times, -self.lap_counts))
+        positions = np.empty(len(order), dtype=np.int64)
+        positions[order] = np.arange(1, len(order) + 1)
+        return positions
+
+    def _update_positions(self):
+        old = self.positions
+        self.positions = self._rank()
+        for row in np.flatnonzero(old != self.positions).tolist():
+            self.position_changed.emit(row, int(old[row]), int(self.positions[row]))
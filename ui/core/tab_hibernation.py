@@ -0,0 +1,122 @@
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtWidgets import QSplitter, QWidget
+import logging
+import time
+
+from ui.widgets.base_panel import BasePanel
+from ui.widgets.panel_placeholder import PanelPlaceholder
+from ui.widgets.registry import panel_name_for
+
+logger = logging.getLogger("TabHibernator")
+
+# Tabs not viewed for this long release their panels
+DEFAULT_IDLE_SECONDS = 10 * 60
+CHECK_INTERVAL_MS = 30 * 1000
+
+
+def _panels_under(root):
+    """(splitter, index, panel) of every BasePanel in the container tree under `root`."""
+    for splitter in root.findChildren(QSplitter):
+        for index in range(splitter.count()):
+            panel = splitter.widget(index)
+            if isinstance(panel, BasePanel):
+                yield splitter, index, panel
+
+
+def discard_widget(root):
+    """
+    Dispose of a tab page that is being replaced: every panel under `root`
+    releases its internals and session subscription through cleanup(), then
+    the page is deleted. Returns the number of panels cleaned up.
+    """
+    panels = [panel for _, _, panel in _panels_under(root)]
+    for panel in panels:
+        panel.cleanup()
+    root.deleteLater()
+    return len(panels)
+
+
+def hibernate_widget(root):
+    """
+    Replace every registered panel under `root` by a PanelPlaceholder holding
+    its saved state, after letting the panel release its internals through
+    cleanup(). The container tree and splitter sizes stay in place; each panel
+    is rebuilt when it is shown again. Returns the number of panels released.
+    """
+    released = 0
+    for splitter, index, panel in _panels_under(root):
+        name = panel_name_for(panel)
+        if name is None:
+            continue
+        placeholder = PanelPlaceholder(name, panel.save_state(), panel.session_model)
+        placeholder.set_edit_mode(panel.edit_mode)
+        panel.cleanup()
+        splitter.replaceWidget(index, placeholder)
+        owner = splitter.parentWidget()
+        children = getattr(owner, "children_widgets", None)
+        if children is not None and panel in children:
+            children[children.index(panel)] = placeholder
+        panel.deleteLater()
+        released += 1
+    return released
+
+
+class TabHibernator(QObject):
+    """
+    TabHibernator watches a QTabWidget and hibernates tabs that have not been
+    the current tab for `idle_seconds` (see hibernate_widget). Activating a
+    hibernated tab shows its placeholders, which rebuild the panels.
+    """
+    tab_hibernated = Signal(QWidget, int)  # tab page, panels released
+
+    def __init__(self, tab_widget, idle_seconds=DEFAULT_IDLE_SECONDS, parent=None):
+        super().__init__(parent)
+        self.tab_widget = tab_widget
+        self._inactive_since = {}
+        self._timer = QTimer(self)
+        self._timer.setInterval(CHECK_INTERVAL_MS)
+        self._timer.timeout.connect(self.check)
+        tab_widget.currentChanged.connect(self._on_current_changed)
+        self.set_idle_seconds(idle_seconds)
+
+    def set_idle_seconds(self, idle_seconds):
+        """Change the idle time before hibernation; 0 or None disables it."""
+        self.idle_seconds = idle_seconds
+        if idle_seconds:
+            self._timer.setInterval(min(CHECK_INTERVAL_MS, max(1000, int(idle_seconds * 1000) // 2)))
+            self._timer.start()
+        else:
+            self._timer.stop()
+
+    def _on_current_changed(self, index):
+        now = time.monotonic()
+        current = self.tab_widget.widget(index)
+        for i in range(self.tab_widget.count()):
+            page = self.tab_widget.widget(i)
+            if page is not current:
+                self._inactive_since.setdefault(page, now)
+        self._inactive_since.pop(current, None)
+
+    def check(self):
+        """Hibernate every tab that has been inactive for at least idle_seconds."""
+        if not self.idle_seconds:
+            return
+        now = time.monotonic()
+        current = self.tab_widget.currentWidget()
+        pages = [self.tab_widget.widget(i) for i in range(self.tab_widget.count())]
+        # Forget tabs that were closed
+        self._inactive_since = {page: since for page, since in self._inactive_since.items() if page in pages}
+        for page in pages:
+            if page is current:
+                continue
+            since = self._inactive_since.setdefault(page, now)
+            if now - since >= self.idle_seconds:
+                self.hibernate(page)
+
+    def hibernate(self, page):
+        released = hibernate_widget(page)
+        if released:
+            logger.info(f"Hibernated tab '{self.tab_widget.tabText(self.tab_widget.indexOf(page))}' "
+                        f"({released} panels released)")
+            self.tab_hibernated.emit(page, released)
+        return released
@@ -0,0 +1,148 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+import logging
+import threading
+import traceback
+
+logger = logging.getLogger("TaskRunner")
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task function when its task has been cancelled."""
+
+
+class TaskContext:
+    """
+    Handed to a task function as its first argument. Long-running work calls
+    report(done, total) as it goes; that publishes progress and raises
+    TaskCancelled once the task has been cancelled, so cancellation takes
+    effect at the next progress point.
+    """
+    def __init__(self, task):
+        self._task = task
+
+    @property
+    def cancelled(self):
+        return self._task.is_cancelled()
+
+    def check_cancelled(self):
+        if self._task.is_cancelled():
+            raise TaskCancelled()
+
+    def report(self, done, total):
+        self.check_cancelled()
+        self._task.progress.emit(int(done), int(total))
+
+
+class Task(QObject):
+    """
+    Task is one unit of background work: func(context, *args, **kwargs) run on
+    a pool thread. The task object lives on the GUI thread, so its signals are
+    delivered there; exactly one of finished, failed or cancelled is emitted.
+    """
+    progress = Signal(int, int)  # done, total
+    finished = Signal(object)  # result
+    failed = Signal(str)  # formatted exception
+    cancelled = Signal()
+
+    def __init__(self, func, *args, name=None, **kwargs):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.name = name or getattr(func, "__name__", "task")
+        self._cancel_event = threading.Event()
+        self.done = False
+
+    def cancel(self):
+        """Ask the task to stop; it ends with `cancelled` at its next progress point."""
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def run(self):
+        """Execute the task on the calling thread and emit its outcome."""
+        try:
+            if self.is_cancelled():
+                raise TaskCancelled()
+            result = self.func(TaskContext(self), *self.args, **self.kwargs)
+            if self.is_cancelled():
+                raise TaskCancelled()
+        except TaskCancelled:
+            logger.info(f"Task {self.name} cancelled")
+            self.done = True
+            self.cancelled.emit()
+        except Exception:
+            logger.exception(f"Task {self.name} failed")
+            self.done = True
+            self.failed.emit(traceback.format_exc())
+        else:
+            self.done = True
+            self.finished.emit(result)
+
+
+class _TaskRunnable(QRunnable):
+    def __init__(self, task):
+        super().__init__()
+        self.task = task
+
+    def run(self):
+        self.task.run()
+
+
+class TaskRunner(QObject):
+    """
+    TaskRunner submits Tasks to a QThreadPool and keeps them alive until they
+    end. Callers connect to the returned Task's signals for progress and the
+    result, which arrive on the GUI thread.
+    """
+    def __init__(self, pool=None, parent=None):
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self._active = set()
+
+    def submit(self, func, *args, on_finished=None, on_failed=None, on_progress=None,
+               on_cancelled=None, name=None, **kwargs):
+        """Run func(context, *args, **kwargs) in the background and return its Task."""
+        task = Task(func, *args, name=name, **kwargs)
+        # Connected to bound methods of GUI-thread objects, these are queued calls
+        task.finished.connect(lambda result: self._forget(task))
+        task.failed.connect(lambda error: self._forget(task))
+        task.cancelled.connect(lambda: self._forget(task))
+        if on_progress is not None:
+            task.progress.connect(on_progress)
+        if on_finished is not None:
+            task.finished.connect(on_finished)
+        if on_failed is not None:
+            task.failed.connect(on_failed)
+        if on_cancelled is not None:
+            task.cancelled.connect(on_cancelled)
+        self._active.add(task)
+        logger.info(f"Starting task {task.name}")
+        self.pool.start(_TaskRunnable(task))
+        return task
+
+    def active_tasks(self):
+        return list(self._active)
+
+    def cancel_all(self):
+        for task in self._active:
+            task.cancel()
+
+    def wait(self, msecs=-1):
+        """Block until the pool is idle (e.g. at shutdown); True if it drained in time."""
+        return self.pool.waitForDone(msecs)
+
+    def _forget(self, task):
+        self._active.discard(task)
+
+
+_runner = None
+
+
+def task_runner():
+    """The application-wide TaskRunner, created on first use from the GUI thread."""
+    global _runner
+    if _runner is None:
+        _runner = TaskRunner()
+    return _runner
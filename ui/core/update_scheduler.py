@@ -0,0 +1,102 @@
+from PySide6.QtCore import QObject, QTimer
+import logging
+import shiboken6
+
+from ui.core.profiling import PROFILER
+
+logger = logging.getLogger("UpdateScheduler")
+
+# Default cap on how often pending panel updates are flushed
+DEFAULT_RATE_HZ = 30
+
+
+def is_on_screen(widget):
+    """
+    True if any part of `widget` can currently be seen: it and its ancestors
+    are shown (so it is not on a hidden tab) and it has not been squeezed to
+    nothing by a splitter.
+    """
+    return widget.isVisible() and not widget.visibleRegion().isEmpty()
+
+
+class UpdateScheduler(QObject):
+    """
+    UpdateScheduler coalesces panel repaints. Panels call request_update when
+    their data changes instead of redrawing; at most `rate_hz` times a second
+    the scheduler calls flush_updates() once on every pending panel that is on
+    screen. Panels on hidden tabs or collapsed splitters stay dirty and are
+    skipped until panel_shown reports them visible again.
+    """
+    def __init__(self, rate_hz=DEFAULT_RATE_HZ, parent=None):
+        super().__init__(parent)
+        self._pending = {}  # id(panel) -> panel, insertion ordered
+        self._hidden = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        self.flush_count = 0
+        self.set_rate(rate_hz)
+
+    def set_rate(self, rate_hz):
+        """Change the maximum flush rate (Hz)."""
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive")
+        self.rate_hz = rate_hz
+        self._timer.setInterval(max(1, round(1000 / rate_hz)))
+
+    def request_update(self, panel):
+        """Mark `panel` dirty; its flush_updates runs at the next tick it is visible for."""
+        key = id(panel)
+        if key in self._pending:
+            return
+        if key in self._hidden:
+            # Stays parked until shown; panel_shown re-queues it
+            return
+        self._pending[key] = panel
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def panel_shown(self, panel):
+        """Called when a panel may have become visible; catches up a parked panel."""
+        parked = self._hidden.pop(id(panel), None)
+        if parked is not None:
+            self._pending[id(panel)] = parked
+            if not self._timer.isActive():
+                self._timer.start()
+
+    def forget(self, panel):
+        self._pending.pop(id(panel), None)
+        self._hidden.pop(id(panel), None)
+
+    def is_dirty(self, panel):
+        return id(panel) in self._pending or id(panel) in self._hidden
+
+    def flush(self):
+        """Flush every pending, visible panel now."""
+        pending = self._pending
+        self._pending = {}
+        for key, panel in pending.items():
+            if not shiboken6.isValid(panel):
+                continue
+            if not is_on_screen(panel):
+                self._hidden[key] = panel
+                continue
+            self.flush_count += 1
+            try:
+                with PROFILER.section(type(panel).__name__, "flush"):
+                    panel.flush_updates()
+            except Exception:
+                logger.exception(f"flush_updates failed for {type(panel).__name__}")
+        # Drop parked panels that were deleted while hidden
+        self._hidden = {key: panel for key, panel in self._hidden.items() if shiboken6.isValid(panel)}
+
+
+_scheduler = None
+
+
+def update_scheduler():
+    """The application-wide UpdateScheduler, created on first use from the GUI thread."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = UpdateScheduler()
+    return _scheduler
@@ -0,0 +1,177 @@
+"""
+View layout serialization for Race Manager Pro
+
+A dashboard's DividerContainer tree is saved as a small JSON document:
+
+    {"format": "race-manager-view", "version": 1, "name": "Race Control",
+     "root": <node>}
+
+where a node is one of
+    {"type": "divider", "orientation": "vertical", "sizes": [...], "children": [<node>, ...]}
+    {"type": "splitter", "orientation": "horizontal", "sizes": [...], "children": [<node>, ...]}
+    {"type": "panel", "panel": "<PANEL_REGISTRY name>", "state": {...}}
+
+"divider" is a DividerContainer, "splitter" a bare QSplitter inside one,
+"sizes" the splitter's sizes in pixels and "state" whatever the panel's
+save_state() returned. Restoring builds the container tree immediately and
+puts PanelPlaceholders where panels go; each panel is constructed the first
+time it is shown.
+
+Saved views live in `data/views/<name>.json`.
+"""
+import json
+import logging
+import re
+from pathlib import Path
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QSplitter
+
+from ui.views.blank_dashboard import BlankDashboard
+from ui.widgets.divider_container import DividerContainer
+from ui.widgets.panel_placeholder import PanelPlaceholder
+from ui.widgets.registry import panel_name_for
+
+logger = logging.getLogger("ViewLayout")
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+VIEWS_DIR = PROJECT_ROOT / "data" / "views"
+VIEW_FORMAT = "race-manager-view"
+VIEW_VERSION = 1
+
+
+def _orientation_name(splitter):
+    return "horizontal" if splitter.orientation() == Qt.Horizontal else "vertical"
+
+
+def _qt_orientation(name):
+    return Qt.Horizontal if name == "horizontal" else Qt.Vertical
+
+
+def widget_node(widget):
+    """Serializable node for a divider, splitter or panel widget."""
+    if isinstance(widget, DividerContainer):
+        return {
+            "type": "divider",
+            "orientation": _orientation_name(widget.splitter),
+            "sizes": widget.splitter.sizes(),
+            "children": [widget_node(child) for child in widget.children_widgets],
+        }
+    if isinstance(widget, QSplitter):
+        return {
+            "type": "splitter",
+            "orientation": _orientation_name(widget),
+            "sizes": widget.sizes(),
+            "children": [widget_node(widget.widget(i)) for i in range(widget.count())],
+        }
+    if isinstance(widget, PanelPlaceholder):
+        return {"type": "panel", "panel": widget.panel_name, "state": widget.save_state()}
+    name = panel_name_for(widget)
+    if name is None:
+        raise ValueError(f"{type(widget).__name__} is not a registered panel and cannot be saved")
+    state = widget.save_state() if hasattr(widget, "save_state") else {}
+    return {"type": "panel", "panel": name, "state": state}
+
+
+def serialize_view(dashboard, name):
+    """Layout document of a dashboard (anything with a `root_divider`)."""
+    return {"format": VIEW_FORMAT, "version": VIEW_VERSION, "name": name,
+            "root": widget_node(dashboard.root_divider)}
+
+
+def _build(node, edit_mode):
+    kind = node["type"]
+    if kind == "panel":
+        placeholder = PanelPlaceholder(node["panel"], node.get("state"))
+        placeholder.set_edit_mode(edit_mode)
+        return placeholder
+    if kind == "divider":
+        divider = DividerContainer(orientation=node["orientation"], edit_mode=edit_mode)
+        fill_divider(divider, node, edit_mode)
+        return divider
+    if kind == "splitter":
+        splitter = QSplitter(_qt_orientation(node["orientation"]))
+        for child in node["children"]:
+            splitter.addWidget(_build(child, edit_mode))
+        if node.get("sizes"):
+            splitter.setSizes(node["sizes"])
+        return splitter
+    raise ValueError(f"Unknown layout node type: {kind!r}")
+
+
+def fill_divider(divider, node, edit_mode=False):
+    """Populate an empty DividerContainer from a "divider" node."""
+    divider.orientation = node["orientation"]
+    divider.splitter.setOrientation(_qt_orientation(node["orientation"]))
+    for child in node["children"]:
+        widget = _build(child, edit_mode)
+        divider.splitter.addWidget(widget)
+        divider.children_widgets.append(widget)
+    if node.get("sizes"):
+        divider.splitter.setSizes(node["sizes"])
+    divider._update_controls()
+
+
+def is_view_layout(layout):
+    """Whether a loaded JSON document is a view layout this version can restore."""
+    return (isinstance(layout, dict) and layout.get("format") == VIEW_FORMAT
+            and layout.get("version") == VIEW_VERSION)
+
+
+def restore_view(layout, edit_mode=False):
+    """
+    A new BlankDashboard laid out from a layout document; panels are built
+    when first shown. Raises ValueError if the document is not a view layout
+    or has a malformed node.
+    """
+    if not is_view_layout(layout):
+        raise ValueError("Not a Race Manager Pro view layout")
+    dashboard = BlankDashboard()
+    try:
+        fill_divider(dashboard.root_divider, layout["root"], edit_mode)
+    except (KeyError, TypeError) as exc:
+        dashboard.deleteLater()
+        raise ValueError(f"Malformed view layout: {exc!r}") from exc
+    return dashboard
+
+
+def view_path(name, views_dir=VIEWS_DIR):
+    slug = re.sub(r"[^A-Za-z0-9_-]+", "_", name).strip("_") or "view"
+    return Path(views_dir) / f"{slug}.json"
+
+
+def save_view(dashboard, name, views_dir=VIEWS_DIR, overwrite=False):
+    """
+    Write a dashboard's layout to the views directory; returns the file path.
+    Raises FileExistsError if a view is already saved under `name` (or a name
+    with the same file name) unless `overwrite` is set.
+    """
+    path = view_path(name, views_dir)
+    if path.exists() and not overwrite:
+        raise FileExistsError(f"A view is already saved as {path.name}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(serialize_view(dashboard, name), f, separators=(",", ":"))
+    logger.info(f"Saved view {name!r} to {path}")
+    return path
+
+
+def load_layout(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def saved_views(views_dir=VIEWS_DIR):
+    """(name, path) of every saved view, sorted by name; other JSON files are skipped."""
+    views = []
+    for path in sorted(Path(views_dir).glob("*.json")):
+        try:
+            layout = load_layout(path)
+        except (OSError, ValueError):
+            logger.warning(f"Skipping unreadable view file {path}")
+            continue
+        if not is_view_layout(layout):
+            logger.warning(f"Skipping {path}: not a view layout")
+            continue
+        views.append((layout.get("name", path.stem), path))
+    return sorted(views)
@@ -1,9 +1,12 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 from ui.widgets.divider_container import DividerContainer
+from ui.widgets.highlight_overlay import HighlightOverlay
 import logging
+from ui.core.profiling import profile_init
 
 logger = logging.getLogger("BlankDashboard")
 
+@profile_init
 class BlankDashboard(QWidget):
     """
     BlankDashboard is the root dashboard for a tab. It contains a single root DividerContainer,
@@ -19,6 +22,8 @@ class BlankDashboard(QWidget):
         layout.setSpacing(0)
         layout.addWidget(self.root_divider)
         self.setLayout(layout)
+        # One overlay paints the edit-mode hover outlines of every container
+        self.highlight_overlay = HighlightOverlay(self)
 
     def add_panel(self, panel_cls):
         """
@@ -1,9 +1,12 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 from ui.widgets.divider_container import DividerContainer
+from ui.widgets.highlight_overlay import HighlightOverlay
 import logging
+from ui.core.profiling import profile_init
 
 logger = logging.getLogger("DefaultDashboard")
 
+@profile_init
 class DefaultDashboard(QWidget):
     """
     DefaultDashboard is the default dashboard shown on startup. It contains a root DividerContainer
@@ -18,6 +21,8 @@ class DefaultDashboard(QWidget):
         layout.setSpacing(0)
         layout.addWidget(self.root_divider)
         self.setLayout(layout)
+        # One overlay paints the edit-mode hover outlines of every container
+        self.highlight_overlay = HighlightOverlay(self)
 
     def set_edit_mode(self, edit_mode: bool):
         logger.debug(f"DefaultDashboard.set_edit_mode({edit_mode}) -> root_divider")
@@ -4,12 +4,31 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QAction
 from PySide6.QtCore import Qt
+from pathlib import Path
+
+from analysis.session_stats import SessionStats
+from storage.columnar_session import lap_time_matrix
+from storage.session_cache import SESSION_STORE
+from ui.core.profiling import profile_init
+from ui.core.tasks import task_runner
+from ui.core.update_scheduler import update_scheduler
+
+# Session shown by panels until session selection exists
+SAMPLE_SESSION_PATH = Path(__file__).parent.parent.parent / "data" / "sessions" / "20250702_181847_simple_oval_results.json"
+
+
 class BasePanel(QWidget):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every concrete panel's constructor shows up in the startup report
+        profile_init(cls)
+
     def __init__(self, title="Untitled Panel", show_title=True):
         super().__init__()
         self.title = title
         self.show_title = show_title
         self.edit_mode = False
+        self.session_model = None
 
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
@@ -36,5 +55,111 @@ class BasePanel(QWidget):
         self.content_layout = QVBoxLayout()
         self.layout.addLayout(self.content_layout)
 
+    def set_title(self, title):
+        self.title = title
+        if self.show_title:
+            self.title_label.setText(title)
+
+    def on_edit_clicked(self):
+        pass
+
     def set_edit_mode(self, value: bool):
         self.edit_mode = value
+
+    def cleanup(self):
+        """
+        Release heavy internals before the panel is discarded (e.g. when its
+        tab hibernates). Subclasses free their own resources and call super().
+        """
+        if self.session_model is not None:
+            self.set_session_model(None)
+        update_scheduler().forget(self)
+
+    def save_state(self):
+        """JSON-serializable panel settings saved with a view layout."""
+        return {}
+
+    def restore_state(self, state):
+        """Apply settings produced by save_state."""
+        pass
+
+    def schedule_update(self):
+        """
+        Ask for flush_updates() at the next update-scheduler tick. Repeated
+        requests coalesce, and panels that are not on screen catch up when shown.
+        """
+        update_scheduler().request_update(self)
+
+    def flush_updates(self):
+        pass
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        update_scheduler().panel_shown(self)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # A splitter handle dragged open again also brings a panel back on screen
+        update_scheduler().panel_shown(self)
+
+    def load_session(self, path=SAMPLE_SESSION_PATH):
+        """
+        Parsed session results from the shared session store, or None if the
+        file does not exist. The returned data is shared; do not modify it.
+        """
+        try:
+            return SESSION_STORE.get(path)
+        except FileNotFoundError:
+            return None
+
+    def load_session_stats(self, path=SAMPLE_SESSION_PATH):
+        """Derived statistics of a session file, computed once and cached with the session."""
+        try:
+            return SESSION_STORE.derived(path, "stats", lambda data: SessionStats(lap_time_matrix(data)))
+        except FileNotFoundError:
+            return None
+
+    def load_session_async(self, prepare, on_ready, path=SAMPLE_SESSION_PATH, derived=()):
+        """
+        Run prepare(path) on a pool thread, then on_ready(result) on the GUI
+        thread. `prepare` loads the session and anything derived from it through
+        the session store; when the session and the `derived` values named are
+        already cached, both run immediately instead. Returns the Task, if any.
+        """
+        path = Path(path)
+        if not path.exists() or SESSION_STORE.is_current(path, *derived):
+            on_ready(prepare(path))
+            return None
+        return task_runner().submit(lambda context: prepare(path), on_finished=on_ready,
+                                    name=f"load {path.name}")
+
+    def set_session_model(self, model):
+        """
+        Subscribe to a SessionModel (or unsubscribe with None). Subclasses
+        override the on_* hooks to patch their views incrementally.
+        """
+        if self.session_model is not None:
+            self.session_model.session_reset.disconnect(self.on_session_reset)
+            self.session_model.lap_appended.disconnect(self.on_lap_appended)
+            self.session_model.position_changed.disconnect(self.on_position_changed)
+            self.session_model.entry_status_changed.disconnect(self.on_entry_status_changed)
+        self.session_model = model
+        if model is not None:
+            model.session_reset.connect(self.on_session_reset)
+            model.lap_appended.connect(self.on_lap_appended)
+            model.position_changed.connect(self.on_position_changed)
+            model.entry_status_changed.connect(self.on_entry_status_changed)
+            self.on_session_reset()
+
+    def on_session_reset(self):
+        pass
+
+    def on_lap_appended(self, row, lap, lap_time):
+        pass
+
+    def on_position_changed(self, row, old_position, new_position):
+        pass
+
+    def on_entry_status_changed(self, row, status):
+        pass
+
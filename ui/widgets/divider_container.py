@@ -1,10 +1,12 @@
 import functools
 from PySide6.QtWidgets import (
-    QWidget, QSplitter, QFrame, QVBoxLayout, QHBoxLayout, QPushButton, QMenu, QLabel
+    QWidget, QSplitter, QFrame, QVBoxLayout, QHBoxLayout, QPushButton, QMenu
 )
 from PySide6.QtCore import Qt, QEvent
 import logging
-from ui.widgets.registry import PANEL_REGISTRY
+import shiboken6
+from ui.widgets.highlight_overlay import HighlightOverlay
+from ui.widgets.registry import PANEL_REGISTRY, shared_session_model
 
 logger = logging.getLogger("DividerContainer")
 
@@ -20,7 +22,7 @@ class DividerContainer(QFrame):
         self.edit_mode = edit_mode
         self.children_widgets = []
         self.setMouseTracking(True)
-        self._highlight_state = None  # None, 'active', 'ancestor', 'delete'
+        self._overlay = None  # HighlightOverlay of the enclosing dashboard, found on first hover
         self._delete_hover = False
         logger.debug(f"Creating QSplitter orientation={self.orientation}")
         if self.orientation == 'vertical':
@@ -47,9 +49,6 @@ class DividerContainer(QFrame):
         self.delete_btn.clicked.connect(self._delete_child)
         self.delete_btn.hide()
         self.delete_btn.installEventFilter(self)
-        # Highlight border for hover in edit mode (no custom style)
-        self._highlight = QLabel(self)
-        self._highlight.hide()
         self.installEventFilter(self)
         self._update_controls()
 
@@ -61,8 +60,9 @@ class DividerContainer(QFrame):
         self.center_add_btn.move(cx, cy)
         # Top-right for delete
         self.delete_btn.move(self.width() - self.delete_btn.width() - 8, 8)
-        # Highlight border
-        self._highlight.resize(self.width(), self.height())
+        # Keep the overlay's cached outline in step with splitter drags
+        if self._overlay is not None and shiboken6.isValid(self._overlay):
+            self._overlay.geometry_changed(self)
 
     def eventFilter(self, obj, event):
         if obj == self.delete_btn:
@@ -77,59 +77,51 @@ class DividerContainer(QFrame):
             self._set_highlight_chain(None)
         elif event.type() == QEvent.MouseMove:
             self._set_highlight_chain('active')
+        elif event.type() == QEvent.ParentChange:
+            # Splits move containers around; find the overlay again on next use
+            self._overlay = None
         return super().eventFilter(obj, event)
 
-    def _set_highlight_chain(self, state):
-        # Recursively set highlight on self and all parents
-        if self.edit_mode:
-            self._set_highlight(state)
-            parent = self.parent()
-            ancestor_state = 'ancestor' if state == 'active' else None
-            while parent:
-                if isinstance(parent, DividerContainer):
-                    parent._set_highlight(ancestor_state)
-                    parent = parent.parent()
-                else:
-                    break
-        else:
-            self._set_highlight(None)
+    def mouseMoveEvent(self, event):
+        # Stop here so enclosing containers do not claim the hover
+        event.accept()
+
+    def _highlight_overlay(self):
+        if self._overlay is None or not shiboken6.isValid(self._overlay):
+            self._overlay = HighlightOverlay.for_widget(self)
+        return self._overlay
 
-    def _set_highlight(self, state):
-        self._highlight_state = state
-        if state == 'active' and self.edit_mode:
-            self._highlight.setStyleSheet("border: 2px solid #1976d2; border-radius: 8px;")
-            self._highlight.show()
-        elif state == 'ancestor' and self.edit_mode:
-            self._highlight.setStyleSheet("border: 2px solid #b0b0b0; border-radius: 8px;")
-            self._highlight.show()
-        elif state == 'delete' and self.edit_mode:
-            self._highlight.setStyleSheet("border: 2px solid #d32f2f; border-radius: 8px;")
-            self._highlight.show()
+    def _set_highlight_chain(self, state):
+        # The dashboard's overlay outlines this container and its ancestors;
+        # it only recomputes when the hovered container changes
+        overlay = self._highlight_overlay()
+        if overlay is None:
+            return
+        if self.edit_mode and state == 'active':
+            overlay.set_hovered(self)
         else:
-            self._highlight.hide()
+            overlay.clear_hovered(self)
 
     def _set_delete_highlight(self, value):
         # If deleting a panel, highlight just this container in red
         # If deleting a divider (splitter), highlight both children in red
-        if not value:
-            self._set_highlight_chain(None)
-            # Also clear delete highlight from children if this is a splitter
-            for child in self.children_widgets:
-                if isinstance(child, DividerContainer):
-                    child._set_highlight(None)
+        overlay = self._highlight_overlay()
+        if overlay is None:
+            return
+        if not value or not self.edit_mode:
+            overlay.set_delete_targets([])
             return
         # If this container holds a splitter (i.e., is a divider), highlight both children
         if self.children_widgets and isinstance(self.children_widgets[0], QSplitter):
-            for i in range(self.children_widgets[0].count()):
-                widget = self.children_widgets[0].widget(i)
-                if isinstance(widget, DividerContainer):
-                    widget._set_highlight('delete')
+            splitter = self.children_widgets[0]
+            targets = [splitter.widget(i) for i in range(splitter.count())
+                       if isinstance(splitter.widget(i), DividerContainer)]
         else:
-            self._set_highlight('delete')
+            targets = [self]
+        overlay.set_delete_targets(targets)
 
     def add_child(self, widget):
         for child in self.children_widgets:
-            self.splitter.removeWidget(child)
             child.setParent(None)
         self.children_widgets.clear()
         self.splitter.addWidget(widget)
@@ -154,7 +146,6 @@ class DividerContainer(QFrame):
 
     def _delete_child(self):
         for child in self.children_widgets:
-            self.splitter.removeWidget(child)
             child.setParent(None)
         self.children_widgets.clear()
         self._update_controls()
@@ -171,12 +162,13 @@ class DividerContainer(QFrame):
                 child.set_edit_mode(edit_mode)
 
     def _update_controls(self):
-        # Show highlight only if edit mode and mouse is over this or a descendant
-        # (handled by _set_highlight_chain)
+        # Hover outlines are painted by the dashboard's HighlightOverlay
+        # (see _set_highlight_chain)
         if not self.edit_mode:
             self.center_add_btn.hide()
             self.delete_btn.hide()
-            self._highlight.hide()
+            if self._overlay is not None and shiboken6.isValid(self._overlay):
+                self._overlay.clear_hovered(self)
             return
         if not self.children_widgets:
             self.center_add_btn.show()
@@ -196,13 +188,15 @@ class DividerContainer(QFrame):
 
     def _show_add_panel_menu(self):
         menu = QMenu(self)
-        for name, cls in PANEL_REGISTRY.items():
+        menu.setToolTipsVisible(True)
+        for name, spec in PANEL_REGISTRY.items():
             action = menu.addAction(name)
-            action.triggered.connect(functools.partial(self._add_panel_from_menu, cls))
+            action.setToolTip(spec.description)
+            action.triggered.connect(functools.partial(self._add_panel_from_menu, spec))
         menu.popup(self.center_add_btn.mapToGlobal(self.center_add_btn.rect().bottomLeft()))
 
-    def _add_panel_from_menu(self, panel_cls):
-        self.add_panel(panel_cls())
+    def _add_panel_from_menu(self, spec):
+        self.add_panel(spec.create(shared_session_model(self)))
 
     def _split_horizontal(self):
         """Split this divider horizontally."""
@@ -226,6 +220,19 @@ class DividerContainer(QFrame):
         splitter.addWidget(d2)
         return splitter
 
+    def _find_parent_splitter(self):
+        parent = self.parentWidget()
+        while parent is not None:
+            if isinstance(parent, QSplitter):
+                return parent
+            parent = parent.parentWidget()
+        return None
+
+    def _replace_in_parent(self, new_widget):
+        parent_splitter = self._find_parent_splitter()
+        if parent_splitter is not None:
+            parent_splitter.replaceWidget(parent_splitter.indexOf(self), new_widget)
+
     def _split(self, orientation):
         logger.debug(f"[SPLIT] _split called with orientation={orientation} on {self}")
         parent_splitter = self._find_parent_splitter()
@@ -233,7 +240,7 @@ class DividerContainer(QFrame):
         if len(self.children_widgets) == 1 and not isinstance(self.children_widgets[0], DividerContainer):
             logger.debug(f"[SPLIT] Leaf divider with single panel, moving panel to new divider")
             panel = self.children_widgets.pop()
-            self.splitter.removeWidget(panel)
+            panel.setParent(None)
             if parent_splitter is None:
                 self.orientation = orientation
                 self.splitter.setOrientation(Qt.Horizontal if orientation == 'horizontal' else Qt.Vertical)
@@ -269,7 +276,7 @@ class DividerContainer(QFrame):
             logger.debug(f"[SPLIT] Root divider, reconfiguring self")
             old_widgets = list(self.children_widgets)
             for w in old_widgets:
-                self.splitter.removeWidget(w)
+                w.setParent(None)
             self.children_widgets.clear()
             self.orientation = orientation
             self.splitter.setOrientation(Qt.Horizontal if orientation == 'horizontal' else Qt.Vertical)
@@ -289,7 +296,7 @@ class DividerContainer(QFrame):
         d1 = DividerContainer(orientation=orientation, edit_mode=self.edit_mode)
         d2 = DividerContainer(orientation=orientation, edit_mode=self.edit_mode)
         for w in list(self.children_widgets):
-            self.splitter.removeWidget(w)
+            w.setParent(None)
             d1.add_child(w)
         d1.set_edit_mode(self.edit_mode)
         d2.set_edit_mode(self.edit_mode)
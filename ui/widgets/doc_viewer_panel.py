@@ -1,15 +1,71 @@
-from PySide6.QtWidgets import QVBoxLayout, QTextEdit
+from PySide6.QtWidgets import QVBoxLayout, QTextBrowser, QLineEdit, QListWidget, QListWidgetItem
+from PySide6.QtCore import Qt
 from .base_panel import BasePanel
+import logging
 import os
-import markdown
+import sqlite3
+
+from storage.doc_index import DOCS_DIR, RENDER_CACHE, DocIndex
+from ui.core.tasks import task_runner
+
+logger = logging.getLogger("DocViewerPanel")
+
+# Basic styling for readability
+PAGE_TEMPLATE = """
+<html><head><style>
+body {{ font-family: sans-serif; margin: 2em; }}
+h1, h2, h3 {{ color: #2a4d7a; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; }}
+</style></head><body>{body}</body></html>
+"""
+
+# The docs index is brought up to date once per run, in the background;
+# searches that find nothing before then are repeated when it is ready
+_index_update = None
+_index_ready = False
+
+
+def _update_doc_index(context):
+    with DocIndex() as index:
+        return index.update()
+
+
+def _on_index_updated(result):
+    global _index_ready
+    _index_ready = True
+    logger.info(f"Docs index updated ({result} documents re-indexed)")
+
+
+def _on_index_failed(error):
+    global _index_ready
+    # Search whatever the index holds rather than waiting forever
+    _index_ready = True
+    logger.error(f"Docs index update failed: {error}")
+
 
 class DocViewerPanel(BasePanel):
     def __init__(self, md_path=None, parent=None):
         super().__init__(parent)
         self.set_title("User Guide")
-        self.text_edit = QTextEdit()
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search docs...")
+        self.search_edit.textChanged.connect(self.search)
+        self.content_layout.addWidget(self.search_edit)
+        self.results_list = QListWidget()
+        self.results_list.setVisible(False)
+        self.results_list.itemActivated.connect(self._open_result)
+        self.results_list.itemClicked.connect(self._open_result)
+        self.content_layout.addWidget(self.results_list)
+        self.text_edit = QTextBrowser()
         self.text_edit.setReadOnly(True)
+        # Links are followed by load_markdown so other docs render through the cache
+        self.text_edit.setOpenLinks(False)
+        self.text_edit.anchorClicked.connect(self._follow_link)
         self.content_layout.addWidget(self.text_edit)
+        self.md_path = None
+        self._doc_index = None
+        self._start_index_update()
         if md_path is None:
             md_path = os.path.join(os.path.dirname(__file__), '../../docs/user/USER_GUIDE.md')
         self.load_markdown(md_path)
@@ -18,20 +74,79 @@ class DocViewerPanel(BasePanel):
         if not os.path.exists(md_path):
             self.text_edit.setHtml("<h2>Documentation not found.</h2>")
             return
-        with open(md_path, 'r', encoding='utf-8') as f:
-            md_text = f.read()
-        html = markdown.markdown(md_text, extensions=['extra', 'toc', 'tables'])
-        # Basic styling for readability
-        html = f"""
-        <html><head><style>
-        body {{ font-family: sans-serif; margin: 2em; }}
-        h1, h2, h3 {{ color: #2a4d7a; }}
-        table {{ border-collapse: collapse; }}
-        th, td {{ border: 1px solid #ccc; padding: 4px 8px; }}
-        </style></head><body>{html}</body></html>
-        """
-        self.text_edit.setHtml(html)
+        # Rendered HTML is cached on disk by content, so this rarely runs markdown
+        html = RENDER_CACHE.html_for(md_path)
+        self.md_path = os.path.abspath(md_path)
+        self.text_edit.setHtml(PAGE_TEMPLATE.format(body=html))
+
+    def save_state(self):
+        state = {}
+        if self.md_path is not None:
+            state["doc"] = os.path.relpath(self.md_path, DOCS_DIR)
+        if self.search_edit.text():
+            state["search"] = self.search_edit.text()
+        return state
+
+    def restore_state(self, state):
+        if "doc" in state:
+            self.load_markdown(os.path.join(DOCS_DIR, state["doc"]))
+        self.search_edit.setText(state.get("search", ""))
+
+    def search(self, query):
+        """Show docs containing every word of `query`; an empty query hides the results."""
+        query = query.strip()
+        self.results_list.clear()
+        if not query:
+            self.results_list.setVisible(False)
+            return
+        self.results_list.setVisible(True)
+        try:
+            if self._doc_index is None:
+                self._doc_index = DocIndex()
+            hits = self._doc_index.search(query)
+        except sqlite3.OperationalError as exc:
+            logger.warning(f"Docs search failed: {exc}")
+            self.results_list.addItem("Search is unavailable while the docs index is busy; try again.")
+            return
+        for hit in hits:
+            item = QListWidgetItem(f"{hit['title']}  ({hit['path']})")
+            item.setData(Qt.UserRole, hit['path'])
+            self.results_list.addItem(item)
+        if not hits:
+            self.results_list.addItem("No matches." if _index_ready else "Indexing docs...")
+
+    def _open_result(self, item):
+        path = item.data(Qt.UserRole)
+        if path:
+            self.load_markdown(os.path.join(DOCS_DIR, path))
+
+    def _follow_link(self, url):
+        if url.scheme() in ("http", "https", "mailto"):
+            return
+        if url.path() and url.path().endswith(".md"):
+            base = os.path.dirname(self.md_path) if self.md_path else DOCS_DIR
+            self.load_markdown(os.path.normpath(os.path.join(base, url.path())))
+        if url.fragment():
+            self.text_edit.scrollToAnchor(url.fragment())
+
+    def _start_index_update(self):
+        global _index_update
+        if _index_update is None:
+            _index_update = task_runner().submit(_update_doc_index, name="doc index update",
+                                                 on_finished=_on_index_updated, on_failed=_on_index_failed)
+        if not _index_ready:
+            _index_update.finished.connect(self._on_index_ready)
+            _index_update.failed.connect(self._on_index_ready)
+
+    def _on_index_ready(self, *args):
+        # Repeat a search typed while the index was being built
+        if self.search_edit.text().strip():
+            self.search(self.search_edit.text())
 
     def cleanup(self):
-        # No-op for QTextEdit
-        pass
+        if self._doc_index is not None:
+            self._doc_index.close()
+            self._doc_index = None
+        self.results_list.clear()
+        self.text_edit.clear()
+        super().cleanup()
@@ -0,0 +1,121 @@
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QEvent, QRectF
+from PySide6.QtGui import QPainter, QPen, QColor
+import shiboken6
+
+# Outline colours of the edit-mode highlight states
+ACTIVE_COLOR = QColor("#1976d2")
+ANCESTOR_COLOR = QColor("#b0b0b0")
+DELETE_COLOR = QColor("#d32f2f")
+OUTLINE_WIDTH = 2
+OUTLINE_RADIUS = 8
+
+
+class HighlightOverlay(QWidget):
+    """
+    HighlightOverlay paints the edit-mode outlines of a whole dashboard: the
+    hovered container (active), its enclosing containers (ancestor) and the
+    containers a hovered delete button would remove (delete). It is a single
+    transparent, mouse-transparent child stretched over the dashboard.
+
+    Containers report hover changes with set_hovered / set_delete_targets.
+    Outline rectangles are computed only when that state (or the geometry)
+    changes and painted from the cache, so hover cost does not depend on
+    how deeply the layout is nested.
+    """
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.hovered = None
+        self.delete_targets = []
+        self._outlines = []  # (QRectF, QColor), painted back to front
+        parent.installEventFilter(self)
+        self.setGeometry(parent.rect())
+        self.hide()
+
+    @staticmethod
+    def for_widget(widget):
+        """The overlay of the dashboard containing `widget`, created on its window if there is none."""
+        parent = widget
+        while parent is not None:
+            overlay = getattr(parent, "highlight_overlay", None)
+            if overlay is not None:
+                return overlay
+            parent = parent.parentWidget()
+        window = widget.window()
+        if window is widget:
+            return None
+        window.highlight_overlay = HighlightOverlay(window)
+        return window.highlight_overlay
+
+    def set_hovered(self, container):
+        if container is self.hovered and not self.delete_targets:
+            return
+        self.hovered = container
+        self.delete_targets = []
+        self.refresh()
+
+    def clear_hovered(self, container):
+        """Drop the highlight if `container` is the one currently highlighted."""
+        if container is self.hovered:
+            self.set_hovered(None)
+
+    def set_delete_targets(self, containers):
+        self.delete_targets = list(containers)
+        self.refresh()
+
+    def clear(self):
+        self.hovered = None
+        self.delete_targets = []
+        self.refresh()
+
+    def geometry_changed(self, container):
+        """A container moved or resized; recompute only if it is outlined."""
+        if container is self.hovered or container in self.delete_targets:
+            self.refresh()
+
+    def refresh(self):
+        """Recompute the cached outlines and repaint."""
+        from ui.widgets.divider_container import DividerContainer
+        outlines = []
+        if self.delete_targets:
+            outlines = [(self._rect_of(widget), DELETE_COLOR) for widget in self.delete_targets
+                        if shiboken6.isValid(widget)]
+        elif self.hovered is not None and shiboken6.isValid(self.hovered):
+            ancestors = []
+            parent = self.hovered.parentWidget()
+            while parent is not None and parent is not self.parentWidget():
+                if isinstance(parent, DividerContainer):
+                    ancestors.append(parent)
+                parent = parent.parentWidget()
+            outlines = [(self._rect_of(widget), ANCESTOR_COLOR) for widget in reversed(ancestors)]
+            outlines.append((self._rect_of(self.hovered), ACTIVE_COLOR))
+        self._outlines = outlines
+        if not outlines:
+            self.hide()
+            return
+        self.raise_()
+        self.show()
+        self.update()
+
+    def _rect_of(self, widget):
+        top_left = widget.mapTo(self.parentWidget(), widget.rect().topLeft())
+        inset = OUTLINE_WIDTH / 2
+        return QRectF(top_left.x() + inset, top_left.y() + inset,
+                      widget.width() - OUTLINE_WIDTH, widget.height() - OUTLINE_WIDTH)
+
+    def eventFilter(self, obj, event):
+        if obj is self.parentWidget() and event.type() == QEvent.Resize:
+            self.setGeometry(obj.rect())
+            if self._outlines:
+                self.refresh()
+        return super().eventFilter(obj, event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        for rect, color in self._outlines:
+            painter.setPen(QPen(color, OUTLINE_WIDTH))
+            painter.drawRoundedRect(rect, OUTLINE_RADIUS, OUTLINE_RADIUS)
+        painter.end()
@@ -1,10 +1,22 @@
 from PySide6.QtWidgets import QLabel, QTableWidget, QTableWidgetItem, QHeaderView, QVBoxLayout
 from .base_panel import BasePanel
-import os
-import json
+import numpy as np
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+from analysis.lap_chart import LapChart
+from storage.columnar_session import lap_time_matrix
+from storage.session_cache import SESSION_STORE
+
+
+# Laps shown on the x axis when a live session does not say how long it is
+LIVE_INITIAL_LAPS = 20
+
+
+def build_lap_chart(session_data):
+    return LapChart(lap_time_matrix(session_data))
+
+
 class LapChartPanel(BasePanel):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -12,30 +24,270 @@ class LapChartPanel(BasePanel):
         self.info_label = QLabel("Lap chart: position per lap (1 = leader)")
         self.content_layout.addWidget(self.info_label)
         self.table = QTableWidget()
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.content_layout.addWidget(self.table)
         # Matplotlib Figure
         self.figure = Figure(figsize=(5, 3))
         self.canvas = FigureCanvas(self.figure)
         self.content_layout.addWidget(self.canvas)
+        # Live-append rendering state (see start_live)
+        self.live = False
+        self._live_lines = []
+        self._live_positions = None
+        self._live_settled = 0
+        self._background = None
+        self._draw_cid = None
+        # Pending SessionModel changes, applied by flush_updates
+        self._reset_pending = False
+        self._dirty_from = None
+        self._charted_laps = 0
         self.load_sample_session()
 
     def load_sample_session(self):
-        session_path = os.path.join(
-            os.path.dirname(__file__),
-            '../../data/sessions/20250702_181847_simple_oval_results.json'
-        )
-        session_path = os.path.abspath(session_path)
-        if not os.path.exists(session_path):
+        self.load_session_async(self._prepare_session, self._show_session, derived=("lap_chart",))
+
+    def _prepare_session(self, path):
+        # May run on a pool thread: only touches the session store, never widgets
+        data = self.load_session(path)
+        if data is None:
+            return None
+        # The position matrix is cached with the session, shared by every lap chart on it
+        return data, SESSION_STORE.derived(path, "lap_chart", build_lap_chart)
+
+    def _show_session(self, prepared):
+        if self.session_model is not None:
+            return  # A live session took over while the file was loading
+        if prepared is None:
             self.info_label.setText("No session data found.")
             return
-        with open(session_path, 'r') as f:
-            data = json.load(f)
-        self.update_chart(data)
+        data, chart = prepared
+        self.show_chart(self._driver_names(data.get('results', [])), chart)
 
     def update_chart(self, session_data):
         results = session_data.get('results', [])
         if not results:
             self.info_label.setText("No results data.")
             return
-        num_laps = len(results[0]['laps'])
-        # ...existing code for plotting...
+        self.show_chart(self._driver_names(results), build_lap_chart(session_data))
+
+    def show_chart(self, names, chart, from_lap=0):
+        """Render the table and plot from a LapChart; table columns before `from_lap` are kept."""
+        self._fill_table(names, chart, from_lap)
+        self._plot(names, chart.positions)
+
+    def _fill_table(self, names, chart, from_lap=0):
+        positions = chart.positions
+        num_laps = chart.num_laps
+        if from_lap == 0:
+            self.table.setRowCount(len(names))
+            self.table.setVerticalHeaderLabels(names)
+        previous_laps = self.table.columnCount() if from_lap else 0
+        self.table.setColumnCount(num_laps)
+        for column in range(previous_laps, num_laps):
+            self.table.setHorizontalHeaderItem(column, QTableWidgetItem(str(column + 1)))
+        for column in range(from_lap, num_laps):
+            for row, position in enumerate(positions[:, column].tolist()):
+                item = self.table.item(row, column)
+                text = str(position) if position else ""
+                if item is None:
+                    self.table.setItem(row, column, QTableWidgetItem(text))
+                else:
+                    item.setText(text)
+
+    def _plot(self, names, positions):
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        laps = np.arange(1, positions.shape[1] + 1)
+        plotted = np.where(positions > 0, positions, np.nan)
+        for row, name in enumerate(names):
+            ax.plot(laps, plotted[row], marker='o', markersize=3, label=name)
+        ax.set_xlabel("Lap")
+        ax.set_ylabel("Position")
+        if names:
+            ax.set_ylim(len(names) + 0.5, 0.5)
+            ax.set_yticks(range(1, len(names) + 1))
+            ax.legend(fontsize='small', loc='upper left', bbox_to_anchor=(1.0, 1.0))
+        self.figure.tight_layout()
+        self.canvas.draw_idle()
+
+    def cleanup(self):
+        self.stop_live()
+        self._live_positions = None
+        self.figure.clear()
+        self.table.clear()
+        self.table.setRowCount(0)
+        self.table.setColumnCount(0)
+        super().cleanup()
+
+    @staticmethod
+    def _driver_names(results):
+        return [result.get('driver', {}).get('name', 'N/A') for result in results]
+
+    # --- Live-append rendering ---
+    #
+    # In live mode each entry is a persistent, animated Line2D. Laps every
+    # running entry has completed are "settled" and baked into a cached
+    # background; each update restores that background, draws only the
+    # unsettled tail of every line and blits the axes. The cost of an update
+    # therefore does not grow with the number of laps already charted.
+
+    def start_live(self, names, total_laps=None):
+        """Switch the plot to live-append mode for a session with these entries."""
+        self.live = True
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        ax.set_xlabel("Lap")
+        ax.set_ylabel("Position")
+        ax.set_xlim(0.5, (total_laps or LIVE_INITIAL_LAPS) + 0.5)
+        if names:
+            ax.set_ylim(len(names) + 0.5, 0.5)
+            ax.set_yticks(range(1, len(names) + 1))
+        self._live_lines = [
+            ax.plot([], [], marker='o', markersize=3, label=name, animated=True)[0]
+            for name in names
+        ]
+        if names:
+            ax.legend(handles=self._live_lines, fontsize='small', loc='upper left', bbox_to_anchor=(1.0, 1.0))
+        self.figure.tight_layout()
+        self._live_positions = None
+        self._live_settled = 0
+        self._background = None
+        if self._draw_cid is None:
+            self._draw_cid = self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+        self.canvas.draw()
+
+    def stop_live(self):
+        """Leave live mode; the next show_chart draws a normal static plot."""
+        self.live = False
+        if self._draw_cid is not None:
+            self.canvas.mpl_disconnect(self._draw_cid)
+            self._draw_cid = None
+        self._live_lines = []
+        self._background = None
+
+    def update_live(self, positions, settled_laps, from_lap=None):
+        """
+        Show an entries x laps position matrix (0 = lap not completed).
+
+        `settled_laps` is the number of leading laps that will not change any
+        more (completed by every running entry); they are baked into the
+        background. `from_lap` (0-based) is the earliest column that changed.
+        """
+        self._live_positions = positions
+        ax = self.figure.axes[0]
+        num_laps = positions.shape[1]
+        if from_lap is not None and from_lap < self._live_settled:
+            # A settled lap was corrected: rebake everything on the next full draw
+            self._live_settled = 0
+            self._background = None
+        if num_laps > ax.get_xlim()[1]:
+            # Grow the axis geometrically so full redraws stay rare
+            ax.set_xlim(0.5, max(num_laps, 2 * ax.get_xlim()[1]) + 0.5)
+            self._background = None
+        if self._background is None:
+            self._live_settled = min(settled_laps, num_laps)
+            self.canvas.draw()
+            return
+        if settled_laps > self._live_settled:
+            self._bake(min(settled_laps, num_laps))
+        self._draw_tail()
+        self.canvas.blit(ax.bbox)
+
+    def _line_data(self, start, stop):
+        # Include the lap before `start` so baked and tail segments join up
+        start = max(start - 1, 0)
+        laps = np.arange(start + 1, stop + 1)
+        segment = self._live_positions[:, start:stop]
+        return laps, np.where(segment > 0, segment, np.nan)
+
+    def _bake(self, settled):
+        """Draw laps up to `settled` onto the cached background and recapture it."""
+        ax = self.figure.axes[0]
+        laps, positions = self._line_data(self._live_settled, settled)
+        self.canvas.restore_region(self._background)
+        for line, row in zip(self._live_lines, positions):
+            line.set_data(laps, row)
+            ax.draw_artist(line)
+        self._background = self.canvas.copy_from_bbox(ax.bbox)
+        self._live_settled = settled
+
+    def _draw_tail(self):
+        ax = self.figure.axes[0]
+        laps, positions = self._line_data(self._live_settled, self._live_positions.shape[1])
+        self.canvas.restore_region(self._background)
+        for line, row in zip(self._live_lines, positions):
+            line.set_data(laps, row)
+            ax.draw_artist(line)
+
+    def _on_canvas_draw(self, event):
+        # A full draw (first show, resize, axis change) wipes the animated lines:
+        # redraw the settled laps into a fresh background, then the tail.
+        if not self.live or not self.figure.axes:
+            return
+        ax = self.figure.axes[0]
+        self._background = self.canvas.copy_from_bbox(ax.bbox)
+        if self._live_positions is None:
+            return
+        settled = self._live_settled
+        self._live_settled = 0
+        if settled:
+            self._bake(settled)
+        self._draw_tail()
+
+    # --- SessionModel hooks ---
+    #
+    # Hooks only record what changed; the table and plot are redrawn from
+    # flush_updates at the update scheduler's rate, and not at all while the
+    # panel is hidden.
+
+    def on_session_reset(self):
+        self._reset_pending = True
+        self._dirty_from = None
+        self._charted_laps = 0
+        self.schedule_update()
+
+    def on_lap_appended(self, row, lap, lap_time):
+        # Only columns from the earliest changed lap onward are recomputed and re-filled
+        from_lap = min(lap - 1, self._charted_laps)
+        self._dirty_from = from_lap if self._dirty_from is None else min(self._dirty_from, from_lap)
+        self.schedule_update()
+
+    def flush_updates(self):
+        model = self.session_model
+        if model is None:
+            return
+        if self._reset_pending:
+            self._reset_pending = False
+            self._dirty_from = None
+            self._show_model_session()
+            return
+        if self._dirty_from is None:
+            return
+        from_lap, self._dirty_from = self._dirty_from, None
+        chart = model.lap_chart()
+        self._fill_table(self._model_names, chart, from_lap)
+        if self.live:
+            self.update_live(chart.positions, self._settled_laps(), from_lap)
+        else:
+            self._plot(self._model_names, chart.positions)
+        self._charted_laps = chart.num_laps
+
+    def _show_model_session(self):
+        model = self.session_model
+        self._model_names = [entry['driver'].get('name', 'N/A') for entry in model.entries]
+        chart = model.lap_chart()
+        if any(entry['status'] == 'active' for entry in model.entries):
+            self._fill_table(self._model_names, chart)
+            self.start_live(self._model_names, model.track.get('laps'))
+            self.update_live(chart.positions, self._settled_laps())
+        else:
+            self.stop_live()
+            self.show_chart(self._model_names, chart)
+        self._charted_laps = chart.num_laps
+
+    def _settled_laps(self):
+        model = self.session_model
+        running = [row for row, entry in enumerate(model.entries) if entry['status'] == 'active']
+        if not running:
+            return model.lap_count()
+        return int(model.lap_counts[running].min())
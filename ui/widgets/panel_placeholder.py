@@ -0,0 +1,77 @@
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSplitter
+from PySide6.QtCore import Qt, QTimer
+import logging
+
+from ui.widgets.registry import PANEL_REGISTRY, shared_session_model
+
+logger = logging.getLogger("PanelPlaceholder")
+
+
+class PanelPlaceholder(QWidget):
+    """
+    PanelPlaceholder stands in for a panel of a restored view until it is
+    first shown. It holds only the panel's registry name and saved state
+    (and, for a hibernated live panel, the SessionModel it followed);
+    on the first show it constructs the real panel, swaps it into its
+    splitter slot (keeping the slot's size) and deletes itself. Panels on
+    tabs or splitter areas that are never shown are never built.
+    """
+    def __init__(self, panel_name, state=None, session_model=None):
+        super().__init__()
+        self.panel_name = panel_name
+        self.state = state or {}
+        self.session_model = session_model
+        self.edit_mode = False
+        self.panel = None
+        self._pending = False
+        layout = QVBoxLayout(self)
+        self.label = QLabel(f"Loading {panel_name}...")
+        self.label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.label)
+
+    def set_edit_mode(self, value: bool):
+        self.edit_mode = value
+
+    def save_state(self):
+        return self.state
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._pending and self.panel is None:
+            # Build after this event so the restored layout paints first
+            self._pending = True
+            QTimer.singleShot(0, self._materialize_if_visible)
+
+    def _materialize_if_visible(self):
+        self._pending = False
+        # The tab may have been switched away again before the timer fired
+        if self.isVisible():
+            self.materialize()
+
+    def materialize(self):
+        """Construct the real panel now and put it in this placeholder's place. Returns the panel."""
+        if self.panel is not None:
+            return self.panel
+        spec = PANEL_REGISTRY.get(self.panel_name)
+        if spec is None:
+            self.label.setText(f"Unknown panel type: {self.panel_name}")
+            return None
+        splitter = self.parentWidget()
+        if not isinstance(splitter, QSplitter):
+            return None
+        logger.info(f"Constructing deferred panel {self.panel_name}")
+        # A hibernated panel returns to the model it followed; a restored one joins the window's
+        panel = spec.create(self.session_model or shared_session_model(splitter))
+        if self.state and hasattr(panel, "restore_state"):
+            panel.restore_state(self.state)
+        if hasattr(panel, "set_edit_mode"):
+            panel.set_edit_mode(self.edit_mode)
+        splitter.replaceWidget(splitter.indexOf(self), panel)
+        # The DividerContainer that lists this placeholder now lists the panel
+        owner = splitter.parentWidget()
+        children = getattr(owner, "children_widgets", None)
+        if children is not None and self in children:
+            children[children.index(self)] = panel
+        self.panel = panel
+        self.deleteLater()
+        return panel
@@ -1,14 +1,78 @@
 # Panel registry for dynamic UI addition
-# Add new panels here to make them available in the UI
-from .doc_viewer_panel import DocViewerPanel
-from .session_summary_panel import SessionSummaryPanel
-from .lap_chart_panel import LapChartPanel
-from .test_panel import TestPanel
+# Add new panels here to make them available in the UI.
+#
+# Entries name the module and class rather than importing them, so heavy
+# dependencies (matplotlib, markdown) load only when a panel is first added.
+import importlib
+import logging
+
+logger = logging.getLogger("PanelRegistry")
+
+
+class PanelSpec:
+    """
+    PanelSpec describes a registered panel by module path and class name.
+    Calling the spec creates a panel, importing its module on first use, so
+    it can be passed wherever a panel class is expected.
+
+    Panels registered with `follows_session` show the window's shared
+    SessionModel; create them with create(session_model) to subscribe them.
+    """
+    def __init__(self, module, class_name, description="", follows_session=False):
+        self.module = module
+        self.class_name = class_name
+        self.__name__ = class_name
+        self.description = description
+        self.follows_session = follows_session
+        self._cls = None
+
+    @property
+    def loaded(self):
+        return self._cls is not None
+
+    def load(self):
+        """The panel class, importing its module if needed."""
+        if self._cls is None:
+            logger.info(f"Importing panel module {self.module}")
+            self._cls = getattr(importlib.import_module(self.module), self.class_name)
+        return self._cls
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def create(self, session_model=None):
+        """A new panel, subscribed to `session_model` if this panel follows the session."""
+        panel = self()
+        if self.follows_session and session_model is not None:
+            panel.set_session_model(session_model)
+        return panel
+
+    def __repr__(self):
+        return f"PanelSpec({self.module!r}, {self.class_name!r})"
+
 
 PANEL_REGISTRY = {
-    "Documentation Viewer": DocViewerPanel,
-    "Session Summary": SessionSummaryPanel,
-    "Lap Chart": LapChartPanel,
-    "Test Panel": TestPanel,
+    "Documentation Viewer": PanelSpec("ui.widgets.doc_viewer_panel", "DocViewerPanel",
+                                      "Rendered user guide"),
+    "Session Summary": PanelSpec("ui.widgets.session_summary_panel", "SessionSummaryPanel",
+                                 "Sortable results table", follows_session=True),
+    "Lap Chart": PanelSpec("ui.widgets.lap_chart_panel", "LapChartPanel",
+                           "Positions per lap, table and plot", follows_session=True),
+    "Test Panel": PanelSpec("ui.widgets.test_panel", "TestPanel",
+                            "Placeholder panel"),
     # Add more panels here as needed
 }
+
+
+def shared_session_model(widget):
+    """The SessionModel shared by the window containing `widget`, or None."""
+    return getattr(widget.window(), "session_model", None)
+
+
+def panel_name_for(panel):
+    """Registry name of a panel instance, or None if its class is not registered."""
+    cls = type(panel)
+    for name, spec in PANEL_REGISTRY.items():
+        if spec.class_name == cls.__name__ and spec.module == cls.__module__:
+            return name
+    return None
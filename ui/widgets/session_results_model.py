@@ -0,0 +1,199 @@
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+import numpy as np
+
+from analysis.session_stats import SessionStats
+from storage.columnar_session import lap_time_matrix
+
+COLUMNS = ["Pos", "Driver", "Car", "Laps", "Total Time", "Best Lap"]
+POS, DRIVER, CAR, LAPS, TOTAL_TIME, BEST_LAP = range(len(COLUMNS))
+RETIRED_STATUSES = ('retired', 'dnf')
+
+# Role returning the raw (numeric) value of a cell, used for sorting
+SORT_ROLE = Qt.UserRole
+
+
+class SessionResultsModel(QAbstractTableModel):
+    """
+    SessionResultsModel serves session results to a QTableView from per-column
+    arrays. Cells are formatted on demand, so only visible rows cost anything,
+    and live updates from a SessionModel emit dataChanged for the changed row
+    and columns only. With `deferred` set, changed cells are collected and
+    announced by flush_changes(), one dataChanged per run of adjacent rows.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.session_model = None
+        # When set, live changes are collected and announced by flush_changes()
+        self.deferred = False
+        self._dirty = {}  # row -> (first, last) changed column since the last flush
+        self._set_empty()
+
+    def _set_empty(self):
+        self._set_columns([], [], [], np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64),
+                          np.zeros(0), np.zeros(0))
+
+    def _set_columns(self, drivers, cars, statuses, positions, lap_counts, totals, best):
+        self.drivers = drivers
+        self.cars = cars
+        self.statuses = statuses
+        self.positions = positions
+        self.lap_counts = lap_counts
+        self.total_times = totals
+        self.best_laps = best
+
+    # --- Sources ---
+
+    def load_results(self, results, stats=None):
+        """
+        Show a finished session from the results JSON structure. Pass the
+        session's cached SessionStats as `stats` to avoid recomputing them.
+        """
+        self.set_session_model(None)
+        rows = results.get('results', [])
+        lap_counts = np.array([len(row.get('laps', [])) for row in rows], dtype=np.int64)
+        self.beginResetModel()
+        self._set_columns(
+            [row.get('driver', {}).get('name', 'N/A') for row in rows],
+            [row.get('car', {}).get('model', 'N/A') for row in rows],
+            ['finished'] * len(rows),
+            np.array([row.get('position', idx + 1) for idx, row in enumerate(rows)], dtype=np.int64),
+            lap_counts,
+            np.array([row.get('total_time', np.nan) for row in rows], dtype=np.float64),
+            (stats or SessionStats(lap_time_matrix(results))).best_lap.copy(),
+        )
+        self._dirty.clear()
+        self.endResetModel()
+
+    def clear(self):
+        """Drop all rows (and stop following a SessionModel)."""
+        self.set_session_model(None)
+        self.beginResetModel()
+        self._set_empty()
+        self._dirty.clear()
+        self.endResetModel()
+
+    def set_session_model(self, model):
+        """Follow a live SessionModel (or stop following with None)."""
+        if self.session_model is not None:
+            self.session_model.session_reset.disconnect(self._on_session_reset)
+            self.session_model.lap_appended.disconnect(self._on_lap_appended)
+            self.session_model.position_changed.disconnect(self._on_position_changed)
+            self.session_model.entry_status_changed.disconnect(self._on_entry_status_changed)
+        self.session_model = model
+        if model is not None:
+            model.session_reset.connect(self._on_session_reset)
+            model.lap_appended.connect(self._on_lap_appended)
+            model.position_changed.connect(self._on_position_changed)
+            model.entry_status_changed.connect(self._on_entry_status_changed)
+            self._on_session_reset()
+
+    def _on_session_reset(self):
+        model = self.session_model
+        self.beginResetModel()
+        self._set_columns(
+            [entry['driver'].get('name', 'N/A') for entry in model.entries],
+            [entry['car'].get('model', 'N/A') for entry in model.entries],
+            [entry['status'] for entry in model.entries],
+            model.positions.copy(),
+            model.lap_counts.copy(),
+            model.total_times.copy(),
+            model.stats().best_lap.copy(),
+        )
+        self._dirty.clear()
+        self.endResetModel()
+
+    def _on_lap_appended(self, row, lap, lap_time):
+        self.lap_counts[row] = lap
+        self.total_times[row] = self.session_model.total_times[row]
+        if not lap_time >= self.best_laps[row]:
+            self.best_laps[row] = lap_time
+        self._row_changed(row, LAPS, BEST_LAP)
+
+    def _on_position_changed(self, row, old_position, new_position):
+        self.positions[row] = new_position
+        self._row_changed(row, POS, POS)
+
+    def _on_entry_status_changed(self, row, status):
+        self.statuses[row] = status
+        self._row_changed(row, POS, POS)
+
+    def _row_changed(self, row, first_column, last_column):
+        if not self.deferred:
+            self.dataChanged.emit(self.index(row, first_column), self.index(row, last_column))
+            return
+        if row in self._dirty:
+            first, last = self._dirty[row]
+            first_column, last_column = min(first, first_column), max(last, last_column)
+        self._dirty[row] = (first_column, last_column)
+
+    def flush_changes(self):
+        """
+        Announce the cells changed since the last flush: one dataChanged per
+        run of adjacent dirty rows, spanning the columns changed in that run.
+        """
+        if not self._dirty:
+            return
+        dirty = self._dirty
+        self._dirty = {}
+        rows = sorted(dirty)
+        start = 0
+        for end in range(1, len(rows) + 1):
+            if end < len(rows) and rows[end] == rows[end - 1] + 1:
+                continue
+            run = rows[start:end]
+            first = min(dirty[row][0] for row in run)
+            last = max(dirty[row][1] for row in run)
+            self.dataChanged.emit(self.index(run[0], first), self.index(run[-1], last))
+            start = end
+
+    # --- QAbstractTableModel ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.drivers)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == SORT_ROLE:
+            return self._raw_value(row, column)
+        if role == Qt.DisplayRole:
+            return self._display_value(row, column)
+        if role == Qt.TextAlignmentRole and column not in (DRIVER, CAR):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def _raw_value(self, row, column):
+        if column == POS:
+            # Retired entries sort after every classified position
+            return float('inf') if self.statuses[row] in RETIRED_STATUSES else float(self.positions[row])
+        if column == DRIVER:
+            return self.drivers[row]
+        if column == CAR:
+            return self.cars[row]
+        if column == LAPS:
+            return int(self.lap_counts[row])
+        value = self.total_times[row] if column == TOTAL_TIME else self.best_laps[row]
+        return float('inf') if np.isnan(value) else float(value)
+
+    def _display_value(self, row, column):
+        if column == POS:
+            return "DNF" if self.statuses[row] in RETIRED_STATUSES else str(self.positions[row])
+        if column == DRIVER:
+            return self.drivers[row]
+        if column == CAR:
+            return self.cars[row]
+        if column == LAPS:
+            return str(self.lap_counts[row])
+        value = self.total_times[row] if column == TOTAL_TIME else self.best_laps[row]
+        if np.isnan(value) or (column == TOTAL_TIME and not self.lap_counts[row]):
+            return 'N/A'
+        return f"{value:.3f}"
@@ -1,7 +1,7 @@
-from PySide6.QtWidgets import QLabel, QTableWidget, QTableWidgetItem, QHeaderView
+from PySide6.QtWidgets import QLabel, QTableView, QLineEdit, QAbstractItemView
+from PySide6.QtCore import QSortFilterProxyModel, Qt
 from .base_panel import BasePanel
-import os
-import json
+from .session_results_model import SessionResultsModel, SORT_ROLE, DRIVER
 
 class SessionSummaryPanel(BasePanel):
     def __init__(self, parent=None):
@@ -9,47 +9,80 @@ class SessionSummaryPanel(BasePanel):
         self.set_title("Session Summary")
         self.info_label = QLabel("Session info will appear here.")
         self.content_layout.addWidget(self.info_label)
-        self.table = QTableWidget()
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter drivers...")
+        self.content_layout.addWidget(self.filter_edit)
+        # Results are served by a model; the view only formats visible rows
+        self.results_model = SessionResultsModel(self)
+        # Live row changes reach the view at the update scheduler's rate
+        self.results_model.deferred = True
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.results_model)
+        self.proxy_model.setSortRole(SORT_ROLE)
+        self.proxy_model.setFilterKeyColumn(DRIVER)
+        self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.proxy_model.setDynamicSortFilter(True)
+        self.filter_edit.textChanged.connect(self.proxy_model.setFilterFixedString)
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(0, Qt.AscendingOrder)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
         self.content_layout.addWidget(self.table)
         self.load_sample_session()
 
     def load_sample_session(self):
-        # Load the latest session result file for demo
-        session_path = os.path.join(
-            os.path.dirname(__file__),
-            '../../data/sessions/20250702_181847_simple_oval_results.json'
-        )
-        session_path = os.path.abspath(session_path)
-        if not os.path.exists(session_path):
+        self.load_session_async(self._prepare_session, self._show_session, derived=("stats",))
+
+    def _prepare_session(self, path):
+        # May run on a pool thread: only touches the session store, never widgets
+        data = self.load_session(path)
+        if data is None:
+            return None
+        return data, self.load_session_stats(path)
+
+    def _show_session(self, prepared):
+        if self.session_model is not None:
+            return  # A live session took over while the file was loading
+        if prepared is None:
             self.info_label.setText("No session data found.")
             return
-        with open(session_path, 'r') as f:
-            data = json.load(f)
-        self.update_summary(data)
-
-    def update_summary(self, session_data):
-        # Session info
-        track = session_data.get('track', {})
-        laps = track.get('laps', 'N/A')
-        name = track.get('name', 'N/A')
-        self.info_label.setText(f"<b>{name}</b> &mdash; Laps: {laps}")
-        # Results table
-        results = session_data.get('results', [])
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "Pos", "Driver", "Car", "Laps", "Total Time", "Best Lap"
-        ])
-        self.table.setRowCount(len(results))
-        for row, result in enumerate(results):
-            driver = result.get('driver', 'N/A')
-            car = result.get('car', 'N/A')
-            laps = result.get('laps', 0)
-            total_time = result.get('total_time', 'N/A')
-            best_lap = result.get('best_lap', 'N/A')
-            self.table.setItem(row, 0, QTableWidgetItem(str(result['position'])))
-            self.table.setItem(row, 1, QTableWidgetItem(driver))
-            self.table.setItem(row, 2, QTableWidgetItem(car))
-            self.table.setItem(row, 3, QTableWidgetItem(str(laps)))
-            self.table.setItem(row, 4, QTableWidgetItem(total_time))
-            self.table.setItem(row, 5, QTableWidgetItem(best_lap))
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.update_summary(*prepared)
+
+    def save_state(self):
+        return {"filter": self.filter_edit.text()} if self.filter_edit.text() else {}
+
+    def restore_state(self, state):
+        self.filter_edit.setText(state.get("filter", ""))
+
+    def cleanup(self):
+        super().cleanup()
+        self.results_model.clear()
+
+    def update_summary(self, session_data, stats=None):
+        self._set_track_info(session_data.get('track', {}))
+        self.results_model.load_results(session_data, stats)
+
+    def set_session_model(self, model):
+        # Row-level updates are applied by the results model itself
+        super().set_session_model(model)
+        self.results_model.set_session_model(model)
+
+    def on_session_reset(self):
+        self._set_track_info(self.session_model.track)
+
+    def on_lap_appended(self, row, lap, lap_time):
+        self.schedule_update()
+
+    def on_position_changed(self, row, old_position, new_position):
+        self.schedule_update()
+
+    def on_entry_status_changed(self, row, status):
+        self.schedule_update()
+
+    def flush_updates(self):
+        self.results_model.flush_changes()
+
+    def _set_track_info(self, track):
+        self.info_label.setText(f"<b>{track.get('name', 'N/A')}</b> &mdash; Laps: {track.get('laps', 'N/A')}")